@@ -89,6 +89,18 @@ def unit(session: Session):
     )
 
 
+@nox.session(venv_backend=TEST_VENV_BACKEND, python=UNIT_TEST_PYTHON_VERSIONS)
+def benchmark(session: Session):
+    """Run benchmarks."""
+    install_test_dependencies(session=session)
+    session.run(
+        "pytest",
+        "-s",
+        os.path.join("tests", "benchmark"),
+        *session.posargs,
+    )
+
+
 @nox.session
 def lint(session: Session):
     """Enforce code style with flake8."""
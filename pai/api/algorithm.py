@@ -144,3 +144,10 @@ class AlgorithmAPI(WorkspaceScopedResourceAPI):
                     return item
 
             page_number += 1
+
+    async def get_async(self, algorithm_id):
+        """Async version of :meth:`get`."""
+        resp = await self._do_request_async(
+            method_=self._get_method, algorithm_id=algorithm_id
+        )
+        return resp.to_map()
@@ -13,40 +13,51 @@
 #  limitations under the License.
 
 
-from alibabacloud_credentials.client import Client as CredentialClient
-from alibabacloud_sts20150401.client import Client as StsClient
+import importlib
+import typing
 
-from .algorithm import AlgorithmAPI
 from .base import PAIRestResourceTypes, ServiceName, WorkspaceScopedResourceAPI
 from .client_factory import ClientFactory
-from .code_source import CodeSourceAPI
-from .dataset import DatasetAPI
-from .image import ImageAPI
-from .job import JobAPI
-from .model import ModelAPI
-from .pipeline import PipelineAPI
-from .pipeline_run import PipelineRunAPI
-from .service import ServiceAPI
-from .tensorboard import TensorBoardAPI
-from .training_job import TrainingJobAPI
-from .workspace import WorkspaceAPI
 
+if typing.TYPE_CHECKING:
+    from alibabacloud_sts20150401.client import Client as StsClient
+
+    from .algorithm import AlgorithmAPI
+    from .code_source import CodeSourceAPI
+    from .dataset import DatasetAPI
+    from .image import ImageAPI
+    from .job import JobAPI
+    from .model import ModelAPI
+    from .pipeline import PipelineAPI
+    from .pipeline_run import PipelineRunAPI
+    from .service import ServiceAPI
+    from .tensorboard import TensorBoardAPI
+    from .training_job import TrainingJobAPI
+    from .workspace import WorkspaceAPI
+
+# Mapping from the resource type to the module and the class name of the API. The
+# API modules import the generated models, they are imported on first use.
 _RESOURCE_API_MAPPING = {
-    PAIRestResourceTypes.DlcJob: JobAPI,
-    PAIRestResourceTypes.CodeSource: CodeSourceAPI,
-    PAIRestResourceTypes.Dataset: DatasetAPI,
-    PAIRestResourceTypes.Image: ImageAPI,
-    PAIRestResourceTypes.Service: ServiceAPI,
-    PAIRestResourceTypes.Model: ModelAPI,
-    PAIRestResourceTypes.Workspace: WorkspaceAPI,
-    PAIRestResourceTypes.Algorithm: AlgorithmAPI,
-    PAIRestResourceTypes.TrainingJob: TrainingJobAPI,
-    PAIRestResourceTypes.Pipeline: PipelineAPI,
-    PAIRestResourceTypes.PipelineRun: PipelineRunAPI,
-    PAIRestResourceTypes.TensorBoard: TensorBoardAPI,
+    PAIRestResourceTypes.DlcJob: (".job", "JobAPI"),
+    PAIRestResourceTypes.CodeSource: (".code_source", "CodeSourceAPI"),
+    PAIRestResourceTypes.Dataset: (".dataset", "DatasetAPI"),
+    PAIRestResourceTypes.Image: (".image", "ImageAPI"),
+    PAIRestResourceTypes.Service: (".service", "ServiceAPI"),
+    PAIRestResourceTypes.Model: (".model", "ModelAPI"),
+    PAIRestResourceTypes.Workspace: (".workspace", "WorkspaceAPI"),
+    PAIRestResourceTypes.Algorithm: (".algorithm", "AlgorithmAPI"),
+    PAIRestResourceTypes.TrainingJob: (".training_job", "TrainingJobAPI"),
+    PAIRestResourceTypes.Pipeline: (".pipeline", "PipelineAPI"),
+    PAIRestResourceTypes.PipelineRun: (".pipeline_run", "PipelineRunAPI"),
+    PAIRestResourceTypes.TensorBoard: (".tensorboard", "TensorBoardAPI"),
 }
 
 
+def _get_api_class(resource_type):
+    module_name, class_name = _RESOURCE_API_MAPPING[resource_type]
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
 class ResourceAPIsContainerMixin(object):
     """ResourceAPIsContainerMixin provides Resource Operation APIs."""
 
@@ -55,15 +66,19 @@ class ResourceAPIsContainerMixin(object):
     _region_id = None
     _workspace_id = None
 
-    def __init__(self, header=None, runtime=None):
+    def __init__(self, header=None, runtime=None, api_cache_ttl=None):
         self.header = header
         self.runtime = runtime
+        # Mapping from the resource type to the TTL of the cached API results.
+        self.api_cache_ttl = api_cache_ttl or dict()
         self.api_container = dict()
         self.acs_client_container = dict()
 
     def _acs_credential_client(self):
         if self._credential_client:
             return self._credential_client
+        from alibabacloud_credentials.client import Client as CredentialClient
+
         self._credential_client = CredentialClient(config=self._credential_config)
         return self._credential_client
 
@@ -99,86 +114,90 @@ class ResourceAPIsContainerMixin(object):
         return self._get_acs_client(ServiceName.PAI_STUDIO)
 
     @property
-    def _acs_sts_client(self) -> StsClient:
+    def _acs_sts_client(self) -> "StsClient":
         return self._get_acs_client(ServiceName.STS)
 
     def get_api_by_resource(self, resource_type):
         if resource_type in self.api_container:
             return self.api_container[resource_type]
 
-        api_cls = _RESOURCE_API_MAPPING[resource_type]
+        api_cls = _get_api_class(resource_type)
         acs_client = self._get_acs_client(api_cls.BACKEND_SERVICE_NAME)
+        cache_ttl = self.api_cache_ttl.get(resource_type)
         if issubclass(api_cls, WorkspaceScopedResourceAPI):
             api = api_cls(
                 workspace_id=self._workspace_id,
                 acs_client=acs_client,
                 header=self.header,
                 runtime=self.runtime,
+                cache_ttl=cache_ttl,
             )
-        elif api_cls == ServiceAPI:
+        elif resource_type == PAIRestResourceTypes.Service:
             # for PAI-EAS service api, we need to pass region_id.
             api = api_cls(
                 acs_client=acs_client,
                 region_id=self._region_id,
                 header=self.header,
                 runtime=self.runtime,
+                cache_ttl=cache_ttl,
             )
         else:
             api = api_cls(
                 acs_client=acs_client,
                 header=self.header,
                 runtime=self.runtime,
+                cache_ttl=cache_ttl,
             )
         self.api_container[resource_type] = api
         return api
 
     @property
-    def job_api(self) -> JobAPI:
+    def job_api(self) -> "JobAPI":
         """Returns JobAPI for job operation."""
         return self.get_api_by_resource(PAIRestResourceTypes.DlcJob)
 
     @property
-    def tensorboard_api(self) -> TensorBoardAPI:
+    def tensorboard_api(self) -> "TensorBoardAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.TensorBoard)
 
     @property
-    def code_source_api(self) -> CodeSourceAPI:
+    def code_source_api(self) -> "CodeSourceAPI":
         """Return CodeSource API for code_source operation"""
         return self.get_api_by_resource(PAIRestResourceTypes.CodeSource)
 
     @property
-    def dataset_api(self) -> DatasetAPI:
+    def dataset_api(self) -> "DatasetAPI":
         """Return Dataset API for dataset operation"""
         return self.get_api_by_resource(PAIRestResourceTypes.Dataset)
 
     @property
-    def image_api(self) -> ImageAPI:
+    def image_api(self) -> "ImageAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Image)
 
     @property
-    def model_api(self) -> ModelAPI:
+    def model_api(self) -> "ModelAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Model)
 
     @property
-    def service_api(self) -> ServiceAPI:
+    def service_api(self) -> "ServiceAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Service)
 
     @property
-    def workspace_api(self) -> WorkspaceAPI:
+    def workspace_api(self) -> "WorkspaceAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Workspace)
 
     @property
-    def algorithm_api(self) -> AlgorithmAPI:
+    def algorithm_api(self) -> "AlgorithmAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Algorithm)
 
     @property
-    def training_job_api(self) -> TrainingJobAPI:
+    def training_job_api(self) -> "TrainingJobAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.TrainingJob)
 
     @property
-    def pipeline_api(self) -> PipelineAPI:
+    def pipeline_api(self) -> "PipelineAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.Pipeline)
 
     @property
-    def pipeline_run_api(self) -> PipelineRunAPI:
+    def pipeline_run_api(self) -> "PipelineRunAPI":
         return self.get_api_by_resource(PAIRestResourceTypes.PipelineRun)
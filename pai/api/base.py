@@ -12,16 +12,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
+import functools
+import inspect
 import logging
+import threading
+import time
 from abc import ABCMeta
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import six
-from alibabacloud_tea_openapi.client import Client
 from alibabacloud_tea_util.models import RuntimeOptions
 from six import with_metaclass
 from Tea.model import TeaModel
 
+if TYPE_CHECKING:
+    from alibabacloud_tea_openapi.client import Client
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,6 +71,131 @@ class PAIRestResourceTypes(object):
     TensorBoard = "TensorBoard"
 
 
+class _TTLCache(object):
+    """A thread-safe cache whose entries expire after the TTL.
+
+    Concurrent loads of the same key are coalesced, only the first caller does the
+    load, and the others wait for its result. Failed loads are not cached. The
+    expired entries are swept on the stores, at most once per TTL.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = dict()
+        self._inflight: Dict[Hashable, Future] = dict()
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + ttl
+
+    def _sweep(self, now: float) -> None:
+        """Remove the expired entries, the caller holds the lock."""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.ttl
+        for key in [k for k, v in self._entries.items() if v[0] <= now]:
+            del self._entries[key]
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            future = self._inflight.get(key)
+            is_loader = future is None
+            if is_loader:
+                future = self._inflight[key] = Future()
+
+        if not is_loader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            # The entry is invalidated while loading if it's not in-flight anymore.
+            if self._inflight.pop(key, None) is future:
+                now = time.monotonic()
+                self._sweep(now)
+                self._entries[key] = (now + self.ttl, value)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, resource_id: Optional[Hashable] = None) -> None:
+        """Remove the entries of the given resource, or all the entries if
+        resource_id is not provided."""
+        with self._lock:
+            if resource_id is None:
+                self._entries.clear()
+                self._inflight.clear()
+                return
+            for d in (self._entries, self._inflight):
+                for key in [k for k in d if resource_id in k[1]]:
+                    del d[key]
+
+
+def _bind_arguments(sig: inspect.Signature, args, kwargs) -> Tuple[Any, ...]:
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments.values())[1:]
+
+
+def cached_request(func):
+    """Decorator that caches the result of a read method of ResourceAPI.
+
+    The cache is enabled if the ResourceAPI is initialized with a cache_ttl, and
+    the result is keyed by the method name and the arguments. A copy of the cached
+    result is returned, so that the caller is free to modify it.
+    """
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._cache is None:
+            return func(self, *args, **kwargs)
+        key = (func.__name__, _bind_arguments(sig, (self,) + args, kwargs))
+        result = self._cache.get_or_load(key, lambda: func(self, *args, **kwargs))
+        return copy.deepcopy(result)
+
+    return wrapper
+
+
+def invalidates_cache(func):
+    """Decorator for the mutating method of ResourceAPI, the cached results of the
+    resource are invalidated once the method returns.
+
+    The first argument of the decorated method is the ID of the resource.
+    """
+    sig = inspect.signature(func)
+
+    def _invalidate(self, args, kwargs):
+        if self._cache is not None:
+            arguments = _bind_arguments(sig, (self,) + args, kwargs)
+            self._cache.invalidate(arguments[0] if arguments else None)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                _invalidate(self, args, kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                _invalidate(self, args, kwargs)
+
+    return wrapper
+
+
 class ResourceAPI(with_metaclass(ABCMeta, object)):
     """Class that provide APIs to operate the resource."""
 
@@ -60,9 +203,10 @@ class ResourceAPI(with_metaclass(ABCMeta, object)):
 
     def __init__(
         self,
-        acs_client: Client,
+        acs_client: "Client",
         header: Optional[Dict[str, str]] = None,
         runtime: Optional[RuntimeOptions] = None,
+        cache_ttl: Optional[float] = None,
     ):
         """Initialize a ResourceAPI object.
 
@@ -74,25 +218,49 @@ class ResourceAPI(with_metaclass(ABCMeta, object)):
             runtime (RuntimeOptions, optional): Options configured for the client
                 runtime behavior, such as read_timeout, connection_timeout, etc.
                 Defaults to None.
+            cache_ttl (float, optional): Seconds the results of the describe/get
+                requests are cached for. Cache is disabled if not provided.
         """
         self.acs_client = acs_client
         self.header = header
         self.runtime = runtime
+        self._cache = _TTLCache(cache_ttl) if cache_ttl else None
+
+    def invalidate_cache(self, resource_id: Optional[Hashable] = None) -> None:
+        """Invalidate the cached results of the resource, or all the cached results
+        if resource_id is not provided."""
+        if self._cache is not None:
+            self._cache.invalidate(resource_id)
 
     def _make_extra_request_options(self):
         """Returns headers and runtime for client."""
         return self.header or dict(), self.runtime or RuntimeOptions()
 
-    def _do_request(self, method_: str, *args, **kwargs):
+    def _prepare_request_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         headers, runtime = self._make_extra_request_options()
         if "headers" not in kwargs:
             kwargs["headers"] = headers
         if "runtime" not in kwargs:
             kwargs["runtime"] = runtime
+        return kwargs
+
+    def _do_request(self, method_: str, *args, **kwargs):
+        kwargs = self._prepare_request_kwargs(kwargs)
         request_method = getattr(self.acs_client, method_)
 
         return request_method(*args, **kwargs).body
 
+    async def _do_request_async(self, method_: str, *args, **kwargs):
+        """Do the request with the async variant of the client method.
+
+        The generated clients provide an awaitable ``<method>_async`` variant for
+        each of the API method, the request is sent without blocking the event loop.
+        """
+        kwargs = self._prepare_request_kwargs(kwargs)
+        request_method = getattr(self.acs_client, method_ + "_async")
+
+        return (await request_method(*args, **kwargs)).body
+
     def get_api_object_by_resource_id(self, resource_id):
         raise NotImplementedError
 
@@ -153,7 +321,7 @@ class WorkspaceScopedResourceAPI(with_metaclass(ABCMeta, ResourceAPI)):
         )
         self.workspace_id = workspace_id
 
-    def _do_request(self, method_, **kwargs):
+    def _inject_workspace_id(self, kwargs: Dict[str, Any]) -> None:
         request = kwargs.get(self.default_param_name_for_request)
 
         if not request:
@@ -176,8 +344,17 @@ class WorkspaceScopedResourceAPI(with_metaclass(ABCMeta, ResourceAPI)):
                 # request.workspace_id is 0 or request.workspace_id is empty string,
                 # we do not inject workspace_id of the scope.
                 request.workspace_id = None
+
+    def _do_request(self, method_, **kwargs):
+        self._inject_workspace_id(kwargs)
         return super(WorkspaceScopedResourceAPI, self)._do_request(method_, **kwargs)
 
+    async def _do_request_async(self, method_, **kwargs):
+        self._inject_workspace_id(kwargs)
+        return await super(WorkspaceScopedResourceAPI, self)._do_request_async(
+            method_, **kwargs
+        )
+
 
 class PaginatedResult(object):
     """A class represent response of a pagination call to PAI service."""
@@ -14,33 +14,30 @@
 
 from __future__ import absolute_import
 
+import importlib
 import logging
-
-from alibabacloud_credentials.client import Client as CredentialClient
-from alibabacloud_sts20150401.client import Client as StsClient
-from alibabacloud_tea_openapi.models import Config
+import typing
 
 from ..common.utils import http_user_agent
-from ..libs.alibabacloud_aiworkspace20210204.client import Client as WorkspaceClient
-from ..libs.alibabacloud_eas20210701.client import Client as EasClient
-from ..libs.alibabacloud_pai_dlc20201203.client import Client as DlcClient
-from ..libs.alibabacloud_paiflow20210202.client import Client as FlowClient
-from ..libs.alibabacloud_paistudio20220112.client import Client as PaiClient
 from .base import ServiceName
 
+if typing.TYPE_CHECKING:
+    from alibabacloud_credentials.client import Client as CredentialClient
+
 _logger = logging.getLogger(__name__)
 
 DEFAULT_SERVICE_ENDPOINT_PATTERN = "{}.{}.aliyuncs.com"
 
 
 class ClientFactory(object):
+    # Generated clients are imported on first use, they are expensive to import.
     ClientByServiceName = {
-        ServiceName.PAI_DLC: DlcClient,
-        ServiceName.PAI_EAS: EasClient,
-        ServiceName.PAI_WORKSPACE: WorkspaceClient,
-        ServiceName.PAIFLOW: FlowClient,
-        ServiceName.PAI_STUDIO: PaiClient,
-        ServiceName.STS: StsClient,
+        ServiceName.PAI_DLC: "pai.libs.alibabacloud_pai_dlc20201203.client",
+        ServiceName.PAI_EAS: "pai.libs.alibabacloud_eas20210701.client",
+        ServiceName.PAI_WORKSPACE: "pai.libs.alibabacloud_aiworkspace20210204.client",
+        ServiceName.PAIFLOW: "pai.libs.alibabacloud_paiflow20210202.client",
+        ServiceName.PAI_STUDIO: "pai.libs.alibabacloud_paistudio20220112.client",
+        ServiceName.STS: "alibabacloud_sts20150401.client",
     }
 
     @staticmethod
@@ -52,11 +49,13 @@ class ClientFactory(object):
         cls,
         service_name,
         region_id: str,
-        credential_client: CredentialClient,
+        credential_client: "CredentialClient",
         **kwargs,
     ):
         """Create an API client which is responsible to interacted with the Alibaba
         Cloud service."""
+        from alibabacloud_tea_openapi.models import Config
+
         config = Config(
             region_id=region_id,
             credential=credential_client,
@@ -68,7 +67,8 @@ class ClientFactory(object):
             user_agent=http_user_agent(),
             **kwargs,
         )
-        client = cls.ClientByServiceName.get(service_name)(config)
+        client_module = importlib.import_module(cls.ClientByServiceName[service_name])
+        client = client_module.Client(config)
         return client
 
     @classmethod
@@ -115,3 +115,8 @@ class CodeSourceAPI(WorkspaceScopedResourceAPI):
         resp = self._do_request(self._create_method, request=request)
 
         return resp.code_source_id
+
+    async def get_async(self, id: str) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        result = await self._do_request_async(self._get_method, code_source_id=id)
+        return result.to_map()
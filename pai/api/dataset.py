@@ -134,3 +134,8 @@ class DatasetAPI(WorkspaceScopedResourceAPI):
             options.update({"mountPath": mount_path})
 
         return json.dumps(options)
+
+    async def get_async(self, id: str) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        result = await self._do_request_async(self._get_method, dataset_id=id)
+        return result.to_map()
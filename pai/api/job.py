@@ -197,3 +197,52 @@ class JobAPI(WorkspaceScopedResourceAPI):
         result = self._do_request(method_=self._list_ecs_spec_method, request=request)
 
         return self.make_paginated_result(result, item_key="EcsSpecs")
+
+    async def get_async(self, id: str) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        resp = await self._do_request_async(method_=self._get_method, job_id=id)
+        return resp.to_map()
+
+    async def delete_async(self, id: str) -> None:
+        """Async version of :meth:`delete`."""
+        await self._do_request_async(method_=self._delete_method, job_id=id)
+
+    async def stop_async(self, id: str) -> None:
+        """Async version of :meth:`stop`."""
+        await self._do_request_async(method_=self._stop_method, job_id=id)
+
+    async def list_events_async(
+        self, id, start_time=None, end_time=None, max_events_num=2000
+    ):
+        """Async version of :meth:`list_events`."""
+        request = GetJobEventsRequest(
+            start_time=start_time, end_time=end_time, max_events_num=max_events_num
+        )
+        result: GetJobEventsResponseBody = await self._do_request_async(
+            method_=self._get_job_events_method, job_id=id, request=request
+        )
+        return result.events
+
+    async def list_logs_async(
+        self,
+        job_id,
+        pod_id,
+        end_time: datetime = None,
+        start_time: datetime = None,
+        max_lines: int = None,
+        pod_uid: str = None,
+    ) -> List[str]:
+        """Async version of :meth:`list_logs`."""
+        request = GetPodLogsRequest(
+            end_time=end_time,
+            max_lines=max_lines,
+            pod_uid=pod_uid,
+            start_time=start_time,
+        )
+        result: GetPodLogsResponseBody = await self._do_request_async(
+            method_=self._get_pod_logs_method,
+            job_id=job_id,
+            pod_id=pod_id,
+            request=request,
+        )
+        return result.logs
@@ -200,7 +200,12 @@ class ModelAPI(WorkspaceScopedResourceAPI):
         resp: ListModelVersionsResponseBody = self._do_request(
             self._list_model_version_method, model_id=model_id, request=request
         )
+        return self._make_versions_result(model_id, resp)
 
+    @classmethod
+    def _make_versions_result(
+        cls, model_id: str, resp: ListModelVersionsResponseBody
+    ) -> PaginatedResult:
         data = resp.to_map()
         for v in data["Versions"]:
             v.update(
@@ -208,7 +213,7 @@ class ModelAPI(WorkspaceScopedResourceAPI):
                     "ModelId": model_id,
                 }
             )
-        return self.make_paginated_result(data)
+        return cls.make_paginated_result(data)
 
     def get_version(self, model_id: str, version: str):
         resp = self._do_request(
@@ -254,3 +259,80 @@ class ModelAPI(WorkspaceScopedResourceAPI):
             model_id=model_id,
             version_name=version,
         )
+
+    # The async methods accept the same keyword arguments as their sync versions,
+    # which are the fields of the request model.
+
+    async def create_async(self, labels: Dict[str, str] = None, **kwargs) -> str:
+        """Async version of :meth:`create`."""
+        labels = [Label(key=k, value=v) for k, v in labels.items()] if labels else []
+        request = CreateModelRequest(labels=labels, **kwargs)
+        resp = await self._do_request_async(self._create_model_method, request=request)
+        return resp.model_id
+
+    async def list_async(self, **kwargs) -> PaginatedResult:
+        """Async version of :meth:`list`."""
+        request = ListModelsRequest(**kwargs)
+        resp: ListModelsResponseBody = await self._do_request_async(
+            self._list_model_method, request=request
+        )
+        return self.make_paginated_result(resp)
+
+    async def get_async(self, model_id: str):
+        """Async version of :meth:`get`."""
+        resp = await self._do_request_async(
+            method_=self._get_model_method, model_id=model_id
+        )
+        return resp.to_map()
+
+    async def delete_async(self, model_id: str):
+        """Async version of :meth:`delete`."""
+        await self._do_request_async(
+            method_=self._delete_model_method, model_id=model_id
+        )
+
+    async def create_version_async(
+        self, model_id: str, labels: Dict[str, str] = None, **kwargs
+    ):
+        """Async version of :meth:`create_version`."""
+        labels = [Label(key=k, value=v) for k, v in labels.items()] if labels else []
+        request = CreateModelVersionRequest(labels=labels, **kwargs)
+        response = await self._do_request_async(
+            self._create_model_version_method, model_id=model_id, request=request
+        )
+        return response.to_map()["VersionName"]
+
+    async def list_versions_async(self, model_id, **kwargs) -> PaginatedResult:
+        """Async version of :meth:`list_versions`."""
+        request = ListModelVersionsRequest(**kwargs)
+        resp: ListModelVersionsResponseBody = await self._do_request_async(
+            self._list_model_version_method, model_id=model_id, request=request
+        )
+        return self._make_versions_result(model_id, resp)
+
+    async def get_version_async(self, model_id: str, version: str):
+        """Async version of :meth:`get_version`."""
+        resp = await self._do_request_async(
+            self._get_model_version_method, model_id=model_id, version_name=version
+        )
+        obj = resp.to_map()
+        obj.update({"ModelId": model_id})
+        return obj
+
+    async def update_version_async(self, model_id: str, version: str, **kwargs):
+        """Async version of :meth:`update_version`."""
+        request = UpdateModelVersionRequest(**kwargs)
+        await self._do_request_async(
+            self._update_model_version_method,
+            model_id=model_id,
+            version_name=version,
+            request=request,
+        )
+
+    async def delete_version_async(self, model_id: str, version: str):
+        """Async version of :meth:`delete_version`."""
+        await self._do_request_async(
+            self._delete_model_version_method,
+            model_id=model_id,
+            version_name=version,
+        )
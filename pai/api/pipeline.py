@@ -112,3 +112,17 @@ class PipelineAPI(WorkspaceScopedResourceAPI):
         self._do_request(
             method_=self._update_method, pipeline_id=pipeline_id, request=request
         )
+
+    async def get_async(self, pipeline_id) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        resp: GetPipelineResponseBody = await self._do_request_async(
+            method_=self._get_method, pipeline_id=pipeline_id
+        )
+        return resp.to_map()
+
+    async def get_schema_async(self, pipeline_id):
+        """Async version of :meth:`get_schema`."""
+        resp: GetPipelineSchemaResponseBody = await self._do_request_async(
+            method_=self._get_schema_method, pipeline_id=pipeline_id
+        )
+        return resp.to_map()
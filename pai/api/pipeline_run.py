@@ -27,7 +27,12 @@ from ..libs.alibabacloud_paiflow20210202.models import (
     ListRunsResponseBody,
     UpdateRunRequest,
 )
-from .base import ServiceName, WorkspaceScopedResourceAPI
+from .base import (
+    ServiceName,
+    WorkspaceScopedResourceAPI,
+    cached_request,
+    invalidates_cache,
+)
 
 
 class PipelineRunAPI(WorkspaceScopedResourceAPI):
@@ -84,8 +89,9 @@ class PipelineRunAPI(WorkspaceScopedResourceAPI):
         )
         return resp.to_map()
 
-    def create(
-        self,
+    @classmethod
+    def _make_create_request(
+        cls,
         name,
         pipeline_id=None,
         manifest=None,
@@ -93,7 +99,7 @@ class PipelineRunAPI(WorkspaceScopedResourceAPI):
         env=None,
         no_confirm_required=False,
         source="SDK",
-    ):
+    ) -> CreateRunRequest:
         run_args = {"arguments": arguments, "env": env}
 
         if not pipeline_id and not manifest:
@@ -119,19 +125,44 @@ class PipelineRunAPI(WorkspaceScopedResourceAPI):
             no_confirm_required=no_confirm_required,
             source=source,
         )
+        return request
+
+    def create(
+        self,
+        name,
+        pipeline_id=None,
+        manifest=None,
+        arguments=None,
+        env=None,
+        no_confirm_required=False,
+        source="SDK",
+    ):
+        request = self._make_create_request(
+            name=name,
+            pipeline_id=pipeline_id,
+            manifest=manifest,
+            arguments=arguments,
+            env=env,
+            no_confirm_required=no_confirm_required,
+            source=source,
+        )
         resp = self._do_request(self._create_method, request=request)
         return resp.run_id
 
+    @invalidates_cache
     def start(self, run_id):
         self._do_request(self._start_method, run_id=run_id)
 
+    @invalidates_cache
     def terminate_run(self, run_id):
         self._do_request(self._terminate_method, run_id=run_id)
 
+    @invalidates_cache
     def update(self, run_id, name):
         request = UpdateRunRequest(name=name)
         self._do_request(self._update_method, run_id=run_id, request=request)
 
+    @cached_request
     def get_node(self, run_id, node_id, depth=2):
         request = GetNodeRequest(depth=depth)
         resp: GetNodeResponseBody = self._do_request(
@@ -199,3 +230,154 @@ class PipelineRunAPI(WorkspaceScopedResourceAPI):
             request=request,
         )
         return self.make_paginated_result(resp.to_map())
+
+    async def list_async(
+        self,
+        name=None,
+        run_id=None,
+        pipeline_id=None,
+        status=None,
+        sort_by=None,
+        order=None,
+        page_number=None,
+        page_size=None,
+        experiment_id=None,
+        source=None,
+        **kwargs,
+    ):
+        """Async version of :meth:`list`."""
+        request = ListRunsRequest(
+            page_number=page_number,
+            page_size=page_size,
+            experiment_id=experiment_id,
+            name=name,
+            pipeline_id=pipeline_id,
+            run_id=run_id,
+            sort_by=sort_by,
+            order=order,
+            source=source,
+            status=status,
+            **kwargs,
+        )
+        resp: ListRunsResponseBody = await self._do_request_async(
+            method_=self._list_method, request=request
+        )
+        return self.make_paginated_result(resp.to_map())
+
+    async def get_async(self, run_id):
+        """Async version of :meth:`get`."""
+        request = GetRunRequest()
+        resp: GetRunResponseBody = await self._do_request_async(
+            method_=self._get_method, run_id=run_id, request=request
+        )
+        return resp.to_map()
+
+    async def create_async(
+        self,
+        name,
+        pipeline_id=None,
+        manifest=None,
+        arguments=None,
+        env=None,
+        no_confirm_required=False,
+        source="SDK",
+    ):
+        """Async version of :meth:`create`."""
+        request = self._make_create_request(
+            name=name,
+            pipeline_id=pipeline_id,
+            manifest=manifest,
+            arguments=arguments,
+            env=env,
+            no_confirm_required=no_confirm_required,
+            source=source,
+        )
+        resp = await self._do_request_async(self._create_method, request=request)
+        return resp.run_id
+
+    @invalidates_cache
+    async def start_async(self, run_id):
+        """Async version of :meth:`start`."""
+        await self._do_request_async(self._start_method, run_id=run_id)
+
+    @invalidates_cache
+    async def terminate_run_async(self, run_id):
+        """Async version of :meth:`terminate_run`."""
+        await self._do_request_async(self._terminate_method, run_id=run_id)
+
+    @invalidates_cache
+    async def update_async(self, run_id, name):
+        """Async version of :meth:`update`."""
+        request = UpdateRunRequest(name=name)
+        await self._do_request_async(
+            self._update_method, run_id=run_id, request=request
+        )
+
+    async def get_node_async(self, run_id, node_id, depth=2):
+        """Async version of :meth:`get_node`."""
+        request = GetNodeRequest(depth=depth)
+        resp: GetNodeResponseBody = await self._do_request_async(
+            method_=self._get_node_method,
+            run_id=run_id,
+            node_id=node_id,
+            request=request,
+        )
+        return resp.to_map()
+
+    async def list_node_logs_async(
+        self,
+        run_id,
+        node_id,
+        from_time=None,
+        to_time=None,
+        keyword=None,
+        reverse=False,
+        page_offset=0,
+        page_size=100,
+    ):
+        """Async version of :meth:`list_node_logs`."""
+        request = ListNodeLogsRequest(
+            offset=page_offset,
+            page_size=page_size,
+            from_time_in_seconds=from_time,
+            to_time_in_seconds=to_time,
+            keyword=keyword,
+            reverse=reverse,
+        )
+        resp: ListNodeLogsResponseBody = await self._do_request_async(
+            self._list_node_logs_method,
+            run_id=run_id,
+            node_id=node_id,
+            request=request,
+        )
+        return self.make_paginated_result(resp.to_map())
+
+    async def list_node_outputs_async(
+        self,
+        run_id,
+        node_id,
+        depth=2,
+        name=None,
+        sort_by=None,
+        order=None,
+        type=None,
+        page_number=1,
+        page_size=50,
+    ):
+        """Async version of :meth:`list_node_outputs`."""
+        request = ListNodeOutputsRequest(
+            name=name,
+            depth=depth,
+            page_number=page_number,
+            page_size=page_size,
+            sort_by=sort_by,
+            order=order,
+            type=type,
+        )
+        resp: ListNodeOutputsResponseBody = await self._do_request_async(
+            self._list_node_outputs_method,
+            run_id=run_id,
+            node_id=node_id,
+            request=request,
+        )
+        return self.make_paginated_result(resp.to_map())
@@ -22,13 +22,21 @@ from ..libs.alibabacloud_eas20210701.models import (
     CreateServiceResponseBody,
     DescribeMachineSpecRequest,
     DescribeMachineSpecResponseBody,
+    ListServiceInstancesRequest,
+    ListServiceInstancesResponseBody,
     ListServicesRequest,
     ListServicesResponseBody,
     ReleaseServiceRequest,
     UpdateServiceRequest,
     UpdateServiceVersionRequest,
 )
-from .base import PaginatedResult, ResourceAPI, ServiceName
+from .base import (
+    PaginatedResult,
+    ResourceAPI,
+    ServiceName,
+    cached_request,
+    invalidates_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +57,7 @@ class ServiceAPI(ResourceAPI):
     _get_group_method = "describe_group_with_options"
     _list_groups_method = "list_group_with_options"
     _describe_machine_method = "describe_machine_spec_with_options"
+    _list_instances_method = "list_service_instances_with_options"
 
     def __init__(self, region_id, acs_client, **kwargs):
         super(ServiceAPI, self).__init__(acs_client=acs_client, **kwargs)
@@ -80,6 +89,7 @@ class ServiceAPI(ResourceAPI):
         )
         return resp.to_map()
 
+    @cached_request
     def get(self, name: str) -> Dict[str, Any]:
         return self.get_api_object_by_resource_id(resource_id=name)
 
@@ -97,6 +107,7 @@ class ServiceAPI(ResourceAPI):
         resp: CreateServiceResponseBody = self._do_request(self._create_method, request)
         return resp.service_name
 
+    @invalidates_cache
     def release(self, name, weight):
         request = ReleaseServiceRequest(weight=weight)
         self._do_request(
@@ -106,21 +117,25 @@ class ServiceAPI(ResourceAPI):
             request=request,
         )
 
+    @invalidates_cache
     def start(self, name):
         self._do_request(
             self._start_method, cluster_id=self.region_id, service_name=name
         )
 
+    @invalidates_cache
     def stop(self, name):
         self._do_request(
             self._stop_method, cluster_id=self.region_id, service_name=name
         )
 
+    @invalidates_cache
     def delete(self, name):
         self._do_request(
             self._delete_method, cluster_id=self.region_id, service_name=name
         )
 
+    @invalidates_cache
     def update(self, name, config: Union[str, typing.Dict]):
 
         if isinstance(config, str):
@@ -139,6 +154,7 @@ class ServiceAPI(ResourceAPI):
             request=request,
         )
 
+    @invalidates_cache
     def update_version(self, name, version):
         request = UpdateServiceVersionRequest(version=version)
         self._do_request(
@@ -148,6 +164,21 @@ class ServiceAPI(ResourceAPI):
             request=request,
         )
 
+    def list_instances(
+        self, name: str, page_number=None, page_size=None
+    ) -> PaginatedResult:
+        """List the instances of the service."""
+        request = ListServiceInstancesRequest(
+            page_number=page_number, page_size=page_size
+        )
+        resp: ListServiceInstancesResponseBody = self._do_request(
+            self._list_instances_method,
+            cluster_id=self.region_id,
+            service_name=name,
+            request=request,
+        )
+        return self.make_paginated_result(resp, item_key="Instances")
+
     def get_group(self, group_name) -> Dict[str, Any]:
         resp = self._do_request(
             self._get_group_method,
@@ -156,6 +187,7 @@ class ServiceAPI(ResourceAPI):
         )
         return resp.to_map()
 
+    @cached_request
     def describe_machine(self) -> Dict[str, Any]:
         """List the machine spec supported by PAI-EAS."""
         # DescribeMachineSpec API always returns all supported machine specs.
@@ -165,3 +197,122 @@ class ServiceAPI(ResourceAPI):
             request,
         )
         return resp.to_map()
+
+    async def list_async(
+        self, filter=None, order=None, page_number=None, page_size=None, sort=None
+    ) -> PaginatedResult:
+        """Async version of :meth:`list`."""
+        request = ListServicesRequest(
+            filter=filter,
+            order=order,
+            page_number=page_number,
+            page_size=page_size,
+            sort=sort,
+        )
+        resp: ListServicesResponseBody = await self._do_request_async(
+            self._list_method, request
+        )
+        return self.make_paginated_result(resp)
+
+    async def get_async(self, name: str) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        resp = await self._do_request_async(
+            self._get_method,
+            cluster_id=self.region_id,
+            service_name=name,
+        )
+        return resp.to_map()
+
+    async def create_async(
+        self, config: Union[str, typing.Dict], labels: Dict[str, str] = None
+    ) -> str:
+        """Async version of :meth:`create`."""
+        if isinstance(config, str):
+            config_obj = json.loads(config)
+        else:
+            config_obj = config
+
+        request = CreateServiceRequest(body=config_obj, labels=labels)
+        resp: CreateServiceResponseBody = await self._do_request_async(
+            self._create_method, request
+        )
+        return resp.service_name
+
+    @invalidates_cache
+    async def release_async(self, name, weight):
+        """Async version of :meth:`release`."""
+        request = ReleaseServiceRequest(weight=weight)
+        await self._do_request_async(
+            self._release_method,
+            cluster_id=self.region_id,
+            service_name=name,
+            request=request,
+        )
+
+    @invalidates_cache
+    async def start_async(self, name):
+        """Async version of :meth:`start`."""
+        await self._do_request_async(
+            self._start_method, cluster_id=self.region_id, service_name=name
+        )
+
+    @invalidates_cache
+    async def stop_async(self, name):
+        """Async version of :meth:`stop`."""
+        await self._do_request_async(
+            self._stop_method, cluster_id=self.region_id, service_name=name
+        )
+
+    @invalidates_cache
+    async def delete_async(self, name):
+        """Async version of :meth:`delete`."""
+        await self._do_request_async(
+            self._delete_method, cluster_id=self.region_id, service_name=name
+        )
+
+    @invalidates_cache
+    async def update_async(self, name, config: Union[str, typing.Dict]):
+        """Async version of :meth:`update`."""
+        if isinstance(config, str):
+            config_obj = json.loads(config)
+        else:
+            config_obj = config
+
+        request: UpdateServiceRequest = UpdateServiceRequest(
+            body=config_obj,
+        )
+        await self._do_request_async(
+            self._update_method,
+            cluster_id=self.region_id,
+            service_name=name,
+            request=request,
+        )
+
+    @invalidates_cache
+    async def update_version_async(self, name, version):
+        """Async version of :meth:`update_version`."""
+        request = UpdateServiceVersionRequest(version=version)
+        await self._do_request_async(
+            self._update_version_method,
+            cluster_id=self.region_id,
+            service_name=name,
+            request=request,
+        )
+
+    async def get_group_async(self, group_name) -> Dict[str, Any]:
+        """Async version of :meth:`get_group`."""
+        resp = await self._do_request_async(
+            self._get_group_method,
+            cluster_id=self.region_id,
+            group_name=group_name,
+        )
+        return resp.to_map()
+
+    async def describe_machine_async(self) -> Dict[str, Any]:
+        """Async version of :meth:`describe_machine`."""
+        request = DescribeMachineSpecRequest()
+        resp: DescribeMachineSpecResponseBody = await self._do_request_async(
+            self._describe_machine_method,
+            request,
+        )
+        return resp.to_map()
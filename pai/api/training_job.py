@@ -14,7 +14,12 @@
 
 from typing import Any, Dict, List, Optional
 
-from ..api.base import PaginatedResult, ServiceName, WorkspaceScopedResourceAPI
+from ..api.base import (
+    PaginatedResult,
+    ServiceName,
+    WorkspaceScopedResourceAPI,
+    cached_request,
+)
 from ..libs.alibabacloud_paistudio20220112.models import (
     AlgorithmSpec,
     CreateTrainingJobRequest,
@@ -77,10 +82,11 @@ class TrainingJobAPI(WorkspaceScopedResourceAPI):
         )
         return res.to_map()
 
+    @cached_request
     def get(self, training_job_id) -> Dict[str, Any]:
         return self.get_api_object_by_resource_id(training_job_id)
 
-    def create(
+    def _make_create_request(
         self,
         instance_type,
         instance_count,
@@ -96,8 +102,7 @@ class TrainingJobAPI(WorkspaceScopedResourceAPI):
         algorithm_provider: Optional[str] = None,
         algorithm_spec: Optional[Dict[str, Any]] = None,
         user_vpc_config: Optional[Dict[str, Any]] = None,
-    ) -> str:
-        """Create a TrainingJob."""
+    ) -> CreateTrainingJobRequest:
         if algorithm_spec and (
             algorithm_name or algorithm_version or algorithm_provider
         ):
@@ -158,7 +163,42 @@ class TrainingJobAPI(WorkspaceScopedResourceAPI):
             algorithm_spec=algo_spec,
             user_vpc=CreateTrainingJobRequestUserVpc().from_map(user_vpc_config),
         )
+        return request
 
+    def create(
+        self,
+        instance_type,
+        instance_count,
+        job_name,
+        hyperparameters: Optional[Dict[str, Any]] = None,
+        input_channels: Optional[List[Dict[str, Any]]] = None,
+        output_channels: Optional[List[Dict[str, Any]]] = None,
+        labels: Optional[Dict[str, str]] = None,
+        max_running_in_seconds: Optional[int] = None,
+        description: Optional[str] = None,
+        algorithm_name: Optional[str] = None,
+        algorithm_version: Optional[str] = None,
+        algorithm_provider: Optional[str] = None,
+        algorithm_spec: Optional[Dict[str, Any]] = None,
+        user_vpc_config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Create a TrainingJob."""
+        request = self._make_create_request(
+            instance_type=instance_type,
+            instance_count=instance_count,
+            job_name=job_name,
+            hyperparameters=hyperparameters,
+            input_channels=input_channels,
+            output_channels=output_channels,
+            labels=labels,
+            max_running_in_seconds=max_running_in_seconds,
+            description=description,
+            algorithm_name=algorithm_name,
+            algorithm_version=algorithm_version,
+            algorithm_provider=algorithm_provider,
+            algorithm_spec=algorithm_spec,
+            user_vpc_config=user_vpc_config,
+        )
         resp: CreateTrainingJobResponseBody = self._do_request(
             method_=self._create_method, request=request
         )
@@ -187,3 +227,68 @@ class TrainingJobAPI(WorkspaceScopedResourceAPI):
             request=request,
         )
         return self.make_paginated_result(resp)
+
+    async def list_async(
+        self,
+        page_size: int = 20,
+        page_number: int = 1,
+        order: str = None,
+        sort_by: str = None,
+        status: str = None,
+        training_job_name: str = None,
+    ) -> PaginatedResult:
+        """Async version of :meth:`list`."""
+        request = ListTrainingJobsRequest(
+            page_size=page_size,
+            page_number=page_number,
+            status=status,
+            training_job_name=training_job_name,
+            order=order,
+            sort_by=sort_by,
+        )
+        res = await self._do_request_async(
+            method_=self._list_method,
+            tmp_req=request,
+        )
+        return self.make_paginated_result(res)
+
+    async def get_async(self, training_job_id) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        res: GetTrainingJobResponseBody = await self._do_request_async(
+            method_=self._get_method,
+            training_job_id=training_job_id,
+            request=GetTrainingJobRequest(),
+        )
+        return res.to_map()
+
+    async def create_async(self, *args, **kwargs) -> str:
+        """Async version of :meth:`create`, accepts the same arguments."""
+        request = self._make_create_request(*args, **kwargs)
+        resp: CreateTrainingJobResponseBody = await self._do_request_async(
+            method_=self._create_method, request=request
+        )
+        return resp.training_job_id
+
+    async def list_logs_async(
+        self,
+        training_job_id,
+        worker_id=None,
+        page_size=10,
+        page_number=1,
+        start_time=None,
+        end_time=None,
+    ) -> PaginatedResult:
+        """Async version of :meth:`list_logs`."""
+        request = ListTrainingJobLogsRequest(
+            page_size=page_size,
+            page_number=page_number,
+            start_time=start_time,
+            end_time=end_time,
+            worker_id=worker_id,
+        )
+        resp: ListTrainingJobLogsResponseBody = await self._do_request_async(
+            method_=self._list_logs_method,
+            training_job_id=training_job_id,
+            request=request,
+        )
+        return self.make_paginated_result(resp)
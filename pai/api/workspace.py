@@ -39,7 +39,7 @@ from ..libs.alibabacloud_aiworkspace20210204.models import (
     UpdateConfigsRequest,
     UpdateConfigsRequestConfigs,
 )
-from .base import ResourceAPI, ServiceName
+from .base import ResourceAPI, ServiceName, cached_request, invalidates_cache
 
 if typing.TYPE_CHECKING:
     pass
@@ -99,6 +99,7 @@ class WorkspaceAPI(ResourceAPI):
 
         return [item.to_map() for item in res.workspaces]
 
+    @cached_request
     def get(self, workspace_id: str, verbose: bool = True) -> Dict[str, Any]:
         request = GetWorkspaceRequest(verbose=verbose)
 
@@ -244,6 +245,7 @@ class WorkspaceAPI(ResourceAPI):
         )
         return oss_storage_uri
 
+    @invalidates_cache
     def update_configs(self, workspace_id: str, configs: Union[Dict, List]):
         """Update configs used in the Workspace."""
         if isinstance(configs, Dict):
@@ -274,3 +276,15 @@ class WorkspaceAPI(ResourceAPI):
         )
 
         return res.to_map()
+
+    async def get_async(
+        self, workspace_id: str, verbose: bool = True
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`get`."""
+        request = GetWorkspaceRequest(verbose=verbose)
+        res: GetWorkspaceResponseBody = await self._do_request_async(
+            method_=self._get_method,
+            workspace_id=workspace_id,
+            request=request,
+        )
+        return res.to_map()
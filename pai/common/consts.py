@@ -19,6 +19,11 @@ DEFAULT_CONFIG_PATH = os.environ.get(
     "PAI_CONFIG_PATH", os.path.join(os.path.expanduser("~"), ".pai", "config.json")
 )
 
+# Default directory for the local caches of the SDK.
+DEFAULT_CACHE_DIR = os.environ.get(
+    "PAI_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".pai", "cache")
+)
+
 
 class JobType(object):
     """PAI DLCJob/TrainingJob type."""
@@ -0,0 +1,181 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InstanceSpec(object):
+    """Specification of a machine instance type."""
+
+    def __init__(
+        self,
+        instance_type: str,
+        accelerator_type: Optional[str] = None,
+        cpu: Optional[int] = None,
+        memory: Optional[int] = None,
+        gpu: Optional[int] = None,
+        gpu_type: Optional[str] = None,
+    ):
+        self.instance_type = instance_type
+        self.accelerator_type = accelerator_type
+        self.cpu = cpu
+        self.memory = memory
+        self.gpu = gpu
+        self.gpu_type = gpu_type
+
+    def __repr__(self):
+        return "InstanceSpec(instance_type={}, accelerator_type={})".format(
+            self.instance_type, self.accelerator_type
+        )
+
+    @property
+    def is_gpu(self) -> bool:
+        return self.accelerator_type == "GPU"
+
+    @classmethod
+    def from_ecs_spec(cls, obj: Dict[str, Any]) -> "InstanceSpec":
+        """Build from an EcsSpec object returned by PAI-DLC ListEcsSpecs API."""
+        return cls(
+            instance_type=obj["InstanceType"],
+            accelerator_type=obj.get("AcceleratorType"),
+            cpu=obj.get("Cpu"),
+            memory=obj.get("Memory"),
+            gpu=obj.get("Gpu"),
+            gpu_type=obj.get("GpuType"),
+        )
+
+    @classmethod
+    def from_machine_spec(cls, obj: Dict[str, Any]) -> "InstanceSpec":
+        """Build from an InstanceMeta object returned by PAI-EAS DescribeMachineSpec
+        API."""
+        return cls(
+            instance_type=obj["InstanceType"],
+            accelerator_type="GPU" if obj.get("GPU") else "CPU",
+            cpu=obj.get("CPU"),
+            memory=obj.get("Memory"),
+            gpu=obj.get("GPU"),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "InstanceSpec":
+        return cls(**d)
+
+
+class InstanceTypeCatalog(object):
+    """A catalog of the supported instance types, indexed by the instance type.
+
+    The catalog is loaded lazily on the first lookup, and reloaded once it's older
+    than the TTL. If a cache file is given, the loaded catalog is persisted to the
+    file, and is reused by other processes within the TTL.
+    """
+
+    DEFAULT_TTL = 3600
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[InstanceSpec]],
+        ttl: Optional[float] = None,
+        cache_file: Optional[str] = None,
+    ):
+        """InstanceTypeCatalog initializer.
+
+        Args:
+            loader (Callable): A function that returns the instance specs.
+            ttl (float, optional): Seconds before the loaded catalog expires, default
+                to 3600.
+            cache_file (str, optional): Path of the file that the catalog is
+                persisted to. The catalog is not persisted if not provided.
+        """
+        self._loader = loader
+        self._ttl = ttl if ttl is not None else self.DEFAULT_TTL
+        self._cache_file = cache_file
+        self._specs: Optional[Dict[str, InstanceSpec]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _is_expired(self, loaded_at: float) -> bool:
+        return time.time() - loaded_at >= self._ttl
+
+    def _read_cache_file(self) -> bool:
+        if not self._cache_file or not os.path.isfile(self._cache_file):
+            return False
+        try:
+            with open(self._cache_file, "r") as f:
+                data = json.load(f)
+            loaded_at = data["loaded_at"]
+            specs = [InstanceSpec.from_dict(d) for d in data["instance_types"]]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Failed to read the instance type catalog cache: %s", e)
+            return False
+        if self._is_expired(loaded_at):
+            return False
+        self._specs = {spec.instance_type: spec for spec in specs}
+        self._loaded_at = loaded_at
+        return True
+
+    def _write_cache_file(self):
+        data = {
+            "loaded_at": self._loaded_at,
+            "instance_types": [spec.to_dict() for spec in self._specs.values()],
+        }
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            tmp_file = "{}.{}.tmp".format(self._cache_file, os.getpid())
+            with open(tmp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self._cache_file)
+        except OSError as e:
+            logger.debug("Failed to write the instance type catalog cache: %s", e)
+
+    def _ensure_loaded(self) -> Dict[str, InstanceSpec]:
+        with self._lock:
+            if self._specs is not None and not self._is_expired(self._loaded_at):
+                return self._specs
+            if self._read_cache_file():
+                return self._specs
+            self._specs = {spec.instance_type: spec for spec in self._loader()}
+            self._loaded_at = time.time()
+            if self._cache_file:
+                self._write_cache_file()
+            return self._specs
+
+    def invalidate(self):
+        """Drop the loaded catalog, it's reloaded on next lookup."""
+        with self._lock:
+            self._specs = None
+            if self._cache_file and os.path.isfile(self._cache_file):
+                os.remove(self._cache_file)
+
+    def get(self, instance_type: str) -> Optional[InstanceSpec]:
+        """Get the spec of the instance type, returns None if it's not supported."""
+        return self._ensure_loaded().get(instance_type)
+
+    def __contains__(self, instance_type: str) -> bool:
+        return self.get(instance_type) is not None
+
+    def __iter__(self):
+        return iter(list(self._ensure_loaded().values()))
+
+    def __len__(self):
+        return len(self._ensure_loaded())
@@ -14,13 +14,20 @@
 
 from __future__ import absolute_import
 
+import collections
 import glob
+import gzip
+import hashlib
+import json
 import logging
 import os.path
 import pathlib
 import tarfile
-import tempfile
-from typing import Optional, Tuple, Union
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import parse_qs, urlparse
 
 import oss2
@@ -29,14 +36,84 @@ from alibabacloud_credentials.models import Config as CredentialConfig
 from oss2.credentials import Credentials, CredentialsProvider
 from tqdm.autonotebook import tqdm
 
+from .consts import DEFAULT_CACHE_DIR
+
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of files transferred concurrently when uploading a directory, it
+# matches the default size of the HTTP connection pool of an oss2.Bucket.
+DEFAULT_MAX_TRANSFER_WORKERS = oss2.defaults.connection_pool_size
+# Maximum total size of the objects being downloaded concurrently.
+DEFAULT_MAX_INFLIGHT_BYTES = 1024 * 1024 * 1024
+# Size of the chunk compressed independently by the parallel gzip compression.
+_COMPRESS_CHUNK_SIZE = 4 * 1024 * 1024
+# Number of objects returned by a ListObjects request, 1000 is the maximum.
+_LIST_OBJECTS_PAGE_SIZE = 1000
+
+
 class _ProgressCallbackTqdm(tqdm):
     def __call__(self, consumed_bytes, total_bytes):
         self.update(n=consumed_bytes - self.n)
 
 
+class _AggregatedProgressTqdm(tqdm):
+    """A progress bar that tracks the total progress of files transferred
+    concurrently."""
+
+    def __init__(self, *args, **kwargs):
+        super(_AggregatedProgressTqdm, self).__init__(*args, **kwargs)
+        self._progress_lock = threading.Lock()
+
+    def make_callback(self):
+        """Returns a progress callback for transferring a single file."""
+        consumed = 0
+
+        def callback(consumed_bytes, total_bytes):
+            nonlocal consumed
+            with self._progress_lock:
+                # Progress of a resumable transfer might be reported out of order.
+                if consumed_bytes > consumed:
+                    self.update(n=consumed_bytes - consumed)
+                    consumed = consumed_bytes
+
+        return callback
+
+    def add_total(self, n: int):
+        """Increase the total size, used when the total is not known upfront."""
+        with self._progress_lock:
+            self.total += n
+            self.refresh()
+
+
+def _upload_file(
+    filename,
+    object_key,
+    oss_bucket: oss2.Bucket,
+    progress_callback=None,
+    num_threads: Optional[int] = None,
+):
+    """Upload a local file to OSS.
+
+    Small file is uploaded with a single PutObject request, and large file is
+    uploaded with the resumable multipart upload.
+    """
+    if os.path.getsize(filename) < oss2.defaults.multipart_threshold:
+        return oss_bucket.put_object_from_file(
+            key=object_key,
+            filename=filename,
+            progress_callback=progress_callback,
+        )
+    else:
+        return oss2.resumable_upload(
+            bucket=oss_bucket,
+            key=object_key,
+            filename=filename,
+            progress_callback=progress_callback,
+            num_threads=num_threads or os.cpu_count() * 2,
+        )
+
+
 def _upload_with_progress(
     filename,
     object_key,
@@ -49,40 +126,384 @@ def _upload_with_progress(
         unit_scale=True,
         desc=f"Uploading file: {filename}",
     ) as pbar:
-        oss2.resumable_upload(
-            bucket=oss_bucket,
-            key=object_key,
+        _upload_file(
             filename=filename,
+            object_key=object_key,
+            oss_bucket=oss_bucket,
             progress_callback=pbar,
-            num_threads=os.cpu_count() * 2,
         )
         # Mark the progress as completed.
         pbar.update(n=pbar.total - pbar.n)
 
 
+def _upload_files_with_progress(
+    files: List[Tuple[str, str]],
+    oss_bucket: oss2.Bucket,
+    max_workers: Optional[int] = None,
+    desc: Optional[str] = None,
+) -> List[oss2.models.PutObjectResult]:
+    """Upload the files concurrently with a bounded thread pool.
+
+    Args:
+        files (List[Tuple[str, str]]): A list of (filename, object_key) to upload.
+        oss_bucket (oss2.Bucket): OSS bucket used to store the files.
+        max_workers (int, optional): Maximum number of files uploaded concurrently.
+        desc (str, optional): Description of the progress bar.
+
+    Returns:
+        List[oss2.models.PutObjectResult]: Results of the uploads, in the order of the
+            given files.
+    """
+    max_workers = max_workers or DEFAULT_MAX_TRANSFER_WORKERS
+    total = sum(os.path.getsize(filename) for filename, _ in files)
+    with _AggregatedProgressTqdm(
+        total=total,
+        unit="B",
+        unit_scale=True,
+        desc=desc,
+    ) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _upload_file,
+                filename=filename,
+                object_key=object_key,
+                oss_bucket=oss_bucket,
+                progress_callback=pbar.make_callback(),
+                # Large files share the thread budget of the directory upload.
+                num_threads=max(os.cpu_count() * 2 // max_workers, 1),
+            )
+            for filename, object_key in files
+        ]
+        try:
+            for fut in as_completed(futures):
+                fut.result()
+        except Exception:
+            for fut in futures:
+                fut.cancel()
+            raise
+        # Mark the progress as completed.
+        pbar.update(n=pbar.total - pbar.n)
+    return [fut.result() for fut in futures]
+
+
+def _download_file(
+    filename,
+    object_key,
+    oss_bucket: oss2.Bucket,
+    size: int,
+    progress_callback=None,
+    num_threads: Optional[int] = None,
+):
+    """Download an OSS object to a local file.
+
+    Small object is downloaded with a single GetObject request, and large object is
+    downloaded with the resumable ranged download.
+    """
+    if size < oss2.defaults.multiget_threshold:
+        oss_bucket.get_object_to_file(
+            key=object_key,
+            filename=filename,
+            progress_callback=progress_callback,
+        )
+    else:
+        oss2.resumable_download(
+            bucket=oss_bucket,
+            key=object_key,
+            filename=filename,
+            progress_callback=progress_callback,
+            num_threads=num_threads or os.cpu_count(),
+        )
+
+
 def _download_with_progress(
     filename,
     object_key,
     oss_bucket: oss2.Bucket,
+    size: Optional[int] = None,
 ):
-    total = oss_bucket.get_object_meta(object_key).content_length
+    if size is None:
+        size = oss_bucket.get_object_meta(object_key).content_length
     with _ProgressCallbackTqdm(
-        total=total,
+        total=size,
         unit="B",
         unit_scale=True,
         desc=f"Downloading file: {filename}",
     ) as pbar:
-        oss2.resumable_download(
-            bucket=oss_bucket,
-            key=object_key,
+        _download_file(
             filename=filename,
+            object_key=object_key,
+            oss_bucket=oss_bucket,
+            size=size,
             progress_callback=pbar,
-            num_threads=os.cpu_count(),
         )
         # Mark the progress as completed.
         pbar.update(n=pbar.total - pbar.n)
 
 
+class _InflightLimiter(object):
+    """Limits the number of objects and bytes being transferred concurrently."""
+
+    def __init__(self, max_objects: int, max_bytes: int):
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        self._objects = 0
+        self._bytes = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, size: int):
+        with self._cond:
+            # An object larger than max_bytes is admitted when nothing is in flight.
+            self._cond.wait_for(
+                lambda: self._objects < self.max_objects
+                and (self._objects == 0 or self._bytes + size <= self.max_bytes)
+            )
+            self._objects += 1
+            self._bytes += size
+
+    def release(self, size: int):
+        with self._cond:
+            self._objects -= 1
+            self._bytes -= size
+            self._cond.notify_all()
+
+
+def _iter_objects(oss_bucket: oss2.Bucket, prefix: str):
+    """Iterate over the objects under the prefix, excluding the directory markers."""
+    for obj in oss2.ObjectIteratorV2(
+        bucket=oss_bucket, prefix=prefix, max_keys=_LIST_OBJECTS_PAGE_SIZE
+    ):
+        if not obj.key.endswith("/"):
+            yield obj
+
+
+def _download_objects_with_progress(
+    objects: Iterable[Tuple[str, str, int]],
+    oss_bucket: oss2.Bucket,
+    max_workers: Optional[int] = None,
+    max_inflight_bytes: Optional[int] = None,
+    desc: Optional[str] = None,
+):
+    """Download the objects concurrently.
+
+    The objects are consumed lazily, downloads are scheduled while the iterable is
+    still producing objects, such as paginating the listing of a prefix.
+
+    Args:
+        objects (Iterable[Tuple[str, str, int]]): An iterable of (object_key,
+            filename, size) to download.
+        oss_bucket (oss2.Bucket): OSS bucket that stores the objects.
+        max_workers (int, optional): Maximum number of objects downloaded
+            concurrently.
+        max_inflight_bytes (int, optional): Maximum total size of the objects
+            downloaded concurrently.
+        desc (str, optional): Description of the progress bar.
+    """
+    max_workers = max_workers or DEFAULT_MAX_TRANSFER_WORKERS
+    limiter = _InflightLimiter(
+        max_objects=max_workers,
+        max_bytes=max_inflight_bytes or DEFAULT_MAX_INFLIGHT_BYTES,
+    )
+    futures = []
+    failed = threading.Event()
+
+    def _download(key, dest, size, callback):
+        try:
+            _download_file(
+                filename=dest,
+                object_key=key,
+                oss_bucket=oss_bucket,
+                size=size,
+                progress_callback=callback,
+                num_threads=max(os.cpu_count() // max_workers, 1),
+            )
+        except Exception:
+            failed.set()
+            raise
+        finally:
+            limiter.release(size)
+
+    with _AggregatedProgressTqdm(
+        total=0,
+        unit="B",
+        unit_scale=True,
+        desc=desc,
+    ) as pbar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for key, dest, size in objects:
+                # Stop scheduling new downloads once a download failed.
+                if failed.is_set():
+                    break
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                limiter.acquire(size)
+                pbar.add_total(size)
+                futures.append(
+                    executor.submit(_download, key, dest, size, pbar.make_callback())
+                )
+            for fut in as_completed(futures):
+                fut.result()
+        except Exception:
+            for fut in futures:
+                fut.cancel()
+            raise
+        # Mark the progress as completed.
+        pbar.update(n=pbar.total - pbar.n)
+
+
+def _download_prefix_with_progress(
+    prefix: str,
+    local_path: str,
+    oss_bucket: oss2.Bucket,
+    max_workers: Optional[int] = None,
+    max_inflight_bytes: Optional[int] = None,
+):
+    """Download the objects under the prefix concurrently.
+
+    Objects are downloaded while the listing is still being paginated, the object
+    sizes from the listing are used to choose the download method, so no extra
+    HEAD request is sent for each object.
+    """
+    _download_objects_with_progress(
+        (
+            (
+                obj.key,
+                os.path.join(local_path, os.path.relpath(obj.key, prefix)),
+                obj.size,
+            )
+            for obj in _iter_objects(oss_bucket, prefix)
+        ),
+        oss_bucket=oss_bucket,
+        max_workers=max_workers,
+        max_inflight_bytes=max_inflight_bytes,
+        desc=f"Downloading: {prefix}",
+    )
+
+
+def _get_object_size(oss_bucket: oss2.Bucket, object_key: str) -> Optional[int]:
+    """Returns size of the OSS object, or None if the object does not exist."""
+    try:
+        return oss_bucket.get_object_meta(object_key).content_length
+    except (oss2.exceptions.NoSuchKey, oss2.exceptions.NotFound):
+        return None
+
+
+def _file_md5(filename: str) -> str:
+    md5 = hashlib.md5()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+class _LocalManifest(object):
+    """Records the content hash and the OSS ETag of the files under a local path.
+
+    The manifest is persisted under the cache directory of the SDK. The content hash
+    of a file is computed again only if the size or the modification time of the
+    file is changed.
+    """
+
+    def __init__(self, local_path: str):
+        self.local_path = os.path.abspath(local_path)
+        self.path = os.path.join(
+            DEFAULT_CACHE_DIR,
+            "oss_sync",
+            hashlib.sha1(self.local_path.encode()).hexdigest() + ".json",
+        )
+        self.entries = self._load()
+        self.files = self._list_files()
+        # Remove the entries of the deleted files.
+        self.entries = {k: v for k, v in self.entries.items() if k in self.files}
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return dict()
+        if data.get("local_path") != self.local_path:
+            return dict()
+        return data.get("files", dict())
+
+    def _list_files(self) -> Dict[str, str]:
+        if not os.path.isdir(self.local_path):
+            return {os.path.basename(self.local_path): self.local_path}
+        files = dict()
+        for root, _, names in os.walk(self.local_path):
+            for name in names:
+                filename = os.path.join(root, name)
+                rel_path = pathlib.Path(filename).relative_to(self.local_path)
+                files[rel_path.as_posix()] = filename
+        return files
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"local_path": self.local_path, "files": self.entries}, f)
+        os.replace(temp_path, self.path)
+
+    def _get_entry(self, rel_path: str, filename: str) -> Dict:
+        stat = os.stat(filename)
+        entry = self.entries.get(rel_path)
+        if (
+            not entry
+            or entry["size"] != stat.st_size
+            or entry["mtime_ns"] != stat.st_mtime_ns
+        ):
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            self.entries[rel_path] = entry
+        return entry
+
+    def md5(self, rel_path: str, filename: str) -> str:
+        entry = self._get_entry(rel_path, filename)
+        if "md5" not in entry:
+            entry["md5"] = _file_md5(filename)
+        return entry["md5"]
+
+    def is_synced(self, rel_path: str, filename: str, size: int, etag: str) -> bool:
+        """Returns True if the local file has the same content as the OSS object."""
+        entry = self._get_entry(rel_path, filename)
+        if entry["size"] != size:
+            return False
+        elif entry.get("etag") == etag:
+            return True
+        # ETag of an object uploaded by a single request is the MD5 of the content,
+        # ETag of a multipart uploaded object contains a hyphen.
+        if "-" not in etag and self.md5(rel_path, filename) == etag.lower():
+            entry["etag"] = etag
+            return True
+        return False
+
+    def set_etag(self, rel_path: str, filename: str, etag: str):
+        self._get_entry(rel_path, filename)["etag"] = etag
+
+    def digest(self) -> str:
+        """Returns a digest of the relative paths and the content of the files."""
+        sha256 = hashlib.sha256()
+        for rel_path in sorted(self.files):
+            md5 = self.md5(rel_path, self.files[rel_path])
+            sha256.update(f"{rel_path}\0{md5}\n".encode())
+        return sha256.hexdigest()
+
+
+def get_local_path_digest(local_path: str) -> str:
+    """Returns a digest of the content of a local file or directory.
+
+    The content hash of the files is cached in a local manifest, so the files
+    unchanged since the last call are not read again.
+
+    Args:
+        local_path (str): A local file or directory.
+
+    Returns:
+        str: A hex digest of the relative paths and the content of the files.
+    """
+    manifest = _LocalManifest(local_path)
+    digest = manifest.digest()
+    manifest.save()
+    return digest
+
+
 def is_oss_uri(uri: Union[str, bytes]) -> bool:
     """Determines whether the given uri is an OSS uri.
 
@@ -246,22 +667,240 @@ class OssUriObj(object):
         return is_dir, dir_path, file_name
 
 
-def _tar_file(source_file, target=None):
-    source_file = (
-        source_file if os.path.isabs(source_file) else os.path.abspath(source_file)
-    )
-    if not os.path.exists(source_file):
-        raise ValueError("source file not exists: %s", source_file)
-    if os.path.isdir(source_file):
-        arcname = ""
-    else:
-        arcname = os.path.basename(source_file)
+class _MultipartUploadWriter(object):
+    """A writable file object that uploads the written data to an OSS object.
 
-    if not target:
-        target = tempfile.mktemp()
-    with tarfile.open(target, "w:gz") as tar:
-        tar.add(name=source_file, arcname=arcname)
-    return target
+    The data is uploaded in fixed-size parts with the multipart upload while it is
+    being written, at most `num_threads` parts are buffered in memory. Data smaller
+    than a part is uploaded with a single PutObject request.
+    """
+
+    def __init__(
+        self,
+        oss_bucket: oss2.Bucket,
+        object_key: str,
+        part_size: Optional[int] = None,
+        num_threads: Optional[int] = None,
+        progress_callback=None,
+    ):
+        self.oss_bucket = oss_bucket
+        self.object_key = object_key
+        self.part_size = part_size or oss2.defaults.part_size
+        self.num_threads = num_threads or os.cpu_count()
+        self.progress_callback = progress_callback
+        self._upload_id = None
+        self._buffer = bytearray()
+        self._part_number = 0
+        self._parts = []
+        self._pending = collections.deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._submit_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def _submit_part(self, data: bytes):
+        if self._upload_id is None:
+            self._upload_id = self.oss_bucket.init_multipart_upload(
+                self.object_key
+            ).upload_id
+        # Wait for the earliest part to bound the memory used by the pending parts.
+        while len(self._pending) >= self.num_threads:
+            self._parts.append(self._pending.popleft().result())
+        self._part_number += 1
+        self._pending.append(
+            self._executor.submit(self._upload_part, self._part_number, data)
+        )
+
+    def _upload_part(self, part_number: int, data: bytes) -> oss2.models.PartInfo:
+        result = self.oss_bucket.upload_part(
+            self.object_key, self._upload_id, part_number, data
+        )
+        if self.progress_callback:
+            self.progress_callback(len(data))
+        return oss2.models.PartInfo(part_number, result.etag, size=len(data))
+
+    def close(self) -> oss2.models.PutObjectResult:
+        """Finish the upload, returns the result of the upload."""
+        try:
+            if self._upload_id is None:
+                result = self.oss_bucket.put_object(
+                    self.object_key, bytes(self._buffer)
+                )
+                if self.progress_callback:
+                    self.progress_callback(len(self._buffer))
+                return result
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+            while self._pending:
+                self._parts.append(self._pending.popleft().result())
+            return self.oss_bucket.complete_multipart_upload(
+                self.object_key, self._upload_id, self._parts
+            )
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            self._executor.shutdown(wait=False)
+
+    def abort(self):
+        for fut in self._pending:
+            fut.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+        if self._upload_id is not None:
+            upload_id, self._upload_id = self._upload_id, None
+            try:
+                self.oss_bucket.abort_multipart_upload(self.object_key, upload_id)
+            except oss2.exceptions.OssError as e:
+                logger.warning("Failed to abort the multipart upload: %s", e)
+
+
+class _ParallelGzipWriter(object):
+    """A writable file object that compresses the data into gzip format with
+    multiple threads.
+
+    The data is split into fixed-size chunks, each chunk is compressed into an
+    independent gzip member on a thread pool, and the members are written to the
+    underlying file object in order. Concatenated gzip members are a valid gzip
+    file, which could be decompressed by gzip, tar and Python gzip module.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        chunk_size: Optional[int] = None,
+        num_threads: Optional[int] = None,
+        compresslevel: int = 6,
+    ):
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size or _COMPRESS_CHUNK_SIZE
+        self.num_threads = num_threads or os.cpu_count()
+        self.compresslevel = compresslevel
+        self._buffer = bytearray()
+        self._pending = collections.deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            self._submit_chunk(bytes(self._buffer[: self.chunk_size]))
+            del self._buffer[: self.chunk_size]
+        return len(data)
+
+    def _submit_chunk(self, data: bytes):
+        while len(self._pending) >= self.num_threads * 2:
+            self.fileobj.write(self._pending.popleft().result())
+        self._pending.append(self._executor.submit(self._compress, data))
+
+    def _compress(self, data: bytes) -> bytes:
+        # wbits=31 produces a gzip member, zlib releases GIL while compressing.
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    def close(self):
+        try:
+            if self._buffer or not self._pending:
+                self._submit_chunk(bytes(self._buffer))
+            while self._pending:
+                self.fileobj.write(self._pending.popleft().result())
+        finally:
+            self._buffer = bytearray()
+            self._executor.shutdown(wait=False)
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Please install zstandard first to use zstd compression: pip install"
+            " zstandard"
+        )
+    return zstandard
+
+
+# Supported compression of tar archive and the file extension.
+_TAR_COMPRESSION_EXTENSIONS = {
+    "gzip": ".tar.gz",
+    "zstd": ".tar.zst",
+}
+
+
+def _upload_tar_stream(
+    source_path: str,
+    object_key: str,
+    oss_bucket: oss2.Bucket,
+    compression: str = "gzip",
+) -> oss2.models.PutObjectResult:
+    """Compress the source file/directory into a tar archive and upload it to OSS.
+
+    The archive is compressed with multiple threads and uploaded while it is being
+    generated, no temporary file is written.
+    """
+    source_path = os.path.abspath(source_path)
+    arcname = "" if os.path.isdir(source_path) else os.path.basename(source_path)
+    with tqdm(
+        unit="B",
+        unit_scale=True,
+        desc=f"Uploading compressed file: {source_path}",
+    ) as pbar:
+        writer = _MultipartUploadWriter(
+            oss_bucket=oss_bucket,
+            object_key=object_key,
+            progress_callback=pbar.update,
+        )
+        try:
+            if compression == "gzip":
+                compressor = _ParallelGzipWriter(writer)
+            elif compression == "zstd":
+                compressor = (
+                    _import_zstandard()
+                    .ZstdCompressor(threads=-1)
+                    .stream_writer(writer, closefd=False)
+                )
+            else:
+                raise ValueError(
+                    f"Unsupported compression: {compression}, supported compressions"
+                    f" are {list(_TAR_COMPRESSION_EXTENSIONS)}."
+                )
+            with tarfile.open(fileobj=compressor, mode="w|") as tar:
+                tar.add(name=source_path, arcname=arcname)
+            compressor.close()
+        except Exception:
+            writer.abort()
+            raise
+        return writer.close()
+
+
+def _download_and_extract_tar(
+    object_key: str,
+    local_path: str,
+    oss_bucket: oss2.Bucket,
+    size: int,
+):
+    """Download a compressed tar archive from OSS and extract it on the fly."""
+    with _ProgressCallbackTqdm(
+        total=size,
+        unit="B",
+        unit_scale=True,
+        desc=f"Downloading file: {object_key}",
+    ) as pbar:
+        stream = oss_bucket.get_object(object_key, progress_callback=pbar)
+        if object_key.endswith(_TAR_COMPRESSION_EXTENSIONS["zstd"]):
+            fileobj = _import_zstandard().ZstdDecompressor().stream_reader(stream)
+        else:
+            # GzipFile supports the multi-member gzip file, which is not supported
+            # by the stream mode "r|gz" of tarfile.
+            fileobj = gzip.GzipFile(fileobj=stream, mode="rb")
+        with tarfile.open(fileobj=fileobj, mode="r|") as tar:
+            tar.extractall(path=local_path)
+        # Mark the progress as completed.
+        pbar.update(n=pbar.total - pbar.n)
 
 
 def _get_bucket_and_path(
@@ -290,11 +929,101 @@ def _get_bucket_and_path(
     return bucket, oss_path
 
 
+class _UploadIndex(object):
+    """A local index maps the digest of the uploaded data to its OSS URI.
+
+    The index is persisted under the cache directory of the SDK, only the most
+    recently used entries are kept.
+    """
+
+    MAX_ENTRIES = 1000
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(DEFAULT_CACHE_DIR, "upload_index.json")
+        try:
+            with open(self.path, "r") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = dict()
+
+    @classmethod
+    def make_key(cls, bucket_name: str, digest: str, data_format: str) -> str:
+        return "{}:{}:{}".format(bucket_name, data_format, digest)
+
+    def get(self, key: str) -> Optional[str]:
+        return self.entries.get(key)
+
+    def put(self, key: str, uri: str):
+        self.entries.pop(key, None)
+        self.entries[key] = uri
+        while len(self.entries) > self.MAX_ENTRIES:
+            self.entries.pop(next(iter(self.entries)))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(temp_path, self.path)
+
+
+def _is_uploaded_data_exists(
+    oss_bucket: oss2.Bucket, uri: str, manifest: _LocalManifest, is_tar: bool
+) -> bool:
+    """Check if the data uploaded before is still complete in OSS."""
+    object_key = OssUriObj(uri).object_key
+    if is_tar or not os.path.isdir(manifest.local_path):
+        return oss_bucket.object_exists(object_key)
+    expected = {
+        object_key + rel_path: os.path.getsize(filename)
+        for rel_path, filename in manifest.files.items()
+    }
+    for obj in _iter_objects(oss_bucket, object_key):
+        if expected.get(obj.key) == obj.size:
+            del expected[obj.key]
+    return not expected
+
+
+def _upload_with_cache(
+    source_path: str,
+    oss_path: str,
+    bucket: oss2.Bucket,
+    is_tar: bool,
+    max_workers: Optional[int] = None,
+    compression: str = "gzip",
+) -> str:
+    manifest = _LocalManifest(source_path)
+    digest = manifest.digest()
+    manifest.save()
+
+    index = _UploadIndex()
+    key = index.make_key(
+        bucket.bucket_name,
+        digest,
+        _TAR_COMPRESSION_EXTENSIONS[compression] if is_tar else "raw",
+    )
+    uri = index.get(key)
+    if uri and _is_uploaded_data_exists(bucket, uri, manifest, is_tar):
+        logger.info("Reuse the data uploaded before: %s", uri)
+    else:
+        uri = upload(
+            source_path=source_path,
+            oss_path=oss_path,
+            bucket=bucket,
+            is_tar=is_tar,
+            max_workers=max_workers,
+            compression=compression,
+        )
+    index.put(key, uri)
+    return uri
+
+
 def upload(
     source_path: str,
     oss_path: Union[str, OssUriObj],
     bucket: Optional[oss2.Bucket] = None,
     is_tar: Optional[bool] = False,
+    max_workers: Optional[int] = None,
+    use_cache: bool = False,
+    compression: str = "gzip",
 ) -> str:
     """Upload local source file/directory to OSS.
 
@@ -312,6 +1041,16 @@ def upload(
         bucket (oss2.Bucket): OSS bucket used to store the upload data. If it is not
             provided, OSS bucket of the default session will be used.
         is_tar (bool): Whether to compress the file before uploading (default: False).
+        max_workers (int, optional): Maximum number of files uploaded concurrently
+            if the source_path is a directory. If it is not provided,
+            DEFAULT_MAX_TRANSFER_WORKERS is used.
+        use_cache (bool): Whether to reuse the data uploaded before. If enabled, the
+            digest of the source data is looked up in a local index, and the upload
+            is skipped if the same data was uploaded and still exists in the OSS
+            bucket (default: False).
+        compression (str): Compression of the tar archive if is_tar is True, "gzip"
+            or "zstd" (default: "gzip"). The "zstd" compression requires the
+            `zstandard` package.
 
     Returns:
         str: A string in OSS URI format. If the source_path is directory, return the
@@ -324,22 +1063,35 @@ def upload(
     source_path_obj = pathlib.Path(source_path)
     if not source_path_obj.exists():
         raise RuntimeError("Source path is not exist: {}".format(source_path))
+    if is_tar and compression not in _TAR_COMPRESSION_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported compression: {compression}, supported compressions are"
+            f" {list(_TAR_COMPRESSION_EXTENSIONS)}."
+        )
 
-    if is_tar:
+    if use_cache:
+        return _upload_with_cache(
+            source_path=source_path,
+            oss_path=oss_path,
+            bucket=bucket,
+            is_tar=is_tar,
+            max_workers=max_workers,
+            compression=compression,
+        )
+    elif is_tar:
         # compress the local data and upload the compressed source data.
-        with tempfile.TemporaryDirectory() as dir_name:
-            temp_tar_path = _tar_file(
-                source_path, os.path.join(dir_name, "source.tar.gz")
-            )
-            dest_path = (
-                os.path.join(oss_path, os.path.basename(temp_tar_path))
-                if oss_path.endswith("/")
-                else oss_path
-            )
-            _upload_with_progress(
-                filename=temp_tar_path, object_key=dest_path, oss_bucket=bucket
-            )
-            return "oss://{}/{}".format(bucket.bucket_name, dest_path)
+        dest_path = (
+            os.path.join(oss_path, "source" + _TAR_COMPRESSION_EXTENSIONS[compression])
+            if oss_path.endswith("/")
+            else oss_path
+        )
+        _upload_tar_stream(
+            source_path=source_path,
+            object_key=dest_path,
+            oss_bucket=bucket,
+            compression=compression,
+        )
+        return "oss://{}/{}".format(bucket.bucket_name, dest_path)
     elif not source_path_obj.is_dir():
         # if source path is a file, just invoke bucket.put_object.
 
@@ -363,14 +1115,21 @@ def upload(
         if not oss_path.endswith("/"):
             oss_path += "/"
 
-        files = [f for f in source_files if not os.path.isdir(f)]
-        for file_path in files:
-            file_path_obj = pathlib.Path(file_path)
-            file_relative_path = file_path_obj.relative_to(source_path_obj).as_posix()
-            object_key = oss_path + file_relative_path
-            _upload_with_progress(
-                filename=file_path, object_key=object_key, oss_bucket=bucket
+        files = [
+            (
+                file_path,
+                oss_path
+                + pathlib.Path(file_path).relative_to(source_path_obj).as_posix(),
             )
+            for file_path in source_files
+            if not os.path.isdir(file_path)
+        ]
+        _upload_files_with_progress(
+            files,
+            oss_bucket=bucket,
+            max_workers=max_workers,
+            desc=f"Uploading directory: {source_path}",
+        )
         return "oss://{}/{}".format(bucket.bucket_name, oss_path)
 
 
@@ -379,6 +1138,8 @@ def download(
     local_path: str,
     bucket: Optional[oss2.Bucket] = None,
     un_tar=False,
+    max_workers: Optional[int] = None,
+    max_inflight_bytes: Optional[int] = None,
 ):
     """Download OSS objects to local path.
 
@@ -389,7 +1150,14 @@ def download(
         bucket (oss2.Bucket, optional): OSS bucket used to store the upload data. If it
             is not provided, OSS bucket of the default session will be used.
         un_tar (bool, optional): Whether to decompress the downloaded data. It is only
-            work for `oss_path` point to a single file that has a suffix "tar.gz".
+            work for `oss_path` point to a single file that has a suffix "tar.gz" or
+            "tar.zst". The data is decompressed and extracted while downloading.
+        max_workers (int, optional): Maximum number of objects downloaded
+            concurrently if the oss_path is a directory. If it is not provided,
+            DEFAULT_MAX_TRANSFER_WORKERS is used.
+        max_inflight_bytes (int, optional): Maximum total size of the objects
+            downloaded concurrently if the oss_path is a directory. If it is not
+            provided, DEFAULT_MAX_INFLIGHT_BYTES is used.
 
     Returns:
         str: A local file path for the downloaded data.
@@ -398,41 +1166,32 @@ def download(
 
     bucket, oss_path = _get_bucket_and_path(bucket, oss_path)
 
-    if not bucket.object_exists(oss_path) or oss_path.endswith("/"):
+    size = None if oss_path.endswith("/") else _get_object_size(bucket, oss_path)
+    if size is None:
         # The `oss_path` represents a "directory" in the OSS bucket, download the
         # objects which object key is prefixed with `oss_path`.
         # Note: `un_tar` is not work while `oss_path` is a directory.
 
         oss_path += "/" if not oss_path.endswith("/") else ""
-        iterator = oss2.ObjectIteratorV2(
-            bucket=bucket,
+        _download_prefix_with_progress(
             prefix=oss_path,
+            local_path=local_path,
+            oss_bucket=bucket,
+            max_workers=max_workers,
+            max_inflight_bytes=max_inflight_bytes,
         )
-        keys = [obj.key for obj in iterator if not obj.key.endswith("/")]
-        for key in tqdm(keys, desc=f"Downloading: {oss_path}"):
-            rel_path = os.path.relpath(key, oss_path)
-            dest = os.path.join(local_path, rel_path)
-            os.makedirs(os.path.dirname(dest), exist_ok=True)
-            _download_with_progress(
-                dest,
-                object_key=key,
-                oss_bucket=bucket,
-            )
         return local_path
     else:
         # The `oss_path` represents a single file in OSS bucket.
-        if oss_path.endswith(".tar.gz") and un_tar:
-            # currently, only tar.gz format is supported for un_tar after downloading.
-            with tempfile.TemporaryDirectory() as temp_dir:
-                target_path = os.path.join(temp_dir, os.path.basename(oss_path))
-                _download_with_progress(
-                    target_path,
-                    object_key=oss_path,
-                    oss_bucket=bucket,
-                )
-                with tarfile.open(name=target_path, mode="r") as t:
-                    t.extractall(path=local_path)
-
+        if un_tar and oss_path.endswith(tuple(_TAR_COMPRESSION_EXTENSIONS.values())):
+            # currently, only tar.gz and tar.zst format is supported for un_tar after
+            # downloading.
+            _download_and_extract_tar(
+                object_key=oss_path,
+                local_path=local_path,
+                oss_bucket=bucket,
+                size=size,
+            )
             return local_path
         else:
             os.makedirs(local_path, exist_ok=True)
@@ -441,20 +1200,207 @@ def download(
                 dest,
                 object_key=oss_path,
                 oss_bucket=bucket,
+                size=size,
             )
 
             return dest
 
 
+def sync(
+    local_path: str,
+    oss_path: Union[str, OssUriObj],
+    bucket: Optional[oss2.Bucket] = None,
+    delete: bool = False,
+    max_workers: Optional[int] = None,
+) -> str:
+    """Synchronize local file/directory to OSS, only changed files are uploaded.
+
+    A file is skipped if an object with the same size and content exists in the
+    destination. The content is compared with a local manifest that records the OSS
+    ETag and the MD5 of the files, so the files that are unchanged since the last
+    sync are not read again.
+
+    Examples::
+
+        # upload the changed files under `./src/` to OSS.
+        >>> sync("./src/", "oss://bucket-name/path/to/src/")
+
+    Args:
+        local_path (str): Local file or directory to synchronize.
+        oss_path (Union[str, OssUriObj]): Destination OSS directory.
+        bucket (oss2.Bucket, optional): OSS bucket used to store the data. If it is
+            not provided, OSS bucket of the default session will be used.
+        delete (bool): Whether to delete the objects under the destination that do
+            not exist in the local path (default: False).
+        max_workers (int, optional): Maximum number of files uploaded concurrently.
+
+    Returns:
+        str: A string in OSS URI format represents the destination OSS directory.
+    """
+    bucket, oss_path = _get_bucket_and_path(bucket, oss_path)
+    if not os.path.exists(local_path):
+        raise RuntimeError("Source path is not exist: {}".format(local_path))
+    if not oss_path.endswith("/"):
+        oss_path += "/"
+
+    manifest = _LocalManifest(local_path)
+    objects = {obj.key: obj for obj in _iter_objects(bucket, oss_path)}
+    files = []
+    for rel_path, filename in manifest.files.items():
+        obj = objects.pop(oss_path + rel_path, None)
+        if obj and manifest.is_synced(rel_path, filename, obj.size, obj.etag):
+            continue
+        files.append((rel_path, filename))
+    logger.debug(
+        "Sync %s to %s: %s of %s files changed.",
+        local_path,
+        oss_path,
+        len(files),
+        len(manifest.files),
+    )
+
+    try:
+        results = _upload_files_with_progress(
+            [(filename, oss_path + rel_path) for rel_path, filename in files],
+            oss_bucket=bucket,
+            max_workers=max_workers,
+            desc=f"Uploading: {local_path}",
+        )
+        for (rel_path, filename), result in zip(files, results):
+            manifest.set_etag(rel_path, filename, result.etag)
+    finally:
+        manifest.save()
+
+    if delete and objects:
+        keys = sorted(objects)
+        # DeleteMultipleObjects accepts at most 1000 keys in a request.
+        for i in range(0, len(keys), 1000):
+            bucket.batch_delete_objects(keys[i : i + 1000])
+    return "oss://{}/{}".format(bucket.bucket_name, oss_path)
+
+
+def sync_download(
+    oss_path: Union[str, OssUriObj],
+    local_path: str,
+    bucket: Optional[oss2.Bucket] = None,
+    delete: bool = False,
+    max_workers: Optional[int] = None,
+    max_inflight_bytes: Optional[int] = None,
+) -> str:
+    """Synchronize OSS directory to local directory, only changed objects are
+    downloaded.
+
+    It is the download direction of :func:`sync`, a local file is kept if it has the
+    same size and content as the OSS object.
+
+    Args:
+        oss_path (Union[str, OssUriObj]): Source OSS directory.
+        local_path (str): Local directory used to store the data from OSS.
+        bucket (oss2.Bucket, optional): OSS bucket that stores the data. If it is not
+            provided, OSS bucket of the default session will be used.
+        delete (bool): Whether to delete the local files that do not exist in the
+            source OSS directory (default: False).
+        max_workers (int, optional): Maximum number of objects downloaded
+            concurrently.
+        max_inflight_bytes (int, optional): Maximum total size of the objects
+            downloaded concurrently.
+
+    Returns:
+        str: The local directory stores the data.
+    """
+    bucket, oss_path = _get_bucket_and_path(bucket, oss_path)
+    if not oss_path.endswith("/"):
+        oss_path += "/"
+    os.makedirs(local_path, exist_ok=True)
+
+    manifest = _LocalManifest(local_path)
+    local_files = dict(manifest.files)
+    downloads = []
+
+    def _iter_changed_objects():
+        for obj in _iter_objects(bucket, oss_path):
+            rel_path = obj.key[len(oss_path) :]
+            filename = local_files.pop(rel_path, None)
+            if filename and manifest.is_synced(rel_path, filename, obj.size, obj.etag):
+                continue
+            filename = os.path.join(manifest.local_path, rel_path)
+            downloads.append((rel_path, filename, obj.etag))
+            yield obj.key, filename, obj.size
+
+    try:
+        _download_objects_with_progress(
+            _iter_changed_objects(),
+            oss_bucket=bucket,
+            max_workers=max_workers,
+            max_inflight_bytes=max_inflight_bytes,
+            desc=f"Downloading: {oss_path}",
+        )
+        for rel_path, filename, etag in downloads:
+            manifest.set_etag(rel_path, filename, etag)
+    finally:
+        manifest.save()
+
+    if delete:
+        for filename in local_files.values():
+            os.remove(filename)
+    return local_path
+
+
 class CredentialProviderWrapper(CredentialsProvider):
-    """A wrapper class for the credential provider of OSS."""
+    """A wrapper class for the credential provider of OSS.
 
-    def __init__(self, config: CredentialConfig):
-        self.client = CredentialClient(config)
+    Credentials with a known expiration are cached, and refreshed before they
+    expire. Otherwise, the credentials are got from the credential client on each
+    call, which refreshes the temporary credentials by itself.
+    """
+
+    # Refresh the credentials the given seconds before they expire, it is less than
+    # the threshold the credential client refreshes the temporary credentials.
+    REFRESH_AHEAD_SECONDS = 120
+
+    def __init__(
+        self,
+        config: Optional[CredentialConfig] = None,
+        client: Optional[CredentialClient] = None,
+    ):
+        self.client = client or CredentialClient(config)
+        self._credentials = None
+        self._expire_at = None
+        self._lock = threading.Lock()
 
     def get_credentials(self) -> Credentials:
-        return Credentials(
-            access_key_id=self.client.get_access_key_id(),
-            access_key_secret=self.client.get_access_key_secret(),
-            security_token=self.client.get_security_token(),
-        )
+        with self._lock:
+            if (
+                self._credentials is None
+                or self._expire_at is None
+                or time.time() >= self._expire_at
+            ):
+                self._credentials, self._expire_at = self._fetch_credentials()
+            return self._credentials
+
+    def _fetch_credentials(self) -> Tuple[Credentials, Optional[float]]:
+        cloud_credential = self.client.cloud_credential
+        provider = getattr(cloud_credential, "provider", None)
+        if provider is not None:
+            # alibabacloud-credentials>=1.0: the expiration is only available on the
+            # credentials of the underlying provider.
+            credential = provider.get_credentials()
+            credentials = Credentials(
+                access_key_id=credential.get_access_key_id(),
+                access_key_secret=credential.get_access_key_secret(),
+                security_token=credential.get_security_token(),
+            )
+            expiration = credential.get_expiration()
+        else:
+            # Get the credential as a whole, so that the access key and the security
+            # token are consistent if the credential is refreshed.
+            credential = self.client.get_credential()
+            credentials = Credentials(
+                access_key_id=credential.access_key_id,
+                access_key_secret=credential.access_key_secret,
+                security_token=credential.security_token,
+            )
+            expiration = getattr(cloud_credential, "expiration", None)
+        # The credentials without a known expiration are not cached.
+        expire_at = expiration - self.REFRESH_AHEAD_SECONDS if expiration else None
+        return credentials, expire_at
@@ -0,0 +1,173 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Utilities for reading and writing the protobuf wire format with NumPy.
+
+Packed repeated scalar fields are encoded and decoded with vectorized NumPy
+operations, which avoids creating a Python object for each element.
+
+Wire format document: https://protobuf.dev/programming-guides/encoding/
+"""
+
+from typing import Iterator, Tuple, Union
+
+from .utils import LazyModule
+
+np = LazyModule("numpy")
+
+
+class WireType(object):
+    VARINT = 0
+    FIXED64 = 1
+    LENGTH_DELIMITED = 2
+    FIXED32 = 5
+
+
+# A varint takes at most 10 bytes to encode a 64-bit integer.
+_MAX_VARINT_BYTES = 10
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode a single integer as varint, negative value is encoded as 64-bit two's
+    complement."""
+    if value < 0:
+        value += 1 << 64
+    buf = bytearray()
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+    return bytes(buf)
+
+
+def _read_varint(buf: memoryview, pos: int) -> Tuple[int, int]:
+    result, shift = 0, 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("Truncated varint in protobuf message.")
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7F) << shift
+        if not b & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 7 * _MAX_VARINT_BYTES:
+            raise ValueError("Too many bytes when decoding varint.")
+
+
+def encode_varints(values: "np.ndarray") -> bytes:
+    """Encode the integer array as the payload of a packed varint field.
+
+    Negative values are encoded as 64-bit two's complement, which is the encoding
+    of int32 and int64 fields.
+    """
+    values = np.ascontiguousarray(values, dtype=np.int64).ravel().view(np.uint64)
+    if values.size == 0:
+        return b""
+
+    # Byte length of each encoded value.
+    sizes = np.ones(values.shape, dtype=np.int64)
+    max_value = int(values.max())
+    for i in range(1, _MAX_VARINT_BYTES):
+        threshold = 1 << (7 * i)
+        if max_value < threshold:
+            break
+        sizes += values >= np.uint64(threshold)
+
+    ends = np.cumsum(sizes)
+    offsets = ends - sizes
+    out = np.empty(int(ends[-1]), dtype=np.uint8)
+    for i in range(int(sizes.max())):
+        if i == 0:
+            idx, vals, vsizes = slice(None), values, sizes
+        else:
+            idx = np.flatnonzero(sizes > i)
+            vals, vsizes = values[idx], sizes[idx]
+        byte = (vals >> np.uint64(7 * i)) & np.uint64(0x7F)
+        # Set the MSB if there are more bytes following.
+        byte |= (vsizes > i + 1).astype(np.uint64) << np.uint64(7)
+        out[offsets[idx] + i] = byte.astype(np.uint8)
+    return out.tobytes()
+
+
+def decode_varints(data: Union[bytes, memoryview]) -> "np.ndarray":
+    """Decode the payload of a packed varint field into an uint64 array."""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if buf.size == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    # The last byte of each varint has the MSB unset.
+    ends = np.flatnonzero(buf < 0x80)
+    if ends.size == 0 or ends[-1] != buf.size - 1:
+        raise ValueError("Truncated varint in protobuf message.")
+    if ends.size == buf.size:
+        return buf.astype(np.uint64)
+
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lengths = ends - starts + 1
+    if lengths.max() > _MAX_VARINT_BYTES:
+        raise ValueError("Too many bytes when decoding varint.")
+    # Index of each byte in the varint it belongs to.
+    group = np.arange(buf.size) - np.repeat(starts, lengths)
+    parts = (buf & 0x7F).astype(np.uint64) << (group.astype(np.uint64) * np.uint64(7))
+    return np.bitwise_or.reduceat(parts, starts)
+
+
+def encode_tag(field_number: int, wire_type: int) -> bytes:
+    return encode_varint((field_number << 3) | wire_type)
+
+
+def encode_length_delimited(field_number: int, payload: bytes) -> bytes:
+    """Encode a length-delimited field, such as bytes, string, embedded message, and
+    packed repeated fields."""
+    return (
+        encode_tag(field_number, WireType.LENGTH_DELIMITED)
+        + encode_varint(len(payload))
+        + payload
+    )
+
+
+def iter_fields(
+    data: Union[bytes, memoryview]
+) -> Iterator[Tuple[int, int, Union[int, memoryview]]]:
+    """Iterate over the fields of a serialized protobuf message.
+
+    Yields:
+        Tuple[int, int, Union[int, memoryview]]: A tuple of (field_number, wire_type,
+            value), the value is an integer for the varint field, otherwise a
+            memoryview of the raw bytes of the field value.
+    """
+    buf = memoryview(data)
+    pos, end = 0, len(buf)
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == WireType.VARINT:
+            value, pos = _read_varint(buf, pos)
+        else:
+            if wire_type == WireType.FIXED64:
+                size = 8
+            elif wire_type == WireType.FIXED32:
+                size = 4
+            elif wire_type == WireType.LENGTH_DELIMITED:
+                size, pos = _read_varint(buf, pos)
+            else:
+                raise ValueError(f"Unsupported protobuf wire type: {wire_type}")
+            if pos + size > end:
+                raise ValueError("Truncated protobuf message.")
+            value = buf[pos : pos + size]
+            pos += size
+        yield field_number, wire_type, value
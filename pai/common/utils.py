@@ -14,13 +14,18 @@
 
 from __future__ import absolute_import
 
+import collections
+import importlib
+import itertools
 import random
 import re
 import socket
 import string
 import sys
+import types
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Callable, Dict, Optional, Union
+from typing import Callable, Dict, Iterator, Optional, Union
 
 from semantic_version import Version
 
@@ -31,9 +36,48 @@ from pai.common.consts import (
 )
 from pai.version import VERSION
 
+try:
+    from concurrent.futures import InvalidStateError
+except ImportError:
+    # Python < 3.8, resolving a cancelled future does not raise.
+    InvalidStateError = RuntimeError
+
 DEFAULT_PLAIN_TEXT_ALLOW_CHARACTERS = string.ascii_letters + string.digits + "_"
 
 
+class LazyModule(types.ModuleType):
+    """A proxy of the module that is imported on the first attribute access.
+
+    It's used to defer the import of the heavy dependencies, such as numpy and the
+    generated OpenAPI clients, until they are actually used.
+
+    Examples::
+
+        np = LazyModule("numpy")
+
+        # numpy is imported here.
+        np.asarray([1, 2, 3])
+
+    """
+
+    def __init__(self, name: str):
+        super(LazyModule, self).__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
 def is_iterable(arg):
     try:
         _ = iter(arg)
@@ -68,11 +112,38 @@ def snake_to_camel(name):
     return "".join([w.title() for w in name.split("_")])
 
 
-def make_list_resource_iterator(method: Callable, **kwargs):
+# Default page size of the list resource iterator.
+_LIST_PAGE_SIZE = 50
+# Max number of pages fetched concurrently once the total count is known.
+_LIST_MAX_WORKERS = 8
+# Number of pages fetched ahead if the total count is unknown.
+_LIST_PREFETCH_PAGES = 2
+
+
+def make_list_resource_iterator(
+    method: Callable,
+    max_workers: int = _LIST_MAX_WORKERS,
+    prefetch_pages: int = _LIST_PREFETCH_PAGES,
+    **kwargs,
+):
     """Wrap resource list method as an iterator.
 
+    The first page is fetched in the calling thread. If the method returns a
+    PaginatedResult, the remaining pages are known from its total count and are
+    fetched concurrently by at most `max_workers` threads. Otherwise, the next
+    `prefetch_pages` pages are read ahead while the consumer processes the current
+    page. Items are always yielded in the order of the listing.
+
+    If the service returns fewer items than the requested page size on the first
+    page while more items remain, the page size is capped by the service, and
+    the subsequent pages are requested with the returned size.
+
     Args:
         method: Resource List method.
+        max_workers (int): Max number of pages fetched concurrently when the total
+            count is known.
+        prefetch_pages (int): Number of pages fetched ahead when the total count
+            is unknown.
         **kwargs: arguments for the method.
 
     Yields:
@@ -81,20 +152,148 @@ def make_list_resource_iterator(method: Callable, **kwargs):
 
     from pai.api.base import PaginatedResult
 
-    page_number = kwargs.get("page_number", 1)
-    page_size = kwargs.get("page_size", 10)
+    page_number = kwargs.pop("page_number", 1)
+    page_size = kwargs.pop("page_size", _LIST_PAGE_SIZE)
 
-    while True:
-        kwargs.update(page_number=page_number, page_size=page_size)
-        result = method(**kwargs)
+    def fetch(page_number: int, page_size: int):
+        result = method(page_number=page_number, page_size=page_size, **kwargs)
         if isinstance(result, PaginatedResult):
-            result = result.items
-        for item in result:
-            yield item
-
-        if len(result) == 0 or len(result) < page_size:
+            return result.items, result.total_count
+        return result, None
+
+    items, total_count = fetch(page_number, page_size)
+    yield from items
+    if not items:
+        return
+
+    if total_count is not None:
+        total_count = int(total_count)
+        if page_number == 1 and len(items) < min(page_size, total_count):
+            page_size = len(items)
+        last_page = (total_count + page_size - 1) // page_size
+        if page_number >= last_page:
+            return
+        pages = iter(range(page_number + 1, last_page + 1))
+        window = max_workers
+    else:
+        if len(items) < page_size:
             return
-        page_number += 1
+        pages = itertools.count(page_number + 1)
+        window = prefetch_pages + 1
+
+    if window <= 1:
+        for page in pages:
+            items, _ = fetch(page, page_size)
+            yield from items
+            if len(items) < page_size:
+                return
+        return
+
+    executor = ThreadPoolExecutor(max_workers=window)
+    futures = collections.deque()
+
+    def submit():
+        page = next(pages, None)
+        if page is not None:
+            futures.append(executor.submit(fetch, page, page_size))
+
+    try:
+        for _ in range(window):
+            submit()
+        while futures:
+            items, _ = futures.popleft().result()
+            submit()
+            yield from items
+            if len(items) < page_size:
+                return
+    finally:
+        # Do not wait for the pages fetched ahead if the consumer stops early.
+        for f in futures:
+            f.cancel()
+        executor.shutdown(wait=False)
+
+
+def set_future(
+    future: Future, result=None, exception: Optional[BaseException] = None
+) -> bool:
+    """Resolve the future unless it's done, e.g. cancelled by the waiter.
+
+    Returns:
+        bool: True if the future is resolved by the call.
+    """
+    if future.done():
+        return False
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        # The future is cancelled after the check.
+        return False
+    return True
+
+
+class BackoffStrategy(object):
+    """Strategies of growing the interval between the polls."""
+
+    Fixed = "fixed"
+    Exponential = "exponential"
+    Fibonacci = "fibonacci"
+
+    @classmethod
+    def supported(cls):
+        return [cls.Fixed, cls.Exponential, cls.Fibonacci]
+
+
+def make_backoff_intervals(
+    min_interval: float,
+    max_interval: Optional[float] = None,
+    strategy: str = BackoffStrategy.Exponential,
+    factor: float = 2.0,
+    jitter: float = 0.0,
+    seed: Optional[float] = None,
+) -> Iterator[float]:
+    """Make an endless iterator of the intervals between the polls.
+
+    Args:
+        min_interval (float): The first interval, which the backoff grows from.
+        max_interval (float, optional): The cap of the intervals.
+        strategy (str): The backoff strategy, one of "fixed", "exponential" and
+            "fibonacci".
+        factor (float): Factor the interval grows by for the exponential backoff.
+        jitter (float): Each interval is randomized by the ratio of jitter.
+        seed (float, optional): If provided, it is used as the first interval,
+            the backoff starts from the min_interval after it.
+
+    Returns:
+        Iterator[float]: Intervals in seconds.
+    """
+    if strategy not in BackoffStrategy.supported():
+        raise ValueError(f"Unsupported backoff strategy: {strategy}")
+
+    def _clip(interval):
+        interval = max(interval, min_interval)
+        if max_interval is not None:
+            interval = min(interval, max_interval)
+        return interval * (1 + random.uniform(-jitter, jitter))
+
+    def _intervals():
+        if seed is not None:
+            yield _clip(seed)
+        interval, prev = min_interval, 0.0
+        while True:
+            yield _clip(interval)
+            if max_interval is not None and interval >= max_interval:
+                # The interval is capped, stop growing to avoid the overflow.
+                continue
+            if strategy == BackoffStrategy.Exponential:
+                interval *= factor
+            elif strategy == BackoffStrategy.Fibonacci:
+                # The sequence is min_interval * (1, 1, 2, 3, 5, 8, ...).
+                interval, prev = interval + prev, interval
+
+    return _intervals()
 
 
 def to_plain_text(
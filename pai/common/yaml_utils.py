@@ -14,8 +14,17 @@
 
 import yaml
 
+# Use the LibYAML based dumper and loader if available, which are much faster than
+# the pure Python implementation.
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
 
-class NoAliasDumper(yaml.SafeDumper):
+
+class NoAliasDumper(_SafeDumper):
     def ignore_aliases(self, data):
         return True
 
@@ -48,4 +57,4 @@ def dump_all(seq):
 
 def safe_load(stream):
     """Parse the first YAML document in the stream."""
-    return yaml.safe_load(stream)
+    return yaml.load(stream, Loader=_SafeLoader)
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import distutils.dir_util
 import json
 import logging
@@ -22,18 +23,37 @@ import shlex
 import shutil
 import tempfile
 import textwrap
+import threading
 import time
 import webbrowser
 from abc import ABCMeta, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from .api.base import PAIRestResourceTypes
 from .api.entity_base import EntityBaseMixin
 from .common import ProviderAlibabaPAI, git_utils
 from .common.consts import INSTANCE_TYPE_LOCAL_GPU, FileSystemInputScheme, JobType
 from .common.docker_utils import ContainerRun, run_container
-from .common.oss_utils import OssUriObj, download, is_oss_uri, upload
+from .common.oss_utils import (
+    OssUriObj,
+    download,
+    get_local_path_digest,
+    is_oss_uri,
+    upload,
+)
 from .common.utils import (
     is_filesystem_uri,
     is_local_run_instance_type,
@@ -44,10 +64,11 @@ from .common.utils import (
 )
 from .exception import UnexpectedStatusException
 from .model import InferenceSpec, Model, ResourceConfig
-from .predictor import Predictor
+from .predictor import Predictor, WaitConfig
 from .schema.training_job_schema import TrainingJobSchema
 from .serializers import SerializerBase
 from .session import Session, get_default_session
+from .watcher import WAIT_MAX_INTERVAL, wait_watch
 
 logger = logging.getLogger(__name__)
 
@@ -486,6 +507,24 @@ class EstimatorBase(metaclass=ABCMeta):
             raise RuntimeError("Could not find a submitted training job.")
         self._latest_training_job.wait(show_logs=show_logs)
 
+    def stream_logs(self, **kwargs) -> "TrainingJobLogStream":
+        """Stream the logs of the latest training job.
+
+        Args:
+            **kwargs: Arguments passed to :class:`TrainingJobLogStream`.
+
+        Returns:
+            TrainingJobLogStream: A stream of the logs, it ends once the training job
+                is completed.
+
+        Raises:
+            RuntimeError: If no training job is submitted.
+
+        """
+        if not self._latest_training_job:
+            raise RuntimeError("Could not find a submitted training job.")
+        return self._latest_training_job.stream_logs(**kwargs)
+
     def model_data(self) -> str:
         """Model data output path.
 
@@ -660,6 +699,7 @@ class Estimator(EstimatorBase):
         instance_type: Optional[str] = None,
         instance_count: Optional[int] = None,
         user_vpc_config: Optional[UserVpcConfig] = None,
+        content_addressed_upload: bool = False,
         session: Optional[Session] = None,
     ):
         """Estimator constructor.
@@ -792,6 +832,10 @@ class Estimator(EstimatorBase):
                                      r"([-+]?[0-9]*.?[0-9]+(?:[eE][-+]?[0-9]+)?).*",
                         },
                     ]
+            content_addressed_upload (bool): Whether to upload the local source code
+                to an OSS path derived from the digest of the source files. If enabled,
+                the source code uploaded by the previous training job is reused if the
+                source files are unchanged (Default False).
             session (Session, optional): A PAI session instance used for communicating
                 with PAI service.
 
@@ -802,6 +846,7 @@ class Estimator(EstimatorBase):
         self.git_config = git_config
         self.job_type = job_type if job_type else JobType.PyTorchJob
         self.metric_definitions = metric_definitions
+        self.content_addressed_upload = content_addressed_upload
 
         super(Estimator, self).__init__(
             hyperparameters=hyperparameters,
@@ -846,15 +891,28 @@ class Estimator(EstimatorBase):
             return self.source_dir
         elif not os.path.exists(self.source_dir):
             raise ValueError(f"Source directory {self.source_dir} does not exist.")
+        if self.content_addressed_upload:
+            upload_data_path = self.session.get_storage_path_by_category(
+                "training_src", get_local_path_digest(self.source_dir)
+            )
+            # Reuse the source code uploaded with the same digest.
+            object_key = posixpath.join(upload_data_path, "source.tar.gz")
+            if self.session.oss_bucket.object_exists(object_key):
+                self.__uploaded_source_files = "oss://{}/{}".format(
+                    self.session.oss_bucket.bucket_name, object_key
+                )
+                return self.__uploaded_source_files
+        else:
+            upload_data_path = self.session.get_storage_path_by_category(
+                "training_src", to_plain_text(job_name)
+            )
         # compress the source files to a Tar Gz file and upload to OSS bucket.
-        upload_data_path = self.session.get_storage_path_by_category(
-            "training_src", to_plain_text(job_name)
-        )
         self.__uploaded_source_files = upload(
             source_path=self.source_dir,
             oss_path=upload_data_path,
             bucket=self.session.oss_bucket,
             is_tar=True,
+            use_cache=True,
         )
         return self.__uploaded_source_files
 
@@ -1807,19 +1865,56 @@ class _TrainingJob(EntityBaseMixin):
 
         return self.training_job_url
 
-    def wait(self, interval=2, show_logs: bool = True):
+    def wait(
+        self,
+        interval=2,
+        show_logs: bool = True,
+        wait_config: Optional[WaitConfig] = None,
+    ):
         self.session.training_job_api.refresh_entity(self.training_job_id, self)
 
         if show_logs:
             job_log_printer = _TrainingJobLogPrinter(
-                training_job_id=self.training_job_id, page_size=20, session=self.session
+                training_job_id=self.training_job_id, session=self.session
             )
             job_log_printer.start()
         else:
             job_log_printer = None
         try:
-            while self.status not in TrainingJobStatus.completed_status():
-                time.sleep(interval)
+            if self.status not in TrainingJobStatus.completed_status():
+                last_status = [self.status]
+
+                def is_done(obj: Dict[str, Any]) -> bool:
+                    last_status[0] = obj["Status"]
+                    return obj["Status"] in TrainingJobStatus.completed_status()
+
+                def on_waiting(elapsed: float):
+                    logger.info(
+                        f"Still waiting for the training job: "
+                        f"training_job_id={self.training_job_id} "
+                        f"status={last_status[0]} elapsed={elapsed:.0f}s."
+                    )
+
+                # The job status is polled by the watcher shared in the session, the
+                # interval is capped low as the caller is blocked on the wait.
+                future = self.session.watcher.watch(
+                    PAIRestResourceTypes.TrainingJob,
+                    self.training_job_id,
+                    is_done=is_done,
+                    interval=interval,
+                    max_interval=WAIT_MAX_INTERVAL,
+                    delay=interval,
+                    schedule=wait_config.intervals if wait_config else None,
+                )
+                timeout = wait_config.total_timeout if wait_config else None
+                try:
+                    wait_watch(future, timeout=timeout, on_waiting=on_waiting)
+                except FutureTimeoutError:
+                    future.cancel()
+                    raise RuntimeError(
+                        f"Waiting for the training job timeout: "
+                        f"training_job_id={self.training_job_id} total_time={timeout}"
+                    )
                 self.session.training_job_api.refresh_entity(self.training_job_id, self)
         finally:
             if job_log_printer:
@@ -1827,6 +1922,28 @@ class _TrainingJob(EntityBaseMixin):
 
         self._on_job_completed()
 
+    def stream_logs(self, **kwargs) -> "TrainingJobLogStream":
+        """Stream the logs of the training job, the stream ends once the training job
+        is completed.
+
+        Args:
+            **kwargs: Arguments passed to :class:`TrainingJobLogStream`.
+
+        Returns:
+            TrainingJobLogStream: A stream of the logs.
+        """
+        if "until" not in kwargs:
+            completed = self.session.watcher.watch(
+                PAIRestResourceTypes.TrainingJob,
+                self.training_job_id,
+                is_done=lambda obj: obj["Status"]
+                in TrainingJobStatus.completed_status(),
+            )
+            kwargs["until"] = completed.done
+        return TrainingJobLogStream(
+            self.training_job_id, session=self.session, **kwargs
+        )
+
     def _on_job_completed(self):
         # Print an empty line to separate the training job logs and the following logs
         print()
@@ -1864,73 +1981,190 @@ class _TrainingJob(EntityBaseMixin):
         return self.status == TrainingJobStatus.Succeed
 
 
+class TrainingJobLogStream(object):
+    """A stream of the logs produced by a training job.
+
+    The stream keeps a cursor of the logs consumed, each poll fetches the pages from
+    the cursor, so the logs are never delivered twice. The polling interval is reset
+    to the min interval once new logs are fetched, and grows while the job is idle.
+
+    The logs can be consumed with a generator or an async iterator::
+
+        stream = TrainingJobLogStream(training_job_id, session=session)
+        for log in stream:
+            print(log)
+
+        async for log in stream:
+            print(log)
+
+    The iteration ends after :meth:`stop` is called or the ``until`` function
+    returns True, and the remaining logs are flushed.
+    """
+
+    def __init__(
+        self,
+        training_job_id: str,
+        session: Optional[Session] = None,
+        worker_id: Optional[str] = None,
+        cursor: int = 0,
+        page_size: int = 100,
+        min_interval: float = 0.5,
+        max_interval: float = 10,
+        backoff_factor: float = 2,
+        flush_timeout: float = 3,
+        until: Optional[Callable[[], bool]] = None,
+    ):
+        """TrainingJobLogStream initializer.
+
+        Args:
+            training_job_id (str): ID of the training job.
+            session (Session, optional): The session used to fetch the logs.
+            worker_id (str, optional): Only fetch the logs of the given worker.
+            cursor (int): Index of the first log to fetch, used to resume a stream
+                from the cursor of a previous one.
+            page_size (int): Number of logs fetched per API call.
+            min_interval (float): Min interval in seconds between two polls.
+            max_interval (float): Max interval in seconds between two polls.
+            backoff_factor (float): Factor the interval grows by when no new logs
+                are fetched.
+            flush_timeout (float): Seconds to wait for the delayed logs once the
+                stream is stopped, it's restarted whenever new logs are fetched.
+            until (Callable, optional): A function returns True if the stream
+                should be stopped, it's checked before each poll.
+        """
+        self.training_job_id = training_job_id
+        self.session = session or get_default_session()
+        self.worker_id = worker_id
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.flush_timeout = flush_timeout
+        self.until = until
+        self._cursor = cursor
+        self._stop_event = threading.Event()
+
+    @property
+    def cursor(self) -> int:
+        """Index of the next log to fetch."""
+        return self._cursor
+
+    def stop(self):
+        """Stop the stream, the iteration ends once the remaining logs are flushed."""
+        self._stop_event.set()
+
+    def _is_stopped(self) -> bool:
+        if not self._stop_event.is_set() and self.until and self.until():
+            self._stop_event.set()
+        return self._stop_event.is_set()
+
+    def _consume_page(self, items: List[str], page_offset: int) -> Tuple[List, bool]:
+        logs = items[page_offset:]
+        self._cursor += len(logs)
+        return logs, len(items) == self.page_size
+
+    def _list_logs_kwargs(self) -> Tuple[Dict[str, Any], int]:
+        page_number, page_offset = divmod(self._cursor, self.page_size)
+        kwargs = {
+            "training_job_id": self.training_job_id,
+            "worker_id": self.worker_id,
+            "page_number": page_number + 1,
+            "page_size": self.page_size,
+        }
+        return kwargs, page_offset
+
+    def poll(self) -> List[str]:
+        """Fetch the logs produced since the last poll."""
+        result = []
+        while True:
+            kwargs, page_offset = self._list_logs_kwargs()
+            res = self.session.training_job_api.list_logs(**kwargs)
+            logs, has_more = self._consume_page(res.items, page_offset)
+            result.extend(logs)
+            if not has_more:
+                return result
+
+    async def poll_async(self) -> List[str]:
+        """Async version of :meth:`poll`."""
+        result = []
+        while True:
+            kwargs, page_offset = self._list_logs_kwargs()
+            res = await self.session.training_job_api.list_logs_async(**kwargs)
+            logs, has_more = self._consume_page(res.items, page_offset)
+            result.extend(logs)
+            if not has_more:
+                return result
+
+    def _next_interval(self, interval: float, has_logs: bool) -> float:
+        if has_logs:
+            return self.min_interval
+        return min(interval * self.backoff_factor, self.max_interval)
+
+    def __iter__(self) -> Iterator[str]:
+        interval, flush_deadline = self.min_interval, None
+        while True:
+            if flush_deadline is None and self._is_stopped():
+                flush_deadline = time.monotonic() + self.flush_timeout
+            logs = self.poll()
+            yield from logs
+            if flush_deadline is not None:
+                if logs:
+                    flush_deadline = time.monotonic() + self.flush_timeout
+                elif time.monotonic() >= flush_deadline:
+                    return
+            interval = self._next_interval(interval, bool(logs))
+            if flush_deadline is not None:
+                time.sleep(min(interval, max(flush_deadline - time.monotonic(), 0)))
+            else:
+                self._stop_event.wait(interval)
+
+    async def __aiter__(self) -> AsyncIterator[str]:
+        interval, flush_deadline = self.min_interval, None
+        while True:
+            if flush_deadline is None and self._is_stopped():
+                flush_deadline = time.monotonic() + self.flush_timeout
+            logs = await self.poll_async()
+            for log in logs:
+                yield log
+            if flush_deadline is not None:
+                if logs:
+                    flush_deadline = time.monotonic() + self.flush_timeout
+                elif time.monotonic() >= flush_deadline:
+                    return
+            interval = self._next_interval(interval, bool(logs))
+            if flush_deadline is not None:
+                interval = min(interval, max(flush_deadline - time.monotonic(), 0))
+            await asyncio.sleep(interval)
+
+
 class _TrainingJobLogPrinter(object):
     """A class used to print logs for a training job"""
 
     executor = ThreadPoolExecutor(5)
 
     def __init__(
-        self, training_job_id: str, page_size=10, session: Optional[Session] = None
+        self, training_job_id: str, page_size=100, session: Optional[Session] = None
     ):
         self.training_job_id = training_job_id
         self.session = session
         self.page_size = page_size
+        self._stream = None
         self._future = None
-        self._stop = False
-
-    def _list_logs(self):
-        page_number, page_offset = 1, 0
-        # print training job logs.
-        while not self._stop:
-            res = self.session.training_job_api.list_logs(
-                self.training_job_id,
-                page_number=page_number,
-                page_size=self.page_size,
-            )
-            # 1. move to next page
-            if len(res.items) == self.page_size:
-                # print new logs starting from page_offset
-                self._print_logs(logs=res.items[page_offset:])
-                page_number += 1
-                page_offset = 0
-            # 2. stay at the current page.
-            else:
-                if len(res.items) > page_offset:
-                    # print new logs starting from page_offset
-                    self._print_logs(logs=res.items[page_offset:])
-                    page_offset = len(res.items)
-                time.sleep(1)
-
-        # When _stop is True, wait and print remaining logs.
-        time.sleep(10)
-        while True:
-            res = self.session.training_job_api.list_logs(
-                self.training_job_id,
-                page_number=page_number,
-                page_size=self.page_size,
-            )
-            # There maybe more logs in the next page
-            if len(res.items) == self.page_size:
-                self._print_logs(logs=res.items[page_offset:])
-                page_number += 1
-                page_offset = 0
-            # No more logs in the next page.
-            else:
-                if len(res.items) > page_offset:
-                    self._print_logs(logs=res.items[page_offset:])
-                break
 
-    def _print_logs(self, logs: List[str]):
-        for log in logs:
+    def _print_logs(self):
+        for log in self._stream:
             print(log)
 
     def start(self):
         if self._future:
             raise ValueError("The training job log printer is already started")
-        self._stop = False
-        self._future = self.executor.submit(self._list_logs)
+        self._stream = TrainingJobLogStream(
+            self.training_job_id, session=self.session, page_size=self.page_size
+        )
+        self._future = self.executor.submit(self._print_logs)
 
     def stop(self, wait: bool = True):
-        self._stop = True
-        if self._future:
+        if self._stream:
+            self._stream.stop()
+        if self._future and wait:
             self._future.result()
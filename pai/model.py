@@ -32,10 +32,18 @@ from oss2 import ObjectIterator
 from .common import git_utils
 from .common.consts import INSTANCE_TYPE_LOCAL_GPU, ModelFormat
 from .common.docker_utils import ContainerRun, run_container
-from .common.oss_utils import OssUriObj, download, is_oss_uri, upload
+from .common.oss_utils import (
+    OssUriObj,
+    download,
+    get_local_path_digest,
+    is_oss_uri,
+    sync,
+    upload,
+)
 from .common.utils import (
     generate_repr,
     is_local_run_instance_type,
+    make_list_resource_iterator,
     random_str,
     to_plain_text,
 )
@@ -284,6 +292,7 @@ class InferenceSpec(object):
         source: str,
         mount_path: str,
         session: Session = None,
+        content_addressed_upload: bool = False,
     ) -> Dict[str, Any]:
         """Mount a source storage to the running container.
 
@@ -298,6 +307,10 @@ class InferenceSpec(object):
             mount_path (str): The mount path in the container.
             session (Session, optional): A PAI session instance used for communicating
                 with PAI service.
+            content_addressed_upload (bool): Whether to upload the local source to an
+                OSS path derived from the digest of the source files. If enabled, only
+                the changed files are uploaded, and the data uploaded before is reused
+                if the source is unchanged (Default False).
 
         Returns:
             Dict[str, Any]: The storage config.
@@ -348,10 +361,21 @@ class InferenceSpec(object):
         elif os.path.exists(source):
             # if source is a local path, upload it to OSS bucket and use OSS URI
             # as storage source.
-            oss_path = session.get_storage_path_by_category("model_data")
-            oss_uri = upload(
-                source_path=source, oss_path=oss_path, bucket=session.oss_bucket
-            )
+            if content_addressed_upload:
+                oss_path = session.get_storage_path_by_category(
+                    "model_data", get_local_path_digest(source)
+                )
+                oss_uri = sync(
+                    local_path=source, oss_path=oss_path, bucket=session.oss_bucket
+                )
+                if os.path.isfile(source):
+                    # sync returns the directory, points to the file as upload does.
+                    oss_uri = posixpath.join(oss_uri, os.path.basename(source))
+            else:
+                oss_path = session.get_storage_path_by_category("model_data")
+                oss_uri = upload(
+                    source_path=source, oss_path=oss_path, bucket=session.oss_bucket
+                )
             oss_uri_obj = OssUriObj(oss_uri)
             storage_config = {
                 "mount_path": mount_path,
@@ -687,6 +711,7 @@ class ModelBase(object):
             source_path=self.model_data,
             oss_path=dest_oss_path,
             bucket=self.session.oss_bucket,
+            use_cache=True,
         )
         return upload_model_data
 
@@ -835,6 +860,29 @@ class ModelBase(object):
             time.sleep(interval)
         logger.warning("DescribeService API failed to get the Service object.")
 
+    def _check_instance_type(
+        self, instance_type: Optional[str], resource_id: Optional[str] = None
+    ):
+        """Warn if the given instance_type is not supported for inference service.
+
+        The catalog of the instance types may be stale or unavailable, the
+        deployment is not rejected by the check.
+        """
+        # Instance types of the dedicated resource group are not in the catalog.
+        if not instance_type or resource_id:
+            return
+        try:
+            supported = self.session.is_supported_inference_instance(instance_type)
+        except Exception as e:
+            logger.debug("Failed to check the instance type %s: %s", instance_type, e)
+            return
+        if not supported:
+            logger.warning(
+                "Instance type='%s' is not found in the supported instance types for"
+                " inference service, the deployment may fail.",
+                instance_type,
+            )
+
     def _build_service_config(
         self,
         service_name: str = None,
@@ -846,6 +894,7 @@ class ModelBase(object):
         options: Dict[str, Any] = None,
     ) -> Dict[str, Any]:
         """Build a service config dictionary used to create a PAI EAS service."""
+        self._check_instance_type(instance_type, resource_id=resource_id)
         self.model_data = self._upload_model_data()
 
         resource_config = (
@@ -1442,30 +1491,20 @@ class RegisteredModel(ModelBase):
                 the given criteria.
         """
         session = session or get_default_session()
-        page_size = 50
-        page_number = 1
-
-        while True:
-            result = session.model_api.list(
-                model_name=model_name,
-                provider=model_provider,
-                task=task,
-                page_size=page_size,
-                page_number=page_number,
-            ).items
-            if not result:
-                break
-
-            for item in result:
-                model_version_info = item.pop("LatestVersion", {})
-                model_info = item
-                yield cls(
-                    model_name=item["ModelName"],
-                    session=session,
-                    model_info=model_info,
-                    model_version_info=model_version_info,
-                )
-            page_number += 1
+        for item in make_list_resource_iterator(
+            session.model_api.list,
+            model_name=model_name,
+            provider=model_provider,
+            task=task,
+        ):
+            model_version_info = item.pop("LatestVersion", {})
+            model_info = item
+            yield cls(
+                model_name=item["ModelName"],
+                session=session,
+                model_info=model_info,
+                model_version_info=model_version_info,
+            )
 
     def list_versions(
         self, model_version: Optional[str] = None
@@ -1476,26 +1515,17 @@ class RegisteredModel(ModelBase):
             model_version (str, optional): The version of the registered model. Default
                 to None.
         """
-        page_size = 50
-        page_number = 1
-
-        while True:
-            items = self.session.model_api.list_versions(
-                model_id=self.model_id,
-                page_number=page_number,
-                page_size=page_size,
-                version_name=model_version,
-            ).items
-            if not items:
-                break
-            for item in items:
-                yield RegisteredModel(
-                    model_name=self.model_name,
-                    session=self.session,
-                    model_info=self._model_info,
-                    model_version_info=item,
-                )
-            page_number += 1
+        for item in make_list_resource_iterator(
+            self.session.model_api.list_versions,
+            model_id=self.model_id,
+            version_name=model_version,
+        ):
+            yield RegisteredModel(
+                model_name=self.model_name,
+                session=self.session,
+                model_info=self._model_info,
+                model_version_info=item,
+            )
 
     def _generate_service_name(self) -> str:
         """Generate a service name for the online prediction service."""
@@ -1691,6 +1721,7 @@ class RegisteredModel(ModelBase):
         parameter and use the inference_spec of the RegisteredModel as default config.
         User can override the inference_spec by providing more specific arguments.
         """
+        self._check_instance_type(instance_type, resource_id=resource_id)
 
         resource_config = (
             ResourceConfig(**resource_config)
@@ -12,14 +12,145 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
 import six
 
+from pai.common.consts import DEFAULT_CACHE_DIR
 from pai.common.yaml_utils import dump as yaml_dump
 from pai.common.yaml_utils import safe_load as yaml_safe_load
 from pai.pipeline.component._base import ComponentBase, UnRegisteredComponent
 from pai.pipeline.types.spec import load_input_output_spec
 from pai.session import get_default_session
 
+logger = logging.getLogger(__name__)
+
+
+class _ManifestCache(object):
+    """A LRU cache of the parsed manifests of the registered components.
+
+    The entries are keyed by the pipeline ID, or the (identifier, provider, version)
+    tuple of the component. If the cache directory is given, the entries are also
+    persisted to the directory and reused by other processes within the TTL.
+    """
+
+    DEFAULT_DISK_TTL = 24 * 3600
+
+    def __init__(self, max_size=256, cache_dir=None, disk_ttl=None):
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.disk_ttl = disk_ttl if disk_ttl is not None else self.DEFAULT_DISK_TTL
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cache_file(self, key):
+        digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".json")
+
+    def _read_cache_file(self, key):
+        path = self._cache_file(key)
+        try:
+            if time.time() - os.path.getmtime(path) >= self.disk_ttl:
+                return
+            with open(path, "r") as f:
+                data = json.load(f)
+            return data["pipeline_id"], data["manifest"], data.get("workspace_id")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Failed to read the component manifest cache: %s", e)
+
+    def _write_cache_file(self, key, pipeline_id, manifest, workspace_id):
+        path = self._cache_file(key)
+        tmp_file = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(
+                    {
+                        "pipeline_id": pipeline_id,
+                        "manifest": manifest,
+                        "workspace_id": workspace_id,
+                    },
+                    f,
+                )
+            os.replace(tmp_file, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Failed to write the component manifest cache: %s", e)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def _remove_cache_files(self, pipeline_id):
+        """Remove the persisted entries of the pipeline, including the ones evicted
+        from the memory or written by other processes."""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, "r") as f:
+                    matched = json.load(f).get("pipeline_id") == pipeline_id
+                if matched:
+                    os.remove(path)
+            except (OSError, ValueError, AttributeError) as e:
+                logger.debug("Failed to remove the component manifest cache: %s", e)
+
+    def get(self, key):
+        """Get the (pipeline_id, manifest, workspace_id) of the key, returns None if
+        not cached.
+
+        The returned manifest is a copy, which is free to be modified.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.cache_dir:
+            entry = self._read_cache_file(key)
+            if entry is not None:
+                self._put(key, *entry)
+        if entry is None:
+            return
+        pipeline_id, manifest, workspace_id = entry
+        return pipeline_id, copy.deepcopy(manifest), workspace_id
+
+    def _put(self, key, pipeline_id, manifest, workspace_id=None):
+        with self._lock:
+            self._entries[key] = (pipeline_id, manifest, workspace_id)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def put(self, key, pipeline_id, manifest, workspace_id=None):
+        manifest = copy.deepcopy(manifest)
+        self._put(key, pipeline_id, manifest, workspace_id)
+        if self.cache_dir:
+            self._write_cache_file(key, pipeline_id, manifest, workspace_id)
+
+    def invalidate(self, pipeline_id):
+        """Drop the entries of the pipeline."""
+        with self._lock:
+            keys = [k for k, v in self._entries.items() if v[0] == pipeline_id]
+            for key in keys:
+                del self._entries[key]
+        if self.cache_dir:
+            self._remove_cache_files(pipeline_id)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
 
 class RegisteredComponent(ComponentBase):
     """RegisteredComponent represent the pipeline schema from pipeline/component.
@@ -30,6 +161,8 @@ class RegisteredComponent(ComponentBase):
 
     """
 
+    _manifest_cache = _ManifestCache()
+
     def __init__(self, pipeline_id, manifest=None, workspace_id=None):
         """Template constructor.
 
@@ -127,6 +260,14 @@ class RegisteredComponent(ComponentBase):
         session = get_default_session()
         provider = provider or session.provider
 
+        cache_key = ("identifier", session.region_id, identifier, provider, version)
+        cached = cls._manifest_cache.get(cache_key)
+        if cached:
+            pipeline_id, manifest, workspace_id = cached
+            return cls(
+                manifest=manifest, pipeline_id=pipeline_id, workspace_id=workspace_id
+            )
+
         res = session.pipeline_api.get_by_identifier(
             identifier=identifier,
             provider=provider,
@@ -145,10 +286,38 @@ class RegisteredComponent(ComponentBase):
                 )
             )
 
-        return cls(
+        component = cls(
             manifest=pipeline_info["Manifest"],
             pipeline_id=pipeline_info["PipelineId"],
         )
+        cls._manifest_cache.put(cache_key, component.pipeline_id, component.manifest)
+        return component
+
+    @classmethod
+    def configure_manifest_cache(
+        cls, max_size=256, persist=False, cache_dir=None, disk_ttl=None
+    ):
+        """Configure the cache of the manifests fetched from the pipeline service.
+
+        The parsed manifests of the registered components are cached in process,
+        so referencing the same component repeatedly does not fetch it again.
+
+        Args:
+            max_size (int): Max number of the manifests cached in process.
+            persist (bool): Whether to persist the manifests to the local disk,
+                which are reused by other processes.
+            cache_dir (str, optional): Directory of the persisted manifests,
+                default to "{DEFAULT_CACHE_DIR}/components".
+            disk_ttl (float, optional): Seconds before a persisted manifest
+                expires, default to one day.
+        """
+        if persist:
+            cache_dir = cache_dir or os.path.join(DEFAULT_CACHE_DIR, "components")
+        else:
+            cache_dir = None
+        cls._manifest_cache = _ManifestCache(
+            max_size=max_size, cache_dir=cache_dir, disk_ttl=disk_ttl
+        )
 
     @classmethod
     def list(
@@ -216,10 +385,12 @@ class RegisteredComponent(ComponentBase):
             )
 
         session.pipeline_api.update(self._pipeline_id, manifest)
+        self._manifest_cache.invalidate(self._pipeline_id)
 
     def delete(self):
         """Delete this registered component/pipeline."""
         get_default_session().pipeline_api.delete(self.pipeline_id)
+        self._manifest_cache.invalidate(self.pipeline_id)
 
     @classmethod
     def deserialize(cls, obj_dict):
@@ -259,7 +430,21 @@ class RegisteredComponent(ComponentBase):
 
         """
         session = session or get_default_session()
-        return cls.deserialize(session.pipeline_api.get_schema(pipeline_id=pipeline_id))
+        cache_key = ("id", session.region_id, pipeline_id)
+        cached = cls._manifest_cache.get(cache_key)
+        if cached:
+            _, manifest, workspace_id = cached
+            return cls(
+                manifest=manifest, pipeline_id=pipeline_id, workspace_id=workspace_id
+            )
+
+        component = cls.deserialize(
+            session.pipeline_api.get_schema(pipeline_id=pipeline_id)
+        )
+        cls._manifest_cache.put(
+            cache_key, pipeline_id, component.manifest, component._workspace_id
+        )
+        return component
 
     def save(self, identifier=None, version=None):
         raise NotImplementedError("SaveTemplate is not savable.")
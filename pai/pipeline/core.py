@@ -273,29 +273,72 @@ class Pipeline(UnRegisteredComponent):
 
     @classmethod
     def _topo_sort(cls, steps):
-        rev_depends = defaultdict(set)
+        """Sort the steps topologically with Kahn's algorithm.
+
+        Args:
+            steps: Steps in the pipeline.
+
+        Returns:
+            List[PipelineStep]: Steps sorted in the order of execution.
+
+        Raises:
+            ValueError: If the steps depend on a step out of the given steps, or a
+                cycle dependency exists in the steps.
+        """
+        steps = list(steps)
+        in_degrees = {step: 0 for step in steps}
+        rev_depends = defaultdict(list)
         for step in steps:
             for depend_step in step.depends:
-                rev_depends[depend_step].add(step)
+                if depend_step not in in_degrees:
+                    raise ValueError(
+                        "Step %s depends on step %s which is not in the pipeline"
+                        % (
+                            cls._step_display_name(step),
+                            cls._step_display_name(depend_step),
+                        )
+                    )
+                rev_depends[depend_step].append(step)
+                in_degrees[step] += 1
+
         # entry steps
-        visited_steps = [step for step in steps if not step.depends]
+        sorted_steps = [step for step in steps if not in_degrees[step]]
+        cur = 0
+        while cur < len(sorted_steps):
+            for candidate_step in rev_depends[sorted_steps[cur]]:
+                in_degrees[candidate_step] -= 1
+                if not in_degrees[candidate_step]:
+                    sorted_steps.append(candidate_step)
+            cur += 1
+
+        if len(sorted_steps) != len(steps):
+            cycle = cls._find_cycle([step for step in steps if in_degrees[step]])
+            raise ValueError(
+                "Cycle dependency detected, please check the input steps: %s"
+                % " -> ".join(cls._step_display_name(step) for step in cycle)
+            )
 
-        cur_steps = visited_steps
-        while cur_steps:
-            next_steps = []
-            for step in cur_steps:
-                for candidate_step in rev_depends[step]:
-                    if candidate_step in next_steps or candidate_step in visited_steps:
-                        continue
-                    if all(s in visited_steps for s in candidate_step.depends):
-                        next_steps.append(candidate_step)
-            visited_steps.extend(next_steps)
-            cur_steps = next_steps
+        return sorted_steps
+
+    @classmethod
+    def _find_cycle(cls, steps):
+        """Find a cycle in the steps that none of them can be sorted.
 
-        if len(visited_steps) != len(steps):
-            raise ValueError("Cycle dependency detected, please check the input steps")
+        Each of the steps depends on at least one of the steps, so walking the
+        dependencies from any step eventually reaches a step already walked.
+        """
+        remaining = set(steps)
+        path, index = [], dict()
+        step = steps[0]
+        while step not in index:
+            index[step] = len(path)
+            path.append(step)
+            step = next(s for s in step.depends if s in remaining)
+        return path[index[step] :] + [step]
 
-        return visited_steps
+    @classmethod
+    def _step_display_name(cls, step):
+        return step.name or "<unnamed:%s>" % step.gen_name_prefix()
 
     @classmethod
     def _check_steps(cls, steps):
@@ -335,22 +378,33 @@ class Pipeline(UnRegisteredComponent):
             steps: List of steps in pipeline.
         """
         used_names = set([s.name for s in steps])
-        used_names = set(used_names)
+        name_indexes = defaultdict(int)
         for step in steps:
             step.parent = self
             if not step.name:
                 step.name = self._gen_step_name(
-                    step, used_names=used_names, search_limit=len(steps)
+                    step, used_names=used_names, name_indexes=name_indexes
                 )
                 used_names.add(step.name)
 
     @classmethod
-    def _gen_step_name(cls, step, used_names, search_limit=100):
-        for i in range(search_limit):
-            candidate = "%s-%s" % (step.gen_name_prefix(), i)
-            if candidate not in used_names:
-                return candidate
-        raise ValueError("No available name for the step")
+    def _gen_step_name(cls, step, used_names, name_indexes=None):
+        """Generate a name "{prefix}-{index}" for the step that is not used.
+
+        Args:
+            step: The step to be named.
+            used_names: Names used by the steps.
+            name_indexes: Next index to probe for each of the name prefix, the index
+                below it are used. It's updated in place, so naming the steps with
+                the same prefix doesn't probe the used names again.
+        """
+        name_indexes = name_indexes if name_indexes is not None else defaultdict(int)
+        prefix = step.gen_name_prefix()
+        i = name_indexes[prefix]
+        while "%s-%s" % (prefix, i) in used_names:
+            i += 1
+        name_indexes[prefix] = i + 1
+        return "%s-%s" % (prefix, i)
 
     @property
     def ref_name(self):
@@ -51,6 +51,10 @@ class PipelineRunStatus(object):
             cls.Failed,
         ]
 
+    @classmethod
+    def is_terminal(cls, status):
+        return status == cls.Succeeded or status in cls.completed_status()
+
     @classmethod
     def is_running(cls, status):
         if status in (
@@ -93,6 +97,9 @@ class PipelineRun(object):
         self.user_id = user_id
         self.parent_user_id = parent_user_id
         self.session = session or get_default_session()
+        # Details of the DAG nodes in terminal status, reused by the incremental
+        # traversal.
+        self._terminal_node_details = dict()
 
     @classmethod
     def get(cls, run_id, session=None) -> "PipelineRun":
@@ -195,18 +202,34 @@ class PipelineRun(object):
     def __repr__(self):
         return "PipelineRun:%s" % self.run_id
 
-    def travel_node_status_info(self, node_id, max_depth=10):
-        node_status_info = dict()
+    def travel_node_status_info(
+        self, node_id, max_depth=10, max_workers=8, incremental=False
+    ):
+        """Get the status of the node and its descendants in the pipeline run.
 
-        def pipelines_travel(curr_node_id, parent=None, cur_depth=1):
-            if cur_depth > max_depth:
-                return
-            run_node_detail_info = self.session.pipeline_run_api.get_node(
-                self.run_id,
-                curr_node_id,
-                depth=2,
-            )
+        The sibling sub-DAGs are fetched concurrently level by level.
+
+        Args:
+            node_id (str): ID of the root node.
+            max_depth (int): Max depth of the DAGs to travel.
+            max_workers (int): Max number of the concurrent requests.
+            incremental (bool): If True, reuse the details of the DAG nodes which
+                were in terminal status in the previous traversal, rather than
+                fetching them again.
+
+        Returns:
+            dict: Status info of the nodes, keyed by the full name of the node.
+        """
+        node_details = self._fetch_node_details(
+            node_id,
+            max_depth=max_depth,
+            max_workers=max_workers,
+            incremental=incremental,
+        )
+        node_status_info = dict()
 
+        def pipelines_travel(curr_node_id, parent=None):
+            run_node_detail_info = node_details.get(curr_node_id)
             if (
                 not run_node_detail_info
                 or "StartedAt" not in run_node_detail_info["StatusInfo"]
@@ -233,11 +256,64 @@ class PipelineRun(object):
                 node_status_info[node_name] = self._pipeline_node_info(sub_pipeline)
                 next_node_id = sub_pipeline["Metadata"]["NodeId"]
                 if sub_pipeline["Metadata"]["NodeType"] == "Dag" and next_node_id:
-                    pipelines_travel(next_node_id, curr_root_name, cur_depth + 1)
+                    pipelines_travel(next_node_id, curr_root_name)
 
         pipelines_travel(curr_node_id=node_id)
         return node_status_info
 
+    @classmethod
+    def _sub_dag_node_ids(cls, run_node_detail_info):
+        if (
+            not run_node_detail_info
+            or "StartedAt" not in run_node_detail_info["StatusInfo"]
+        ):
+            return []
+        return [
+            sub_pipeline["Metadata"]["NodeId"]
+            for sub_pipeline in run_node_detail_info["Spec"].get("Pipelines", [])
+            if sub_pipeline["Metadata"]["NodeType"] == "Dag"
+            and sub_pipeline["Metadata"]["NodeId"]
+        ]
+
+    def _fetch_node_details(self, node_id, max_depth, max_workers, incremental):
+        """Fetch the details of the DAG nodes breadth first, the nodes of a level
+        are fetched concurrently."""
+
+        def get_node(curr_node_id):
+            if incremental and curr_node_id in self._terminal_node_details:
+                return self._terminal_node_details[curr_node_id]
+            detail = self.session.pipeline_run_api.get_node(
+                self.run_id,
+                curr_node_id,
+                depth=2,
+            )
+            if detail and PipelineRunStatus.is_terminal(
+                detail["StatusInfo"].get("Status")
+            ):
+                self._terminal_node_details[curr_node_id] = detail
+            return detail
+
+        node_details = dict()
+        level = [node_id]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in range(max_depth):
+                if not level:
+                    break
+                if len(level) == 1:
+                    details = [get_node(level[0])]
+                else:
+                    details = list(executor.map(get_node, level))
+                next_level = []
+                for curr_node_id, detail in zip(level, details):
+                    node_details[curr_node_id] = detail
+                    next_level.extend(
+                        child
+                        for child in self._sub_dag_node_ids(detail)
+                        if child not in node_details
+                    )
+                level = next_level
+        return node_details
+
     @staticmethod
     def _pipeline_node_info(pipeline_info):
         return {
@@ -350,7 +426,9 @@ class PipelineRun(object):
             root_node_status = run_status
             log_runners = []
             while PipelineRunStatus.is_running(root_node_status):
-                curr_status_infos = self.travel_node_status_info(node_id)
+                curr_status_infos = self.travel_node_status_info(
+                    node_id, incremental=True
+                )
                 for node_fullname, status_info in curr_status_infos.items():
                     if (
                         node_fullname not in prev_status_infos
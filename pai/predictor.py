@@ -18,19 +18,48 @@ import functools
 import json
 import logging
 import posixpath
+import queue
+import random
+import socket
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from concurrent.futures import Future, ThreadPoolExecutor
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait as wait_futures
 from io import IOBase
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
-from urllib.parse import urlencode
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode, urlparse
 
-import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.retry import Retry
 
+from .api.base import PAIRestResourceTypes
 from .common.consts import FrameworkTypes
 from .common.docker_utils import ContainerRun
-from .common.utils import http_user_agent
+from .common.utils import (
+    BackoffStrategy,
+    LazyModule,
+    http_user_agent,
+    make_backoff_intervals,
+    set_future,
+)
 from .exception import PredictionException
 from .serializers import (
     JsonSerializer,
@@ -39,9 +68,13 @@ from .serializers import (
     TensorFlowSerializer,
 )
 from .session import Session, get_default_session
+from .watcher import WAIT_MAX_INTERVAL, wait_watch
 
 logger = logging.getLogger(__name__)
 
+# aiohttp is only required by the async prediction methods.
+aiohttp = LazyModule("aiohttp")
+
 _PAI_SERVICE_CONSOLE_URI_PATTERN = (
     "https://pai.console.aliyun.com/?regionId={region_id}#"
     "/eas/serviceDetail/{service_name}/detail"
@@ -130,6 +163,206 @@ class RawResponse(object):
         return json.loads(self.content)
 
 
+class ConnectionConfig(object):
+    """ConnectionConfig is used to configure the connection pool and the retry policy
+    of the requests made by the sync prediction methods, such as `predict` and
+    `raw_predict`.
+
+    Examples::
+
+        # Share a predictor across 64 threads: keep up to 64 connections, wait for a
+        # free connection rather than opening a discarded one, and retry the
+        # idempotent requests on connection errors and 5xx/429 responses.
+        predictor = Predictor(
+            service_name="example_service",
+            connection_config=ConnectionConfig(
+                pool_maxsize=64, pool_block=True, max_retries=3
+            ),
+        )
+
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        max_retries: int = 0,
+        retry_backoff_factor: float = 0.5,
+        retry_status_codes: Optional[List[int]] = None,
+        retry_methods: Optional[List[str]] = None,
+        tcp_keepalive: bool = True,
+        keepalive_idle: int = 60,
+        keepalive_interval: int = 10,
+        keepalive_count: int = 6,
+    ):
+        """ConnectionConfig initializer.
+
+        Args:
+            pool_connections (int): The number of connection pools to cache, one pool
+                for each host (Default 10).
+            pool_maxsize (int): The maximum number of connections kept in a pool,
+                which should be no less than the number of the threads that make
+                the requests concurrently (Default 32).
+            pool_block (bool): Whether to block and wait for a free connection once
+                the pool is exhausted, otherwise a new connection is opened and is
+                discarded after used (Default False).
+            max_retries (int): The maximum number of retries of a request, 0 means no
+                retry (Default 0).
+            retry_backoff_factor (float): The retries sleep for
+                `retry_backoff_factor * 2 ** (retry_number - 1)` seconds
+                (Default 0.5).
+            retry_status_codes (List[int], optional): Response status codes to retry
+                on, default to 429, 500, 502, 503 and 504.
+            retry_methods (List[str], optional): Methods that are retried on the read
+                errors and the retry status codes, default to the idempotent methods.
+                Requests failed to connect are retried regardless of the method.
+            tcp_keepalive (bool): Whether to enable TCP keep-alive on the connections,
+                which stops the idle pooled connections from being dropped silently
+                by the NAT gateways and load balancers (Default True).
+            keepalive_idle (int): Seconds of idle before the keep-alive probes are
+                sent (Default 60).
+            keepalive_interval (int): Seconds between the keep-alive probes
+                (Default 10).
+            keepalive_count (int): The number of unacknowledged probes before the
+                connection is dropped (Default 6).
+        """
+        if pool_connections <= 0 or pool_maxsize <= 0:
+            raise ValueError("Connection pool size must be positive integer.")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative integer.")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self.retry_status_codes = (
+            retry_status_codes
+            if retry_status_codes is not None
+            else [429, 500, 502, 503, 504]
+        )
+        self.retry_methods = (
+            retry_methods
+            if retry_methods is not None
+            else ["DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"]
+        )
+        self.tcp_keepalive = tcp_keepalive
+        self.keepalive_idle = keepalive_idle
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_count = keepalive_count
+
+    def _make_retry(self) -> Retry:
+        kwargs = dict(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            # Return the last response rather than raise after the retries.
+            raise_on_status=False,
+        )
+        try:
+            return Retry(allowed_methods=self.retry_methods, **kwargs)
+        except TypeError:
+            # urllib3 < 1.26
+            return Retry(method_whitelist=self.retry_methods, **kwargs)
+
+    def _socket_options(self) -> Optional[List[Tuple[int, int, int]]]:
+        if not self.tcp_keepalive:
+            return
+        options = list(HTTPConnection.default_socket_options)
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # The keep-alive probes are tunable on Linux only.
+        for name, value in [
+            ("TCP_KEEPIDLE", self.keepalive_idle),
+            ("TCP_KEEPINTVL", self.keepalive_interval),
+            ("TCP_KEEPCNT", self.keepalive_count),
+        ]:
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+    def make_adapter(self) -> HTTPAdapter:
+        """Make a requests HTTPAdapter using the connection pool config."""
+        return _HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self._make_retry(),
+            socket_options=self._socket_options(),
+        )
+
+
+class _HTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sets the socket options of the pooled connections."""
+
+    def __init__(self, socket_options=None, **kwargs):
+        # Set before the super initializer, which makes the pool manager.
+        self.socket_options = socket_options
+        super(_HTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+        super(_HTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+class AsyncConnectionConfig(object):
+    """AsyncConnectionConfig is used to configure the connection pool used by the
+    async prediction methods, such as `predict_async` and `raw_predict_async`."""
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30,
+        ttl_dns_cache: Optional[int] = 300,
+    ):
+        """AsyncConnectionConfig initializer.
+
+        Args:
+            limit (int): The maximum number of simultaneous connections in the pool,
+                0 means no limit (Default 100).
+            limit_per_host (int): The maximum number of simultaneous connections to
+                the same endpoint, 0 means no limit (Default 0).
+            keepalive_timeout (float): Seconds to keep an idle connection alive in
+                the pool for reuse (Default 30).
+            ttl_dns_cache (int, optional): Seconds to cache the resolved DNS records,
+                None means caching forever (Default 300).
+        """
+        if limit < 0 or limit_per_host < 0:
+            raise ValueError("Connection limit must be non-negative integer.")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+
+    def make_client_session(self) -> "aiohttp.ClientSession":
+        """Make an aiohttp ClientSession using the connection pool config."""
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+
+async def _close_on_loop_shutdown(session: "aiohttp.ClientSession"):
+    """An async generator that closes the given session when it is finalized.
+
+    The event loop calls `aclose` on all alive async generators when it shuts down
+    (e.g. at the end of `asyncio.run`), which makes sure the connection pool bound
+    to the event loop is released along with it.
+    """
+    try:
+        yield
+    finally:
+        await session.close()
+
+
 class _ServicePredictorMixin(object):
     def __init__(
         self,
@@ -137,13 +370,27 @@ class _ServicePredictorMixin(object):
         session: Optional[Session] = None,
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
+        async_connection_config: Optional[AsyncConnectionConfig] = None,
+        connection_config: Optional[ConnectionConfig] = None,
     ):
         self.service_name = service_name
         self.session = session or get_default_session()
         self._service_api_object = self.describe_service()
         self.endpoint_type = endpoint_type
         self.serializer = serializer or self._get_default_serializer()
-        self._request_session = requests.Session()
+        self.connection_config = connection_config or ConnectionConfig()
+        # requests.Session is not guaranteed to be thread-safe, each thread uses its
+        # own session while the connection pool of the adapter is shared.
+        self._request_adapter = self.connection_config.make_adapter()
+        self._local = threading.local()
+        self.async_connection_config = (
+            async_connection_config or AsyncConnectionConfig()
+        )
+        # aiohttp.ClientSession is bound to the event loop it was created in, the
+        # pooled sessions are kept per event loop.
+        self._async_sessions: Dict[
+            asyncio.AbstractEventLoop, Tuple["aiohttp.ClientSession", Any]
+        ] = dict()
 
     def __repr__(self):
         return "{}(service_name={}, endpoint_type={})".format(
@@ -153,7 +400,50 @@ class _ServicePredictorMixin(object):
         )
 
     def __del__(self):
-        self._request_session.close()
+        if getattr(self, "_request_adapter", None):
+            self._request_adapter.close()
+
+    @property
+    def _request_session(self) -> requests.Session:
+        """The requests.Session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self._request_adapter)
+            session.mount("https://", self._request_adapter)
+            self._local.session = session
+        return session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connection pool used by the async prediction methods in the
+        current event loop."""
+        entry = self._async_sessions.pop(asyncio.get_event_loop(), None)
+        if entry:
+            _, closer = entry
+            await closer.aclose()
+
+    async def _get_async_session(self) -> "aiohttp.ClientSession":
+        """Get the pooled aiohttp ClientSession bound to the current event loop."""
+        loop = asyncio.get_event_loop()
+        entry = self._async_sessions.get(loop)
+        if entry and not entry[0].closed:
+            return entry[0]
+
+        # Sessions bound to closed event loops could not be reused.
+        for closed_loop in [lp for lp in self._async_sessions if lp.is_closed()]:
+            self._async_sessions.pop(closed_loop, None)
+
+        session = self.async_connection_config.make_client_session()
+        closer = _close_on_loop_shutdown(session)
+        await closer.__anext__()
+        self._async_sessions[loop] = (session, closer)
+        return session
 
     def refresh(self):
         self._service_api_object = self.describe_service()
@@ -296,8 +586,13 @@ class _ServicePredictorMixin(object):
         """Delete the service."""
         self.session.service_api.delete(name=self.service_name)
 
-    def wait_for_ready(self):
-        """Wait until the service enter running status."""
+    def wait_for_ready(self, wait_config: Optional["WaitConfig"] = None):
+        """Wait until the service enter running status.
+
+        Args:
+            wait_config (WaitConfig, optional): A config object that controls the
+                polling interval and the timeout of waiting for the service.
+        """
         logger.info(
             "Service waiting for ready: service_name={}".format(self.service_name)
         )
@@ -309,6 +604,7 @@ class _ServicePredictorMixin(object):
             status=ServiceStatus.Running,
             unexpected_status=unexpected_status,
             session=self.session,
+            wait_config=wait_config,
         )
         self.refresh()
 
@@ -320,19 +616,14 @@ class _ServicePredictorMixin(object):
         unexpected_status: List[str],
         interval: int = 3,
         session: Optional[Session] = None,
+        wait_config: Optional["WaitConfig"] = None,
     ):
         session = session or get_default_session()
-        service_api_object = session.service_api.get(service_name)
-        last_status = service_api_object["Status"]
-        last_msg = service_api_object["Message"]
-        time.sleep(interval)
 
-        while True:
-            service_api_object = session.service_api.get(service_name)
-            # Check the service status
+        def is_done(service_api_object: Dict[str, Any]) -> bool:
             cur_status = service_api_object["Status"]
             if cur_status == status:
-                return status
+                return True
             elif unexpected_status and cur_status in unexpected_status:
                 # Unexpected terminated status
                 raise RuntimeError(
@@ -342,26 +633,50 @@ class _ServicePredictorMixin(object):
                     f"reason={service_api_object['Reason']} "
                     f"message={service_api_object['Message']}."
                 )
-            elif (
-                last_status == cur_status and service_api_object["Message"] == last_msg
-            ) and cur_status != ServiceStatus.Waiting:
-                # If service.status and service.message have not changed and
-                # service.status is not 'Waiting', do not print the service
-                # status/message.
-                pass
-            else:
-                logger.info(
-                    f"Refresh Service status: "
-                    f"name={service_api_object['ServiceName']} "
-                    f"id={service_api_object['ServiceId']} "
-                    f"status={service_api_object['Status']} "
-                    f"reason={service_api_object['Reason']} "
-                    f"message={service_api_object['Message']}."
-                )
+            return False
+
+        last_status = [None]
+
+        def on_change(service_api_object: Dict[str, Any]):
+            last_status[0] = service_api_object["Status"]
+            logger.info(
+                f"Refresh Service status: "
+                f"name={service_api_object['ServiceName']} "
+                f"id={service_api_object['ServiceId']} "
+                f"status={service_api_object['Status']} "
+                f"reason={service_api_object['Reason']} "
+                f"message={service_api_object['Message']}."
+            )
 
-            last_status = service_api_object["Status"]
-            last_msg = service_api_object["Message"]
-            time.sleep(interval)
+        def on_waiting(elapsed: float):
+            logger.info(
+                f"Still waiting for the service: name={service_name} "
+                f"status={last_status[0]} elapsed={elapsed:.0f}s."
+            )
+
+        # The service status is polled by the watcher shared in the session, the
+        # first poll is delayed for the status change after the operation. The
+        # interval is capped low as the caller is blocked on the wait.
+        future = session.watcher.watch(
+            PAIRestResourceTypes.Service,
+            service_name,
+            is_done=is_done,
+            on_change=on_change,
+            interval=interval,
+            max_interval=WAIT_MAX_INTERVAL,
+            delay=interval,
+            schedule=wait_config.intervals if wait_config else None,
+        )
+        timeout = wait_config.total_timeout if wait_config else None
+        try:
+            wait_watch(future, timeout=timeout, on_waiting=on_waiting)
+        except FutureTimeoutError:
+            future.cancel()
+            raise RuntimeError(
+                f"Waiting for the service timeout: name={service_name} "
+                f"status={status} total_time={timeout}"
+            )
+        return status
 
     def switch_version(self, version: int):
         """Switch service to target version.
@@ -438,9 +753,12 @@ class _ServicePredictorMixin(object):
         return p
 
     def _build_url(
-        self, path: Optional[str] = None, params: Dict[str, str] = None
+        self,
+        path: Optional[str] = None,
+        params: Dict[str, str] = None,
+        endpoint: Optional[str] = None,
     ) -> str:
-        url = self.endpoint
+        url = endpoint or self.endpoint
         if path:
             if path.startswith("/"):
                 path = path[1:]
@@ -485,9 +803,10 @@ class _ServicePredictorMixin(object):
         json=None,
         headers=None,
         params=None,
+        endpoint=None,
         **kwargs,
     ):
-        url = self._build_url(path)
+        url = self._build_url(path, endpoint=endpoint)
         resp = self._request_session.request(
             url=url,
             json=json,
@@ -511,15 +830,328 @@ class _ServicePredictorMixin(object):
     ):
         url = self._build_url(path=path, params=params)
         headers = self._build_headers(headers)
-        async with aiohttp.ClientSession() as session:
-            return await session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=data,
-                json=json,
-                **kwargs,
+        session = await self._get_async_session()
+        return await session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            data=data,
+            json=json,
+            **kwargs,
+        )
+
+
+class BatchingConfig(object):
+    """BatchingConfig is used to enable client-side batching for the predictor.
+
+    With client-side batching enabled, the concurrent `predict` calls of the predictor
+    are collected and merged into one prediction request, the prediction result of the
+    request is split and returned to each of the calls.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 32,
+        max_latency_ms: float = 5,
+        max_concurrency: int = 4,
+    ):
+        """BatchingConfig initializer.
+
+        Args:
+            max_batch_size (int): The maximum number of prediction calls merged into
+                one prediction request (Default 32).
+            max_latency_ms (float): The maximum time in milliseconds to wait for more
+                prediction calls after the first call of a batch arrives (Default 5).
+            max_concurrency (int): The maximum number of batched prediction requests
+                in flight (Default 4).
+        """
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be positive integer.")
+        if max_latency_ms < 0:
+            raise ValueError("max_latency_ms must be non-negative.")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive integer.")
+        self.max_batch_size = max_batch_size
+        self.max_latency_ms = max_latency_ms
+        self.max_concurrency = max_concurrency
+
+
+def _supports_batching(serializer: Optional[SerializerBase]) -> bool:
+    """Returns True if the serializer implements `merge_batch` and `split_batch`."""
+    for name in ("merge_batch", "split_batch"):
+        method = getattr(type(serializer), name, None)
+        if method is None or method is getattr(SerializerBase, name):
+            return False
+    return True
+
+
+class _PredictionBatcher(object):
+    """Collect the prediction calls and dispatch them in batches."""
+
+    def __init__(
+        self,
+        predict_batch_fn: Callable[[List[Any]], List[Any]],
+        config: BatchingConfig,
+    ):
+        # Hold a weak reference to the predictor method, so that the background
+        # thread does not keep the predictor alive.
+        self._predict_batch_fn = weakref.WeakMethod(predict_batch_fn)
+        self.config = config
+        self._queue = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=config.max_concurrency)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, data) -> Future:
+        future = Future()
+        self._queue.put((data, future))
+        return future
+
+    def close(self):
+        """Stop collecting the prediction calls, the pending calls are still
+        dispatched."""
+        self._queue.put(None)
+
+    def _run(self):
+        stopped = False
+        while not stopped:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.config.max_latency_ms / 1000
+            while len(batch) < self.config.max_batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopped = True
+                    break
+                batch.append(item)
+            self._executor.submit(self._dispatch, batch)
+        self._executor.shutdown(wait=False)
+
+    def _dispatch(self, batch: List[Tuple[Any, Future]]):
+        batch = [
+            (data, fut) for data, fut in batch if fut.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+        try:
+            predict_batch_fn = self._predict_batch_fn()
+            if not predict_batch_fn:
+                raise RuntimeError("The predictor of the batch has been deleted.")
+            results = list(predict_batch_fn([data for data, _ in batch]))
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    "The number of the results does not match the batch: "
+                    f"batch_size={len(batch)} results={len(results)}"
+                )
+        except Exception as e:
+            for _, fut in batch:
+                fut.set_exception(e)
+        else:
+            for (_, fut), result in zip(batch, results):
+                fut.set_result(result)
+
+
+class LoadBalancingStrategy(object):
+    """Strategies of choosing the service instance for a request."""
+
+    # Choose the instance with the least outstanding requests.
+    LeastOutstanding = "least_outstanding"
+    # Choose the one with less outstanding requests of two random instances.
+    PowerOfTwoChoices = "power_of_two_choices"
+
+    @classmethod
+    def supported(cls):
+        return [cls.LeastOutstanding, cls.PowerOfTwoChoices]
+
+
+class LoadBalancingConfig(object):
+    """LoadBalancingConfig is used to enable the client-side load balancing of the
+    predictor.
+
+    With the client-side load balancing enabled, the predictor discovers the
+    instances of the service and sends the requests to the instances directly,
+    rather than through the gateway of the endpoint. It requires the client to be
+    able to reach the instances, such as in the VPC of the service.
+
+    The instances failed to serve the requests are ejected for a while, and the
+    requests are sent through the gateway if there is no available instance. A
+    request failed to connect to an instance is retried once on another instance,
+    or through the gateway.
+    """
+
+    def __init__(
+        self,
+        strategy: str = LoadBalancingStrategy.LeastOutstanding,
+        refresh_interval: float = 30,
+        max_failures: int = 3,
+        eject_duration: float = 30,
+        failure_statuses: Optional[List[int]] = None,
+    ):
+        """LoadBalancingConfig initializer.
+
+        Args:
+            strategy (str): Strategy of choosing the instance for a request, one of
+                "least_outstanding" and "power_of_two_choices"
+                (Default "least_outstanding").
+            refresh_interval (float): Interval in seconds of refreshing the
+                instances of the service in the background (Default 30).
+            max_failures (int): An instance is ejected after the number of
+                consecutive failed requests (Default 3).
+            eject_duration (float): Seconds an ejected instance is not chosen
+                (Default 30).
+            failure_statuses (List[int], optional): Response status codes that count as
+                the failures of the instance, default to 502, 503 and 504.
+        """
+        if strategy not in LoadBalancingStrategy.supported():
+            raise ValueError(f"Unsupported load balancing strategy: {strategy}")
+        if refresh_interval <= 0:
+            raise ValueError("refresh_interval must be positive.")
+        if max_failures <= 0:
+            raise ValueError("max_failures must be positive integer.")
+        self.strategy = strategy
+        self.refresh_interval = refresh_interval
+        self.max_failures = max_failures
+        self.eject_duration = eject_duration
+        self.failure_statuses = (
+            failure_statuses if failure_statuses is not None else [502, 503, 504]
+        )
+
+
+def _is_connect_error(e: requests.exceptions.ConnectionError) -> bool:
+    """Whether the request failed to connect, i.e. it's not sent to the server."""
+    if isinstance(e, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(e.args[0] if e.args else None, "reason", None)
+    # NewConnectionError, such as connection refused, is a ConnectTimeoutError.
+    return isinstance(reason, ConnectTimeoutError)
+
+
+class _ServiceInstance(object):
+    """An instance of the service that requests are sent to directly."""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+    def __repr__(self):
+        return "_ServiceInstance(endpoint={}, outstanding={})".format(
+            self.endpoint, self.outstanding
+        )
+
+
+class _InstanceBalancer(object):
+    """Discover the instances of the service and balance the requests across them.
+
+    The instances are listed on the first request, and refreshed by a background
+    thread afterwards.
+    """
+
+    def __init__(
+        self,
+        list_endpoints_fn: Callable[[], List[str]],
+        config: LoadBalancingConfig,
+    ):
+        # Hold a weak reference to the predictor method, so that the background
+        # thread does not keep the predictor alive.
+        self._list_endpoints_fn = weakref.WeakMethod(list_endpoints_fn)
+        self.config = config
+        self._instances: Dict[str, _ServiceInstance] = dict()
+        self._lock = threading.Lock()
+        self._refreshed = False
+        self._closed = threading.Event()
+        self._thread = None
+
+    @property
+    def instances(self) -> List[_ServiceInstance]:
+        with self._lock:
+            return list(self._instances.values())
+
+    def acquire(
+        self, exclude: Optional[_ServiceInstance] = None
+    ) -> Optional[_ServiceInstance]:
+        """Choose an instance other than the excluded one for a request, returns None
+        if there is no available instance."""
+        if not self._refreshed:
+            self._start()
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                inst
+                for inst in self._instances.values()
+                if inst.ejected_until <= now and inst is not exclude
+            ]
+            if not candidates:
+                return
+            if self.config.strategy == LoadBalancingStrategy.PowerOfTwoChoices:
+                candidates = random.sample(candidates, min(len(candidates), 2))
+            # Ties are broken randomly, or the first instance takes all the requests
+            # when the predictor is idle.
+            instance = min(
+                candidates, key=lambda inst: (inst.outstanding, random.random())
             )
+            instance.outstanding += 1
+        return instance
+
+    def release(self, instance: _ServiceInstance, failed: bool = False):
+        """Release the instance after the request is done."""
+        with self._lock:
+            instance.outstanding -= 1
+            if not failed:
+                instance.failures = 0
+                return
+            instance.failures += 1
+            if instance.failures >= self.config.max_failures:
+                logger.warning(
+                    "Eject the service instance for %s seconds: endpoint=%s",
+                    self.config.eject_duration,
+                    instance.endpoint,
+                )
+                instance.failures = 0
+                instance.ejected_until = time.monotonic() + self.config.eject_duration
+
+    def close(self):
+        self._closed.set()
+
+    def refresh(self):
+        list_endpoints_fn = self._list_endpoints_fn()
+        if not list_endpoints_fn:
+            self.close()
+            return
+        endpoints = list_endpoints_fn()
+        del list_endpoints_fn
+        with self._lock:
+            # The state of the known instances is kept.
+            self._instances = {
+                endpoint: self._instances.get(endpoint) or _ServiceInstance(endpoint)
+                for endpoint in endpoints
+            }
+
+    def _start(self):
+        with self._lock:
+            if self._thread:
+                return
+            self._thread = threading.Thread(target=self._run, daemon=True)
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning("Failed to list the instances of the service: %s", e)
+        finally:
+            self._refreshed = True
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed.wait(self.config.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.debug("Failed to refresh the instances of the service: %s", e)
 
 
 class Predictor(PredictorBase, _ServicePredictorMixin):
@@ -540,6 +1172,14 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         result = torch_predictor.predict(numpy.asarray([[22,33,44], [19,22,33]]))
         assert isinstance(result, numpy.ndarray)
 
+        # Merge the concurrent prediction calls from multiple threads into batched
+        # prediction requests.
+        batching_predictor = Predictor(
+            service_name="example_torch_service",
+            batching_config=BatchingConfig(max_batch_size=16, max_latency_ms=5),
+        )
+        result = batching_predictor.predict(numpy.asarray([[22,33,44]]))
+
     """
 
     def __init__(
@@ -548,6 +1188,9 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
         session: Optional[Session] = None,
+        batching_config: Optional[BatchingConfig] = None,
+        connection_config: Optional[ConnectionConfig] = None,
+        load_balancing_config: Optional[LoadBalancingConfig] = None,
     ):
         """Construct a `Predictor` object using an existing prediction service.
 
@@ -562,14 +1205,102 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
                 response data to Python object.
             session (Session, optional): A PAI session object used for communicating
                 with PAI service.
+            batching_config (BatchingConfig, optional): If provided, the concurrent
+                `predict` calls are merged into batched prediction requests, which
+                requires the serializer supports `merge_batch` and `split_batch`.
+            connection_config (ConnectionConfig, optional): Config of the connection
+                pool and the retry policy of the requests. The predictor is safe to be
+                shared by the threads making the `predict` calls concurrently.
+            load_balancing_config (LoadBalancingConfig, optional): If provided, the
+                requests are sent to the instances of the service directly and
+                balanced by the client, rather than through the gateway of the
+                endpoint.
         """
         super(Predictor, self).__init__(
             service_name=service_name,
             session=session or get_default_session(),
             endpoint_type=endpoint_type,
             serializer=serializer,
+            connection_config=connection_config,
+        )
+        if batching_config and not _supports_batching(self.serializer):
+            raise ValueError(
+                "Client-side batching requires a serializer supports `merge_batch`"
+                f" and `split_batch`: serializer={type(self.serializer).__name__}"
+            )
+        self._balancer = (
+            _InstanceBalancer(self._list_instance_endpoints, load_balancing_config)
+            if load_balancing_config
+            else None
         )
         self._check()
+        self._batcher = (
+            _PredictionBatcher(self._predict_batch, config=batching_config)
+            if batching_config
+            else None
+        )
+
+    def __del__(self):
+        if getattr(self, "_batcher", None):
+            self._batcher.close()
+        if getattr(self, "_balancer", None):
+            self._balancer.close()
+        super(Predictor, self).__del__()
+
+    def _list_instance_endpoints(self) -> List[str]:
+        """List the endpoints of the running instances of the service."""
+        # The instances serve the requests under the same path as the gateway.
+        path = urlparse(self.endpoint).path
+        endpoints = []
+        page_number, page_size = 1, 100
+        while True:
+            result = self.session.service_api.list_instances(
+                self.service_name, page_number=page_number, page_size=page_size
+            )
+            for instance in result.items:
+                if instance.get("Status") != "Running" or not instance.get("InnerIP"):
+                    continue
+                endpoints.append(
+                    "http://{}:{}{}".format(
+                        instance["InnerIP"], instance["InstancePort"], path
+                    )
+                )
+            if len(result.items) < page_size:
+                return endpoints
+            page_number += 1
+
+    def _send_request(self, *args, **kwargs):
+        instance = self._balancer.acquire() if self._balancer else None
+        if not instance:
+            return super(Predictor, self)._send_request(*args, **kwargs)
+        try:
+            return self._send_to_instance(instance, *args, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            if not _is_connect_error(e):
+                raise
+            logger.debug("Failed to connect to instance %s: %s", instance.endpoint, e)
+        # The request is not sent, retry once on another instance or the gateway.
+        instance = self._balancer.acquire(exclude=instance)
+        if not instance:
+            return super(Predictor, self)._send_request(*args, **kwargs)
+        return self._send_to_instance(instance, *args, **kwargs)
+
+    def _send_to_instance(self, instance: _ServiceInstance, *args, **kwargs):
+        try:
+            resp = super(Predictor, self)._send_request(
+                *args, endpoint=instance.endpoint, **kwargs
+            )
+        except requests.exceptions.ConnectionError:
+            self._balancer.release(instance, failed=True)
+            raise
+        except Exception:
+            # Failures not caused by the instance, such as the invalid input.
+            self._balancer.release(instance)
+            raise
+        self._balancer.release(
+            instance, failed=resp.status_code in self._balancer.config.failure_statuses
+        )
+        return resp
 
     def _check(self):
         config = json.loads(self._service_api_object["ServiceConfig"])
@@ -601,6 +1332,11 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
                 not equal 2xx.
         """
         self._post_init_serializer()
+        if self._batcher:
+            return self._batcher.submit(data).result()
+        return self._predict(data)
+
+    def _predict(self, data):
         data = self._handle_input(data)
         resp = self._send_request(
             data,
@@ -611,6 +1347,15 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
             resp.content,
         )
 
+    def _predict_batch(self, data_list: List[Any]) -> List[Any]:
+        """Make a prediction with the input data of multiple calls merged into one
+        batch, returns the prediction results of the calls."""
+        if not self.serializer:
+            raise RuntimeError("Client-side batching requires a serializer.")
+        data, batch_sizes = self.serializer.merge_batch(data_list)
+        result = self._predict(data)
+        return self.serializer.split_batch(result, batch_sizes)
+
     def raw_predict(
         self,
         data: Any = None,
@@ -664,13 +1409,359 @@ class Predictor(PredictorBase, _ServicePredictorMixin):
 
 class WaitConfig(object):
     """WaitConfig is used to set polling configurations for waiting for asynchronous
-    requests to complete."""
+    requests to complete.
+
+    By default, the result is polled with a fixed interval. With a backoff strategy,
+    the interval grows from the min_interval to the max_interval, so the short
+    requests are seen early while the long ones are not polled too often.
+
+    Examples::
+
+        # Poll after 0.5s, 1s, 2s, ... at most every 10s, and give up after 5 minutes.
+        wait_config = WaitConfig(
+            backoff=BackoffStrategy.Exponential,
+            min_interval=0.5,
+            max_interval=10,
+            jitter=0.1,
+            timeout=300,
+        )
+        result = await async_predictor.predict_async(data, wait_config=wait_config)
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 0,
+        interval: float = 5,
+        backoff: str = BackoffStrategy.Fixed,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.0,
+        timeout: Optional[float] = None,
+        use_latency_hint: bool = False,
+    ):
+        """WaitConfig initializer.
 
-    def __init__(self, max_attempts: int = 0, interval: int = 5):
+        Args:
+            max_attempts (int): The maximum number of polls, 0 or negative means no
+                limit (Default 0).
+            interval (float): Interval in seconds between the polls for the fixed
+                backoff (Default 5).
+            backoff (str): Backoff strategy of the interval, one of "fixed",
+                "exponential" and "fibonacci" (Default "fixed").
+            min_interval (float, optional): The first interval of the backoff,
+                default to the interval.
+            max_interval (float, optional): The cap of the interval, default to
+                12 times the min_interval for the exponential and fibonacci backoff.
+            backoff_factor (float): Factor the interval grows by for the exponential
+                backoff (Default 2.0).
+            jitter (float): Each interval is randomized by the ratio of jitter
+                (Default 0).
+            timeout (float, optional): Total seconds to wait for the result.
+            use_latency_hint (bool): Whether to seed the first interval with the
+                completion time recently observed for the service.
+        """
         if interval <= 0:
-            raise ValueError("interval must be positive integer.")
+            raise ValueError("interval must be positive number.")
+        if backoff not in BackoffStrategy.supported():
+            raise ValueError(f"Unsupported backoff strategy: {backoff}")
+        if min_interval is not None and min_interval <= 0:
+            raise ValueError("min_interval must be positive.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in range [0, 1).")
         self.max_attempts = max_attempts
         self.interval = interval
+        self.backoff = backoff
+        self.min_interval = min_interval if min_interval is not None else interval
+        if max_interval is None and backoff != BackoffStrategy.Fixed:
+            max_interval = self.min_interval * 12
+        if max_interval is not None and max_interval < self.min_interval:
+            raise ValueError("max_interval must be no less than min_interval.")
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.timeout = timeout
+        self.use_latency_hint = use_latency_hint
+
+    def intervals(self, latency_hint: Optional[float] = None) -> Iterator[float]:
+        """Returns an iterator of the intervals between the polls.
+
+        Args:
+            latency_hint (float, optional): Recently observed completion time of the
+                requests, used as the first interval if use_latency_hint is True.
+        """
+        return make_backoff_intervals(
+            min_interval=self.min_interval,
+            max_interval=self.max_interval,
+            strategy=self.backoff,
+            factor=self.backoff_factor,
+            jitter=self.jitter,
+            seed=latency_hint if self.use_latency_hint else None,
+        )
+
+    @property
+    def total_timeout(self) -> Optional[float]:
+        """Total seconds to wait for the result, None means no limit."""
+        if self.timeout is not None:
+            return self.timeout
+        if self.max_attempts > 0 and self.backoff == BackoffStrategy.Fixed:
+            return self.max_attempts * self.interval
+        return None
+
+
+class _LatencyTracker(object):
+    """Track the recently observed completion time of the requests."""
+
+    def __init__(self, window: int = 32):
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float):
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hint(self) -> Optional[float]:
+        """The median of the recent completion time, None if nothing observed."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if not latencies:
+            return
+        return latencies[len(latencies) // 2]
+
+
+class _PollSchedule(object):
+    """Schedule of the polls of a request, built from the WaitConfig."""
+
+    def __init__(self, wait_config: WaitConfig, latency_hint: Optional[float] = None):
+        self.wait_config = wait_config
+        self.start = time.monotonic()
+        timeout = wait_config.total_timeout
+        self._deadline = self.start + timeout if timeout is not None else None
+        self._intervals = wait_config.intervals(latency_hint)
+        # if max_attempts is negative or zero, then wait forever
+        self._attempts = (
+            -1 if wait_config.max_attempts <= 0 else wait_config.max_attempts
+        )
+
+    def next_attempt(self) -> bool:
+        """Returns True if another poll is allowed."""
+        if self._attempts == 0:
+            return False
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            return False
+        self._attempts -= 1
+        return True
+
+    def next_interval(self) -> float:
+        """Returns the seconds to wait before the next poll."""
+        interval = next(self._intervals)
+        if self._deadline is not None:
+            interval = min(interval, max(self._deadline - time.monotonic(), 0))
+        return interval
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.start
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Seconds before the deadline, None if there is no deadline."""
+        if self._deadline is None:
+            return
+        return max(self._deadline - time.monotonic(), 0)
+
+
+class ResultSubscriptionConfig(object):
+    """ResultSubscriptionConfig is used to enable the result subscription for the
+    AsyncPredictor.
+
+    With the result subscription enabled, rather than polling the result of each
+    request separately, the predictor reads the results from the sink of the queue
+    service in bulk, and dispatches them to the waiting prediction calls.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        long_poll_timeout: float = 5,
+        poll_interval: float = 0.2,
+        fallback_interval: float = 10,
+        max_unclaimed: int = 10000,
+    ):
+        """ResultSubscriptionConfig initializer.
+
+        Args:
+            batch_size (int): The maximum number of results read from the sink per
+                request (Default 64).
+            long_poll_timeout (float): Seconds the queue service holds a read
+                request while there is no new result (Default 5).
+            poll_interval (float): The minimum interval in seconds between two reads
+                if no new result is read (Default 0.2).
+            fallback_interval (float): Interval in seconds to get the result of a
+                waiting request by its request ID, in case the result is missed
+                by the bulk reads (Default 10).
+            max_unclaimed (int): The maximum number of the results kept for the
+                requests that are not waited yet (Default 10000).
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive integer.")
+        if fallback_interval <= 0:
+            raise ValueError("fallback_interval must be positive.")
+        self.batch_size = batch_size
+        self.long_poll_timeout = long_poll_timeout
+        self.poll_interval = poll_interval
+        self.fallback_interval = fallback_interval
+        self.max_unclaimed = max_unclaimed
+
+
+class _ResultSubscriber(object):
+    """Read the results from the sink of the queue service in bulk, and dispatch them
+    to the futures of the waiting requests.
+
+    The background thread runs only while there are waiting requests.
+    """
+
+    def __init__(
+        self,
+        fetch_results_fn: Callable[[int, int, float], List[Tuple[int, str, Any]]],
+        get_result_fn: Callable[[str], Optional[Any]],
+        delete_results_fn: Callable[[List[int]], None],
+        config: ResultSubscriptionConfig,
+        index: int = 0,
+    ):
+        # Hold weak references to the predictor methods, so that the background
+        # thread does not keep the predictor alive.
+        self._fetch_results_fn = weakref.WeakMethod(fetch_results_fn)
+        self._get_result_fn = weakref.WeakMethod(get_result_fn)
+        self._delete_results_fn = weakref.WeakMethod(delete_results_fn)
+        self.config = config
+        # request_id -> [future, time of the next fallback get]
+        self._waiting: Dict[str, List[Any]] = dict()
+        # request_id -> (index, result) of the results read before subscribed.
+        self._unclaimed: "OrderedDict[str, Tuple[Optional[int], Any]]" = OrderedDict()
+        # Indexes of the claimed results to be deleted from the sink.
+        self._claimed: List[int] = []
+        self._index = index
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def subscribe(self, request_id: str) -> Future:
+        """Returns a future resolved with the result of the request."""
+        future = Future()
+        with self._lock:
+            if request_id in self._unclaimed:
+                index, result = self._unclaimed.pop(request_id)
+                future.set_result(result)
+                if index is None:
+                    return future
+                self._claimed.append(index)
+            else:
+                self._waiting[request_id] = [
+                    future,
+                    time.monotonic() + self.config.fallback_interval,
+                ]
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return future
+
+    def unsubscribe(self, request_id: str):
+        with self._lock:
+            self._waiting.pop(request_id, None)
+
+    def _dispatch(self, index: Optional[int], request_id: str, result):
+        with self._lock:
+            item = self._waiting.pop(request_id, None)
+            if not item:
+                self._unclaimed[request_id] = (index, result)
+                while len(self._unclaimed) > self.config.max_unclaimed:
+                    self._unclaimed.popitem(last=False)
+                return
+            if index is not None:
+                self._claimed.append(index)
+        # The waiter may have been cancelled, the result is dropped.
+        set_future(item[0], result)
+
+    def _delete_claimed(self):
+        with self._lock:
+            claimed, self._claimed = self._claimed, []
+        if not claimed:
+            return
+        delete_results_fn = self._delete_results_fn()
+        try:
+            delete_results_fn and delete_results_fn(claimed)
+        except Exception as e:
+            logger.debug("Failed to delete the claimed results: %s", e)
+
+    def _fail_all(self, exc: Exception):
+        with self._lock:
+            waiting, self._waiting = self._waiting, dict()
+            self._thread = None
+        for future, _ in waiting.values():
+            set_future(future, exception=exc)
+
+    def _fallback(self):
+        """Get the results of the requests waiting too long by the request ID."""
+        now = time.monotonic()
+        with self._lock:
+            request_ids = [k for k, v in self._waiting.items() if v[1] <= now]
+            for request_id in request_ids:
+                self._waiting[request_id][1] = now + self.config.fallback_interval
+        for request_id in request_ids:
+            get_result_fn = self._get_result_fn()
+            if not get_result_fn:
+                return
+            try:
+                result = get_result_fn(request_id)
+            except Exception as e:
+                logger.debug("Failed to get the result of %s: %s", request_id, e)
+                continue
+            if result:
+                # The result got by the request ID is not kept in the sink.
+                self._dispatch(None, request_id, result)
+
+    def _run(self):
+        try:
+            self._poll_forever()
+        except Exception as e:
+            logger.error("Reading the prediction results stopped unexpectedly: %s", e)
+            self._fail_all(e)
+
+    def _poll_forever(self):
+        while True:
+            with self._lock:
+                if not self._waiting and not self._claimed:
+                    self._thread = None
+                    return
+                waiting = bool(self._waiting)
+            if not waiting:
+                self._delete_claimed()
+                continue
+            fetch_results_fn = self._fetch_results_fn()
+            if not fetch_results_fn:
+                self._fail_all(RuntimeError("The predictor has been deleted."))
+                return
+            start = time.monotonic()
+            try:
+                results = fetch_results_fn(
+                    self._index,
+                    self.config.batch_size,
+                    self.config.long_poll_timeout,
+                )
+            except Exception as e:
+                logger.debug("Failed to read the results from the sink: %s", e)
+                results = []
+            for index, request_id, result in results:
+                self._index = max(self._index, index + 1)
+                self._dispatch(index, request_id, result)
+            del fetch_results_fn
+            self._delete_claimed()
+            self._fallback()
+            if len(results) < self.config.batch_size:
+                time.sleep(
+                    max(self.config.poll_interval - (time.monotonic() - start), 0)
+                )
 
 
 class AsyncTask(object):
@@ -714,6 +1805,82 @@ class AsyncTask(object):
         return self.future.cancelled()
 
 
+class BulkPredictionResult(object):
+    """Result of an item of the bulk prediction made by `AsyncPredictor.predict_many`
+    or `AsyncPredictor.predict_many_async`."""
+
+    def __init__(
+        self,
+        index: int,
+        result: Any = None,
+        exception: Optional[Exception] = None,
+    ):
+        """BulkPredictionResult initializer.
+
+        Args:
+            index (int): Index of the item in the input data.
+            result (Any): Prediction result of the item.
+            exception (Exception, optional): The exception if the prediction of the
+                item failed.
+        """
+        self.index = index
+        self.result = result
+        self.exception = exception
+
+    @property
+    def succeeded(self) -> bool:
+        return self.exception is None
+
+    def __repr__(self):
+        if self.succeeded:
+            return f"BulkPredictionResult(index={self.index}, result={self.result!r})"
+        return f"BulkPredictionResult(index={self.index}, exception={self.exception!r})"
+
+
+class _BulkResultBuffer(object):
+    """Buffer the finished results of a bulk prediction until they are ready to be
+    yielded, in the input order or in the completion order."""
+
+    def __init__(self, ordered: bool):
+        self.ordered = ordered
+        self._results: Dict[int, BulkPredictionResult] = dict()
+        self._next_index = 0
+
+    def add(self, result: BulkPredictionResult):
+        self._results[result.index] = result
+
+    def pop_ready(self) -> List[BulkPredictionResult]:
+        if not self.ordered:
+            ready = list(self._results.values())
+            self._results.clear()
+            return ready
+        ready = []
+        while self._next_index in self._results:
+            ready.append(self._results.pop(self._next_index))
+            self._next_index += 1
+        return ready
+
+    def __len__(self):
+        return len(self._results)
+
+
+class _PendingPrediction(object):
+    """A request of the bulk prediction that is enqueued but not finished."""
+
+    def __init__(
+        self,
+        index: int,
+        request_id: str,
+        schedule: _PollSchedule,
+        future: Optional[Future] = None,
+    ):
+        self.index = index
+        self.request_id = request_id
+        self.schedule = schedule
+        self.future = future
+        self.next_poll = time.monotonic()
+
+
 class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
     """A class that facilitates making predictions to asynchronous prediction service.
 
@@ -730,6 +1897,14 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         import asyncio
         result = asyncio.run(async_predictor.predict_async(data="YourPredictionData"))
 
+        # Reuse the pooled connections for the async prediction calls, the pool is
+        # closed when exiting the context.
+        async def predict_all(items):
+            async with async_predictor:
+                return await asyncio.gather(
+                    *[async_predictor.predict_async(data=item) for item in items]
+                )
+
     """
 
     def __init__(
@@ -739,6 +1914,9 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         endpoint_type: str = EndpointType.INTERNET,
         serializer: Optional[SerializerBase] = None,
         session: Optional[Session] = None,
+        async_connection_config: Optional[AsyncConnectionConfig] = None,
+        result_subscription_config: Optional[ResultSubscriptionConfig] = None,
+        connection_config: Optional[ConnectionConfig] = None,
     ):
         """Construct a `AsyncPredictor` object using an existing async prediction service.
 
@@ -755,6 +1933,14 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
                 response data to Python object.
             session (Session, optional): A PAI session object used for communicating
                 with PAI service.
+            async_connection_config (AsyncConnectionConfig, optional): Config of the
+                connection pool used by `predict_async` and `raw_predict_async`.
+            result_subscription_config (ResultSubscriptionConfig, optional): If
+                provided, the prediction results are read from the sink of the queue
+                service in bulk, rather than polled for each request.
+            connection_config (ConnectionConfig, optional): Config of the connection
+                pool and the retry policy of the requests made by `predict` and
+                `raw_predict`, which should be sized for the max_workers.
         """
 
         super(AsyncPredictor, self).__init__(
@@ -762,10 +1948,25 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
             session=session or get_default_session(),
             endpoint_type=endpoint_type,
             serializer=serializer,
+            async_connection_config=async_connection_config,
+            connection_config=connection_config,
         )
         self._max_workers = max_workers
         self.executor = ThreadPoolExecutor(max_workers=self._max_workers)
         self._check()
+        self._result_subscriber = (
+            _ResultSubscriber(
+                self._fetch_results,
+                self._get_result,
+                self._delete_results,
+                config=result_subscription_config,
+                # The existing results in the sink are not of the predictor.
+                index=self._get_sink_end(),
+            )
+            if result_subscription_config
+            else None
+        )
+        self._latency_tracker = _LatencyTracker()
 
     @property
     def max_workers(self):
@@ -827,6 +2028,105 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
             )
         return self._parse_encapsulated_response(resp.json()[0])
 
+    def _fetch_results(
+        self, index: int, length: int, timeout: float
+    ) -> List[Tuple[int, str, Tuple[int, Dict[str, str], bytes]]]:
+        """Read the results from the sink starting from the index.
+
+        Returns:
+            List[Tuple]: A list of (index, request_id, result) tuples.
+        """
+        resp = self._send_request(
+            method="GET",
+            path=_QUEUE_SERVICE_SINK_PATH,
+            params={
+                "_index_": str(index),
+                "_length_": str(length),
+                "_timeout_": "{}s".format(int(timeout)),
+                "_raw_": "false",
+                # The results of the other clients are kept in the sink, the claimed
+                # ones are deleted by index.
+                "_auto_delete_": "false",
+            },
+        )
+        if resp.status_code == 204:
+            return []
+        if resp.status_code // 100 != 2:
+            raise RuntimeError(
+                "Reading prediction results failed: status_code={} content={}".format(
+                    resp.status_code, resp.content.decode("utf-8")
+                )
+            )
+        return [
+            (
+                int(item["index"]),
+                item["tags"].get("requestId"),
+                self._parse_encapsulated_response(item),
+            )
+            for item in resp.json()
+        ]
+
+    def _get_sink_end(self) -> int:
+        """Returns the index next to the last result in the sink, the results are
+        read from the start of the sink if failed to get it."""
+        try:
+            resp = self._send_request(
+                method="GET",
+                path=_QUEUE_SERVICE_SINK_PATH,
+                params={"_attrs_": "true"},
+            )
+            resp.raise_for_status()
+            last_entry = resp.json().get("stream.lastEntry")
+        except Exception as e:
+            logger.debug("Failed to get the attributes of the sink: %s", e)
+            return 0
+        return int(last_entry) + 1 if last_entry is not None else 0
+
+    def _delete_results(self, indexes: List[int]):
+        resp = self._send_request(
+            method="DELETE",
+            path=_QUEUE_SERVICE_SINK_PATH,
+            params={"_indexes_": ",".join(str(i) for i in indexes)},
+        )
+        if resp.status_code // 100 != 2:
+            logger.debug(
+                "Deleting prediction results failed: status_code=%s content=%s",
+                resp.status_code,
+                resp.content,
+            )
+
+    def _wait_subscribed_result(
+        self, request_id: str, wait_config: WaitConfig
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        future = self._result_subscriber.subscribe(request_id)
+        timeout = wait_config.total_timeout
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise RuntimeError(
+                f"Polling prediction result timeout: request_id={request_id}, "
+                f"total_time={timeout}"
+            )
+        finally:
+            self._result_subscriber.unsubscribe(request_id)
+
+    async def _wait_subscribed_result_async(
+        self, request_id: str, wait_config: WaitConfig
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        future = self._result_subscriber.subscribe(request_id)
+        timeout = wait_config.total_timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                f"Polling prediction result timeout: request_id={request_id}, "
+                f"total_time={timeout}"
+            )
+        finally:
+            # Also on cancellation of the waiting task, the result is not
+            # dispatched to the cancelled future.
+            self._result_subscriber.unsubscribe(request_id)
+
     def _parse_encapsulated_response(self, data) -> Tuple[int, Dict[str, str], bytes]:
         tags = data["tags"]
         # If the status code from prediction service is not 200, a tag with
@@ -874,14 +2174,25 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
     def _poll_result(
         self, request_id: str, wait_config: WaitConfig
     ) -> Tuple[int, Dict[str, str], bytes]:
-        # if max_attempts is negative or zero, then wait forever
-        attempts = -1 if wait_config.max_attempts <= 0 else wait_config.max_attempts
-        while attempts != 0:
-            attempts -= 1
+        if self._result_subscriber:
+            status_code, headers, content = self._wait_subscribed_result(
+                request_id, wait_config
+            )
+            if status_code // 100 != 2:
+                raise PredictionException(
+                    code=status_code,
+                    message=f"Prediction failed: status_code={status_code}"
+                    f" content={content.decode()}",
+                )
+            return status_code, headers, content
+
+        schedule = _PollSchedule(wait_config, self._latency_tracker.hint())
+        while schedule.next_attempt():
             result = self._get_result(request_id=request_id)
             if not result:
-                time.sleep(wait_config.interval)
+                time.sleep(schedule.next_interval())
                 continue
+            self._latency_tracker.record(schedule.elapsed)
             status_code, headers, content = result
             # check real prediction response
             if status_code // 100 != 2:
@@ -895,32 +2206,45 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         # Polling prediction result timeout.
         raise RuntimeError(
             f"Polling prediction result timeout: request_id={request_id}, "
-            f"total_time={wait_config.max_attempts * wait_config.interval}"
+            f"total_time={schedule.elapsed:.2f}"
         )
 
     async def _poll_result_async(
         self, request_id, wait_config: WaitConfig
     ) -> Tuple[int, Dict[str, str], bytes]:
-        # if max_attempts is negative or zero, then wait forever
-        attempts = -1 if wait_config.max_attempts <= 0 else wait_config.max_attempts
-        while attempts != 0:
-            attempts -= 1
+        if self._result_subscriber:
+            status_code, headers, content = await self._wait_subscribed_result_async(
+                request_id, wait_config
+            )
+            if status_code // 100 != 2:
+                raise PredictionException(
+                    code=status_code,
+                    message=f"Prediction failed: status_code={status_code}"
+                    f" content={content.decode()}",
+                )
+            return status_code, headers, content
+
+        schedule = _PollSchedule(wait_config, self._latency_tracker.hint())
+        while schedule.next_attempt():
             result = await self._get_result_async(request_id)
             if not result:
-                await asyncio.sleep(wait_config.interval)
+                await asyncio.sleep(schedule.next_interval())
                 continue
+            self._latency_tracker.record(schedule.elapsed)
             status_code, headers, content = result
             # check real prediction response
             if status_code // 100 != 2:
                 raise PredictionException(
-                    f"Prediction failed: status_code={status_code} content={content.decode()}"
+                    code=status_code,
+                    message=f"Prediction failed: status_code={status_code}"
+                    f" content={content.decode()}",
                 )
             return status_code, headers, content
 
         # Polling prediction result timeout.
         raise RuntimeError(
             f"Polling prediction result timeout: request_id={request_id}, "
-            f"total_time={wait_config.max_attempts * wait_config.interval}"
+            f"total_time={schedule.elapsed:.2f}"
         )
 
     def _get_request_id(self, resp: requests.models.Response) -> str:
@@ -944,7 +2268,7 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         )
         return request_id
 
-    async def _get_request_id_async(self, resp: aiohttp.ClientResponse) -> str:
+    async def _get_request_id_async(self, resp: "aiohttp.ClientResponse") -> str:
         content = await resp.read()
         if resp.status != 200:
             raise RuntimeError(
@@ -1055,6 +2379,271 @@ class AsyncPredictor(PredictorBase, _ServicePredictorMixin):
         )
         return self._handle_output(content)
 
+    def _enqueue(self, index: int, data, wait_config: WaitConfig) -> _PendingPrediction:
+        request_id = self._get_request_id(
+            self._send_request(data=self._handle_input(data))
+        )
+        future = (
+            self._result_subscriber.subscribe(request_id)
+            if self._result_subscriber
+            else None
+        )
+        return _PendingPrediction(
+            index=index,
+            request_id=request_id,
+            schedule=_PollSchedule(wait_config, self._latency_tracker.hint()),
+            future=future,
+        )
+
+    def _finish(
+        self,
+        pending: _PendingPrediction,
+        result: Union[Tuple[int, Dict[str, str], bytes], Exception],
+    ) -> BulkPredictionResult:
+        if isinstance(result, Exception):
+            return BulkPredictionResult(pending.index, exception=result)
+        self._latency_tracker.record(pending.schedule.elapsed)
+        status_code, _, content = result
+        if status_code // 100 != 2:
+            return BulkPredictionResult(
+                pending.index,
+                exception=PredictionException(
+                    code=status_code,
+                    message=f"Prediction failed: status_code={status_code}"
+                    f" content={content.decode()}",
+                ),
+            )
+        try:
+            return BulkPredictionResult(
+                pending.index, result=self._handle_output(content)
+            )
+        except Exception as e:
+            return BulkPredictionResult(pending.index, exception=e)
+
+    def _timeout_error(self, pending: _PendingPrediction) -> RuntimeError:
+        if self._result_subscriber:
+            self._result_subscriber.unsubscribe(pending.request_id)
+        return RuntimeError(
+            f"Polling prediction result timeout: request_id={pending.request_id}, "
+            f"total_time={pending.schedule.elapsed:.2f}"
+        )
+
+    def _wait_pending(
+        self, pending: Dict[str, _PendingPrediction]
+    ) -> List[BulkPredictionResult]:
+        """Wait until some of the pending requests are finished, the finished ones are
+        removed from the pending requests."""
+        finished = []
+        if self._result_subscriber:
+            remaining = [p.schedule.remaining for p in pending.values()]
+            remaining = [r for r in remaining if r is not None]
+            wait_futures(
+                [p.future for p in pending.values()],
+                timeout=min(remaining) if remaining else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for p in list(pending.values()):
+                if p.future.done():
+                    exc = p.future.exception()
+                    finished.append(self._finish(p, exc or p.future.result()))
+                elif p.schedule.remaining == 0:
+                    finished.append(self._finish(p, self._timeout_error(p)))
+                else:
+                    continue
+                del pending[p.request_id]
+            return finished
+
+        now = time.monotonic()
+        due = [p for p in pending.values() if p.next_poll <= now]
+        if not due:
+            time.sleep(min(p.next_poll for p in pending.values()) - now)
+            return finished
+
+        def get_result(p: _PendingPrediction):
+            try:
+                return self._get_result(p.request_id)
+            except Exception as e:
+                return e
+
+        # The results are fetched with the executor, the threads are not held by the
+        # requests between the polls.
+        for p, result in zip(due, self.executor.map(get_result, due)):
+            if result is None:
+                if p.schedule.next_attempt():
+                    p.next_poll = time.monotonic() + p.schedule.next_interval()
+                    continue
+                result = self._timeout_error(p)
+            finished.append(self._finish(p, result))
+            del pending[p.request_id]
+        return finished
+
+    def predict_many(
+        self,
+        data: Iterable[Any],
+        max_in_flight: int = 32,
+        ordered: bool = True,
+        wait_config: Optional[WaitConfig] = None,
+    ) -> Iterator[BulkPredictionResult]:
+        """Make predictions for many items with the async prediction service.
+
+        The items are enqueued to the service while the results stream back, at most
+        `max_in_flight` requests are outstanding at a time. Rather than blocking a
+        thread for each request, the outstanding requests are polled together.
+
+        A failed item does not abort the others, its exception is reported in the
+        result of the item.
+
+        Args:
+            data (Iterable[Any]): The input data of the predictions, each item is
+                serialized using the serializer of the predictor.
+            max_in_flight (int): Max number of the requests that are enqueued but not
+                yielded (Default 32).
+            ordered (bool): Whether the results are yielded in the order of the
+                input data, otherwise they are yielded in the completion order
+                (Default True).
+            wait_config (WaitConfig, optional): A config object that controls the
+                behavior of polling the prediction result of each item.
+
+        Returns:
+            Iterator[BulkPredictionResult]: Results of the items.
+
+        Examples::
+
+            for res in async_predictor.predict_many(items, max_in_flight=64):
+                if res.succeeded:
+                    print(res.index, res.result)
+                else:
+                    print(res.index, res.exception)
+
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive integer.")
+        self._post_init_serializer()
+        wait_config = wait_config or WaitConfig()
+        items = enumerate(data)
+        buffer = _BulkResultBuffer(ordered)
+        pending: Dict[str, _PendingPrediction] = OrderedDict()
+        exhausted = False
+        try:
+            while True:
+                # Results waiting for the previous items count as in flight, or the
+                # buffer grows unbounded behind a slow item.
+                while not exhausted and len(pending) + len(buffer) < max_in_flight:
+                    try:
+                        index, item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    try:
+                        p = self._enqueue(index, item, wait_config)
+                    except Exception as e:
+                        buffer.add(BulkPredictionResult(index, exception=e))
+                        continue
+                    pending[p.request_id] = p
+
+                yield from buffer.pop_ready()
+                if not pending:
+                    if exhausted:
+                        return
+                    continue
+                for result in self._wait_pending(pending):
+                    buffer.add(result)
+                yield from buffer.pop_ready()
+        finally:
+            # The generator is closed or failed with the items waiting for the
+            # results.
+            if self._result_subscriber:
+                for request_id in pending:
+                    self._result_subscriber.unsubscribe(request_id)
+
+    async def predict_many_async(
+        self,
+        data: Iterable[Any],
+        max_in_flight: int = 32,
+        ordered: bool = True,
+        wait_config: Optional[WaitConfig] = None,
+    ) -> AsyncIterator[BulkPredictionResult]:
+        """Make predictions for many items with the async prediction service.
+
+        It's the async version of :meth:`predict_many`, the requests are made in
+        the coroutines of the current event loop.
+
+        Args:
+            data (Iterable[Any]): The input data of the predictions, each item is
+                serialized using the serializer of the predictor.
+            max_in_flight (int): Max number of the requests that are enqueued but not
+                yielded (Default 32).
+            ordered (bool): Whether the results are yielded in the order of the
+                input data, otherwise they are yielded in the completion order
+                (Default True).
+            wait_config (WaitConfig, optional): A config object that controls the
+                behavior of polling the prediction result of each item.
+
+        Returns:
+            AsyncIterator[BulkPredictionResult]: Results of the items.
+
+        Examples::
+
+            async with async_predictor:
+                async for res in async_predictor.predict_many_async(items):
+                    print(res.index, res.result if res.succeeded else res.exception)
+
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive integer.")
+        wait_config = wait_config or WaitConfig()
+
+        # index -> request_id of the items waiting for the results.
+        waiting: Dict[int, str] = dict()
+
+        async def _predict(index: int, item) -> BulkPredictionResult:
+            try:
+                self._post_init_serializer()
+                resp = await self._send_request_async(data=self._handle_input(item))
+                request_id = await self._get_request_id_async(resp)
+                waiting[index] = request_id
+                try:
+                    _, _, content = await self._poll_result_async(
+                        request_id=request_id, wait_config=wait_config
+                    )
+                finally:
+                    waiting.pop(index, None)
+                result = self._handle_output(content)
+            except Exception as e:
+                return BulkPredictionResult(index, exception=e)
+            return BulkPredictionResult(index, result=result)
+
+        items = enumerate(data)
+        buffer = _BulkResultBuffer(ordered)
+        tasks = set()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(tasks) + len(buffer) < max_in_flight:
+                    try:
+                        index, item = next(items)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    tasks.add(asyncio.ensure_future(_predict(index, item)))
+                if not tasks:
+                    return
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    buffer.add(task.result())
+                for result in buffer.pop_ready():
+                    yield result
+        finally:
+            # Unsubscribe the abandoned items before the tasks are cancelled, the
+            # cancellation is processed only when the event loop runs the tasks.
+            if self._result_subscriber:
+                for request_id in waiting.values():
+                    self._result_subscriber.unsubscribe(request_id)
+            for task in tasks:
+                task.cancel()
+
     def _raw_predict_fn(self, data, method, path, headers, **kwargs):
         json_data, data = self._handle_raw_input(data)
         resp = self._send_request(
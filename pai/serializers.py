@@ -14,22 +14,33 @@
 
 import json
 import logging
+import sys
 import urllib.request
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.error import HTTPError
 
 import backoff
-import numpy
-import numpy as np
 import six
-from eas_prediction import pytorch_predict_pb2 as pt_pb
-from eas_prediction import tf_request_pb2 as tf_pb
 
+from pai.common.proto_utils import (
+    WireType,
+    decode_varints,
+    encode_length_delimited,
+    encode_varints,
+    iter_fields,
+)
+from pai.common.utils import LazyModule
 from pai.session import Session, get_default_session
 
 logger = logging.getLogger(__name__)
 
+# numpy and the protobuf modules are imported on first use, they are not required
+# by the serializers of the JSON or raw bytes data.
+np = LazyModule("numpy")
+tf_pb = LazyModule("eas_prediction.tf_request_pb2")
+pt_pb = LazyModule("eas_prediction.pytorch_predict_pb2")
+
 
 def _is_pil_image(data) -> bool:
     try:
@@ -41,25 +52,201 @@ def _is_pil_image(data) -> bool:
 
 
 def _is_numpy_ndarray(data) -> bool:
-    try:
-        import numpy
-
-        return isinstance(data, numpy.ndarray)
-    except ImportError:
-        return False
+    # The data could not be an ndarray if numpy is not imported yet.
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(data, numpy.ndarray)
 
 
 def _is_pandas_dataframe(data) -> bool:
-    try:
-        import pandas
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(data, pandas.DataFrame)
 
-        return isinstance(data, pandas.DataFrame)
-    except ImportError:
-        return False
+
+def _split_by_sizes(data, batch_sizes: List[int]) -> List[Any]:
+    """Split the data along the first dimension by the given batch sizes."""
+    results, offset = [], 0
+    for size in batch_sizes:
+        results.append(data[offset : offset + size])
+        offset += size
+    return results
+
+
+def _concat_arrays(arrays: List[Any]) -> Tuple["np.ndarray", List[int]]:
+    """Concatenate the arrays along the first dimension, returns the concatenated
+    array and the batch sizes of the arrays."""
+    arrays = [np.asarray(arr) for arr in arrays]
+    if any(arr.ndim == 0 for arr in arrays):
+        raise ValueError("Could not concatenate scalar values into a batch.")
+    return np.concatenate(arrays), [arr.shape[0] for arr in arrays]
+
+
+def _split_array(data: "np.ndarray", batch_sizes: List[int]) -> List["np.ndarray"]:
+    if data.ndim == 0 or data.shape[0] != sum(batch_sizes):
+        raise ValueError(
+            "Could not split the prediction result into batches: expected first "
+            f"dimension {sum(batch_sizes)}, got shape {data.shape}."
+        )
+    return _split_by_sizes(data, batch_sizes)
+
+
+# Field numbers of the ArrayProto message used by the TensorFlow and PyTorch
+# processor prediction protocol.
+_ARRAY_PROTO_DTYPE_FIELD = 1
+_ARRAY_PROTO_SHAPE_FIELD = 2
+
+# Field numbers of the PredictRequest/PredictResponse messages.
+_TF_PREDICT_REQUEST_INPUTS_FIELD = 2
+_TF_PREDICT_RESPONSE_OUTPUTS_FIELD = 1
+_PT_PREDICT_REQUEST_INPUTS_FIELD = 1
+_PT_PREDICT_RESPONSE_OUTPUTS_FIELD = 1
+
+_VARINT_ENCODING = "varint"
+_BOOL_ENCODING = "bool"
+
+# Field number and element encoding of the numeric value fields of ArrayProto,
+# floating point values are encoded as little-endian fixed-size values, integers and
+# booleans are encoded as varint.
+_ARRAY_PROTO_VALUE_FIELDS = {
+    "DT_FLOAT": (3, "<f4"),
+    "DT_DOUBLE": (4, "<f8"),
+    "DT_INT8": (5, _VARINT_ENCODING),
+    "DT_INT16": (5, _VARINT_ENCODING),
+    "DT_INT32": (5, _VARINT_ENCODING),
+    "DT_UINT8": (5, _VARINT_ENCODING),
+    "DT_UINT16": (5, _VARINT_ENCODING),
+    "DT_QINT8": (5, _VARINT_ENCODING),
+    "DT_QINT16": (5, _VARINT_ENCODING),
+    "DT_QINT32": (5, _VARINT_ENCODING),
+    "DT_QUINT8": (5, _VARINT_ENCODING),
+    "DT_QUINT16": (5, _VARINT_ENCODING),
+    "DT_INT64": (7, _VARINT_ENCODING),
+    "DT_BOOL": (8, _BOOL_ENCODING),
+}
+
+
+class _NumpyDataTypeMapping(object):
+    """Class attribute of the mapping from the data type name to the numpy data type,
+    the mapping is built on first access."""
+
+    def __init__(self, type_names: Dict[str, str]):
+        self._type_names = type_names
+        self._mapping = None
+
+    def __get__(self, instance, owner) -> Dict[str, Any]:
+        if self._mapping is None:
+            self._mapping = {k: getattr(np, v) for k, v in self._type_names.items()}
+        return self._mapping
+
+
+class _ArrayProtoCodec(object):
+    """Encode/decode the numeric ArrayProto message between NumPy array buffer and
+    protobuf wire format directly, without converting each element to Python
+    object."""
+
+    def __init__(self, pb_module, numpy_dtype_mapping: Dict[str, Any], data_types):
+        self._pb = pb_module
+        self._numpy_dtype_mapping = numpy_dtype_mapping
+        self._value_fields = {
+            pb_module.ArrayDataType.Value(name): _ARRAY_PROTO_VALUE_FIELDS[name]
+            for name in data_types
+        }
+
+    def supports(self, data_type) -> bool:
+        return data_type in self._value_fields
+
+    def encode(self, data_type, shape, value: "np.ndarray") -> bytes:
+        """Serialize an ArrayProto message with the given values."""
+        array_proto = self._pb.ArrayProto(dtype=data_type)
+        array_proto.array_shape.dim.extend(shape)
+
+        field_number, encoding = self._value_fields[data_type]
+        if encoding == _VARINT_ENCODING:
+            payload = encode_varints(value)
+        elif encoding == _BOOL_ENCODING:
+            # Varint encoding of a boolean value is a single byte of 0 or 1.
+            payload = np.ascontiguousarray(value, dtype=np.bool_).tobytes()
+        else:
+            payload = np.ascontiguousarray(value, dtype=encoding).tobytes()
+
+        data = array_proto.SerializeToString()
+        if payload:
+            data += encode_length_delimited(field_number, payload)
+        return data
+
+    def decode(self, data) -> Optional["np.ndarray"]:
+        """Decode a serialized ArrayProto message.
+
+        Returns None if the message is not supported by the codec, such as message
+        contains string values, the caller should fall back to parse the message
+        with protobuf.
+        """
+        data_type, shape, value_fields = self._pb.DT_INVALID, [], []
+        for field_number, wire_type, value in iter_fields(data):
+            if field_number == _ARRAY_PROTO_DTYPE_FIELD:
+                data_type = value
+            elif field_number == _ARRAY_PROTO_SHAPE_FIELD:
+                shape = self._decode_shape(value)
+            else:
+                value_fields.append((field_number, wire_type, value))
+
+        data_type_name = self._pb.ArrayDataType.Name(data_type)
+        if (
+            data_type not in self._value_fields
+            or data_type_name not in self._numpy_dtype_mapping
+        ):
+            return
+        np_dtype = self._numpy_dtype_mapping[data_type_name]
+        value_field_number, encoding = self._value_fields[data_type]
+
+        # Repeated scalar values could be split into multiple packed fields, or be
+        # encoded as unpacked.
+        chunks = []
+        for field_number, wire_type, value in value_fields:
+            if field_number != value_field_number:
+                continue
+            if encoding in (_VARINT_ENCODING, _BOOL_ENCODING):
+                if wire_type == WireType.LENGTH_DELIMITED:
+                    chunks.append(decode_varints(value))
+                elif wire_type == WireType.VARINT:
+                    chunks.append(np.asarray([value], dtype=np.uint64))
+                else:
+                    return
+            elif wire_type in (
+                WireType.LENGTH_DELIMITED,
+                WireType.FIXED32,
+                WireType.FIXED64,
+            ):
+                chunks.append(np.frombuffer(value, dtype=encoding))
+            else:
+                return
+
+        if not chunks:
+            result = np.empty(0, dtype=np_dtype)
+        else:
+            result = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+            if encoding == _BOOL_ENCODING:
+                result = result != 0
+            elif encoding == _VARINT_ENCODING:
+                result = result.view(np.int64).astype(np_dtype)
+            else:
+                result = result.astype(np_dtype)
+        return result.reshape(shape)
+
+    @classmethod
+    def _decode_shape(cls, data) -> List[int]:
+        dims = []
+        for field_number, wire_type, value in iter_fields(data):
+            if field_number != 1:
+                continue
+            if wire_type == WireType.LENGTH_DELIMITED:
+                dims.extend(decode_varints(value).view(np.int64).tolist())
+            else:
+                dims.append(value - (1 << 64) if value >= (1 << 63) else value)
+        return dims
 
 
 class TensorFlowIOSpec(object):
-    def __init__(self, name: str, shape: Tuple, data_type: tf_pb.ArrayDataType):
+    def __init__(self, name: str, shape: Tuple, data_type: "tf_pb.ArrayDataType"):
         """A class represents TensorFlow inputs/outputs spec.
 
         Args:
@@ -96,6 +283,39 @@ class SerializerBase(ABC):
 
         """
 
+    def merge_batch(self, data_list: List[Any]) -> Tuple[Any, List[int]]:
+        """Merge the input data of multiple prediction calls into one batch.
+
+        The implementation of the `merge_batch` and `split_batch` methods is optional,
+        they are required only if the serializer is used by a predictor with
+        client-side batching enabled.
+
+        Args:
+            data_list (List[Any]): Input data of the prediction calls.
+
+        Returns:
+            Tuple[Any, List[int]]: A tuple of the merged input data and the batch size
+                of each prediction call.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support client-side batching."
+        )
+
+    def split_batch(self, data: Any, batch_sizes: List[int]) -> List[Any]:
+        """Split the deserialized prediction result of a batch into results of the
+        prediction calls.
+
+        Args:
+            data (Any): The deserialized prediction result of the merged batch.
+            batch_sizes (List[int]): The batch size of each prediction call.
+
+        Returns:
+            List[Any]: Prediction results of the calls.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support client-side batching."
+        )
+
 
 class BytesSerializer(SerializerBase):
     """A Serializer object that serialize input data into bytes format and deserialize
@@ -132,23 +352,49 @@ class JsonSerializer(SerializerBase):
     def deserialize(self, data):
         return json.loads(data)
 
+    def merge_batch(self, data_list: List[Any]) -> Tuple[List[Any], List[int]]:
+        batch, batch_sizes = [], []
+        for data in data_list:
+            if _is_pandas_dataframe(data):
+                data = data.to_numpy().tolist()
+            elif _is_numpy_ndarray(data):
+                data = data.tolist()
+            if not isinstance(data, (list, tuple)):
+                raise ValueError(
+                    "JsonSerializer only supports merging list-like input data into"
+                    f" a batch, given type: {type(data)}."
+                )
+            batch.extend(data)
+            batch_sizes.append(len(data))
+        return batch, batch_sizes
+
+    def split_batch(self, data: Any, batch_sizes: List[int]) -> List[Any]:
+        if not isinstance(data, list) or len(data) != sum(batch_sizes):
+            raise ValueError(
+                "Could not split the prediction result into batches: expected a list"
+                f" with {sum(batch_sizes)} items."
+            )
+        return _split_by_sizes(data, batch_sizes)
+
 
 class TensorFlowSerializer(SerializerBase):
     """A Serializer class that responsible for transforming input/output data for
     TensorFlow processor service."""
 
-    NUMPY_DATA_TYPE_MAPPING = {
-        "DT_FLOAT": np.float32,
-        "DT_DOUBLE": np.float64,
-        "DT_INT8": np.int8,
-        "DT_INT16": np.int16,
-        "DT_INT32": np.int32,
-        "DT_INT64": np.int64,
-        "DT_UINT8": np.uint8,
-        "DT_UINT16": np.uint16,
-        "DT_BOOL": np.bool_,
-        "DT_STRING": np.str_,
-    }
+    NUMPY_DATA_TYPE_MAPPING = _NumpyDataTypeMapping(
+        {
+            "DT_FLOAT": "float32",
+            "DT_DOUBLE": "float64",
+            "DT_INT8": "int8",
+            "DT_INT16": "int16",
+            "DT_INT32": "int32",
+            "DT_INT64": "int64",
+            "DT_UINT8": "uint8",
+            "DT_UINT16": "uint16",
+            "DT_BOOL": "bool_",
+            "DT_STRING": "str_",
+        }
+    )
 
     def __init__(
         self,
@@ -158,6 +404,11 @@ class TensorFlowSerializer(SerializerBase):
         self._input_specs = []
         self._output_filter = []
         self._signature_name = None
+        self._codec = _ArrayProtoCodec(
+            tf_pb,
+            self.NUMPY_DATA_TYPE_MAPPING,
+            data_types=_ARRAY_PROTO_VALUE_FIELDS.keys(),
+        )
         super(TensorFlowSerializer, self).__init__()
 
     def inspect_from_service(
@@ -251,7 +502,7 @@ class TensorFlowSerializer(SerializerBase):
         signature_def = json.load(resp)
         return signature_def
 
-    def serialize(self, data: Union[Dict[str, Any], tf_pb.PredictRequest]) -> bytes:
+    def serialize(self, data: Union[Dict[str, Any], "tf_pb.PredictRequest"]) -> bytes:
 
         if isinstance(data, tf_pb.PredictRequest):
             return data.SerializeToString()
@@ -261,6 +512,8 @@ class TensorFlowSerializer(SerializerBase):
             for output_name in self._output_filter:
                 request.output_filter.append(output_name)
 
+        inputs = []
+
         if not isinstance(data, dict):
             if not self._input_specs or len(self._input_specs) > 1:
                 raise ValueError(
@@ -273,7 +526,7 @@ class TensorFlowSerializer(SerializerBase):
                 # exactly one input (by model signature), the key will be inferred
                 # from model signature and the current input data will be taken as
                 # value.
-                value = numpy.asarray(data)
+                value = np.asarray(data)
                 input_spec = self._input_specs[0]
                 if (
                     input_spec.shape
@@ -285,13 +538,7 @@ class TensorFlowSerializer(SerializerBase):
                     if input_spec and input_spec.data_type is not None
                     else self._np_dtype_to_tf_dtype(value.dtype.type)
                 )
-                self._put_value(
-                    request=request,
-                    name=input_spec.name,
-                    data_type=data_type,
-                    shape=value.shape,
-                    data=np.ravel(value).tolist(),
-                )
+                inputs.append((input_spec.name, data_type, value))
         else:
             input_specs_dict = (
                 {input_spec.name: input_spec for input_spec in self._input_specs}
@@ -314,15 +561,74 @@ class TensorFlowSerializer(SerializerBase):
                     and len([dim for dim in input_spec.shape if dim == -1]) == 1
                 ):
                     value = value.reshape(input_spec.shape)
+                inputs.append((name, data_type, value))
+
+        return self._serialize_request(request, inputs)
+
+    def _serialize_request(
+        self,
+        request: "tf_pb.PredictRequest",
+        inputs: List[Tuple[str, Any, "np.ndarray"]],
+    ) -> bytes:
+        """Serialize the PredictRequest with the given inputs.
+
+        Numeric inputs are encoded from the array buffer and appended to the serialized
+        request as entries of the `inputs` map field, which is equivalent to putting
+        the values into the request message.
+        """
+        entries = []
+        for name, data_type, value in inputs:
+            if self._codec.supports(data_type):
+                entry = encode_length_delimited(
+                    1, name.encode()
+                ) + encode_length_delimited(
+                    2, self._codec.encode(data_type, value.shape, value)
+                )
+                entries.append(
+                    encode_length_delimited(_TF_PREDICT_REQUEST_INPUTS_FIELD, entry)
+                )
+            else:
                 self._put_value(
                     request=request,
-                    name=input_spec.name,
+                    name=name,
                     data_type=data_type,
                     shape=value.shape,
                     data=np.ravel(value).tolist(),
                 )
+        return request.SerializeToString() + b"".join(entries)
 
-        return request.SerializeToString()
+    def merge_batch(
+        self, data_list: List[Any]
+    ) -> Tuple[Union[Dict[str, "np.ndarray"], "np.ndarray"], List[int]]:
+        if not all(isinstance(data, dict) for data in data_list):
+            if any(isinstance(data, dict) for data in data_list):
+                raise ValueError(
+                    "Could not merge dictionary and non-dictionary input data into a"
+                    " batch."
+                )
+            return _concat_arrays(data_list)
+
+        names = set(data_list[0].keys())
+        if any(set(data.keys()) != names for data in data_list):
+            raise ValueError("Input data in a batch should have the same input names.")
+        batch, batch_sizes = {}, None
+        for name in names:
+            batch[name], sizes = _concat_arrays([data[name] for data in data_list])
+            if batch_sizes is not None and sizes != batch_sizes:
+                raise ValueError(
+                    "Inputs of a prediction call should have the same first dimension."
+                )
+            batch_sizes = sizes
+        return batch, batch_sizes
+
+    def split_batch(
+        self, data: Dict[str, "np.ndarray"], batch_sizes: List[int]
+    ) -> List[Dict[str, "np.ndarray"]]:
+        results = [dict() for _ in batch_sizes]
+        for name, value in data.items():
+            for result, item in zip(results, _split_array(value, batch_sizes)):
+                result[name] = item
+        return results
 
     def _init_from_signature_def(self, signature_def):
         """Build TensorFlowSerializer from signature def.
@@ -365,15 +671,24 @@ class TensorFlowSerializer(SerializerBase):
             self._output_filter = [spec.name for spec in output_specs]
 
     def deserialize(self, data: bytes):
-        response = tf_pb.PredictResponse()
-        response.ParseFromString(data)
-        output_names = response.outputs.keys()
         results = {}
-        for name in output_names:
-            results[name] = self._get_value(
-                response=response,
-                name=name,
-            )
+        # Iterate over the entries of the `outputs` map field of PredictResponse.
+        for field_number, wire_type, entry in iter_fields(data):
+            if (
+                field_number != _TF_PREDICT_RESPONSE_OUTPUTS_FIELD
+                or wire_type != WireType.LENGTH_DELIMITED
+            ):
+                continue
+            name, output = "", b""
+            for entry_field_number, _, value in iter_fields(entry):
+                if entry_field_number == 1:
+                    name = bytes(value).decode()
+                elif entry_field_number == 2:
+                    output = value
+            result = self._codec.decode(output)
+            if result is None:
+                result = self._get_value(tf_pb.ArrayProto.FromString(bytes(output)))
+            results[name] = result
         return results
 
     def _np_dtype_to_tf_dtype(self, np_dtype):
@@ -394,7 +709,7 @@ class TensorFlowSerializer(SerializerBase):
         return self.NUMPY_DATA_TYPE_MAPPING.get(data_type_name)
 
     def _put_value(
-        self, request: tf_pb.PredictRequest, name: str, data_type, shape, data
+        self, request: "tf_pb.PredictRequest", name: str, data_type, shape, data
     ):
         request.inputs[name].dtype = data_type
         request.inputs[name].array_shape.dim.extend(shape)
@@ -428,15 +743,10 @@ class TensorFlowSerializer(SerializerBase):
                 f"Not supported input data type for TensorFlow PredictRequest: {data_type}"
             )
 
-    def _get_value(self, response: tf_pb.PredictResponse, name):
-        output = response.outputs[name]
-
-        if (
-            name not in response.outputs
-            or tf_pb.DT_INVALID == response.outputs[name].dtype
-        ):
+    def _get_value(self, output: "tf_pb.ArrayProto"):
+        if tf_pb.DT_INVALID == output.dtype:
             return
-        np_dtype = self._tf_dtype_to_np_dtype(response.outputs[name].dtype)
+        np_dtype = self._tf_dtype_to_np_dtype(output.dtype)
         shape = list(output.array_shape.dim)
 
         if output.dtype == tf_pb.DT_FLOAT:
@@ -461,23 +771,38 @@ class PyTorchSerializer(SerializerBase):
 
     """
 
-    NUMPY_DATA_TYPE_MAPPING = {
-        "DT_FLOAT": np.float32,
-        "DT_DOUBLE": np.float64,
-        "DT_INT8": np.int8,
-        "DT_INT16": np.int16,
-        "DT_INT32": np.int32,
-        "DT_INT64": np.int64,
-        "DT_UINT8": np.uint8,
-        "DT_UINT16": np.uint16,
-        "DT_BOOL": np.bool_,
-        "DT_STRING": np.str_,
-    }
+    NUMPY_DATA_TYPE_MAPPING = _NumpyDataTypeMapping(
+        {
+            "DT_FLOAT": "float32",
+            "DT_DOUBLE": "float64",
+            "DT_INT8": "int8",
+            "DT_INT16": "int16",
+            "DT_INT32": "int32",
+            "DT_INT64": "int64",
+            "DT_UINT8": "uint8",
+            "DT_UINT16": "uint16",
+            "DT_BOOL": "bool_",
+            "DT_STRING": "str_",
+        }
+    )
 
     def __init__(
         self,
     ):
         self._output_filter = []
+        self._codec = _ArrayProtoCodec(
+            pt_pb,
+            self.NUMPY_DATA_TYPE_MAPPING,
+            data_types=[
+                "DT_FLOAT",
+                "DT_DOUBLE",
+                "DT_INT8",
+                "DT_INT16",
+                "DT_INT32",
+                "DT_UINT8",
+                "DT_INT64",
+            ],
+        )
 
     def _np_dtype_to_torch_dtype(self, np_dtype):
         """Get PredictRequest data_type from dtype of input np.ndarray."""
@@ -496,8 +821,7 @@ class PyTorchSerializer(SerializerBase):
             )
         return self.NUMPY_DATA_TYPE_MAPPING.get(data_type_name)
 
-    def serialize(self, data: Union[np.ndarray, List, Tuple]) -> bytes:
-        request = pt_pb.PredictRequest()
+    def serialize(self, data: Union["np.ndarray", List, Tuple]) -> bytes:
         if _is_pil_image(data):
             data = np.asarray(data)
         elif isinstance(data, (bytes, str)):
@@ -506,70 +830,88 @@ class PyTorchSerializer(SerializerBase):
         if isinstance(data, np.ndarray):
             # if input data type is np.ndarray, we assume there is only one input data
             # for the prediction request.
-            self._put_value(
-                request,
-                index=0,
-                shape=data.shape,
-                data_type=self._np_dtype_to_torch_dtype(data.dtype.type),
-                data=np.ravel(data).tolist(),
-            )
+            inputs = [data]
         elif isinstance(data, (List, Tuple)):
             # if input data type is List or Tuple, we assume there is multi input data.
             # for the prediction request.
-            for idx, item in enumerate(data):
-                if not isinstance(item, np.ndarray):
-                    item = np.asarray(item)
-                if not item:
-                    continue
-                self._put_value(
-                    request,
-                    index=0,
-                    shape=item.shape,
-                    data_type=self._np_dtype_to_torch_dtype(item.dtype.type),
-                    data=np.ravel(item).tolist(),
-                )
+            inputs = [np.asarray(item) for item in data]
+            inputs = [item for item in inputs if item.size]
         else:
             raise ValueError(
                 "PyTorchSerializer accept List, Tuple as input request data."
             )
-        return request.SerializeToString()
+
+        # Serialize the inputs as the repeated `inputs` field of PredictRequest.
+        request = []
+        for value in inputs:
+            data_type = self._np_dtype_to_torch_dtype(value.dtype.type)
+            if not self._codec.supports(data_type):
+                raise ValueError(
+                    f"Not supported PyTorch request data type: {data_type}"
+                )
+            request.append(
+                encode_length_delimited(
+                    _PT_PREDICT_REQUEST_INPUTS_FIELD,
+                    self._codec.encode(data_type, value.shape, value),
+                )
+            )
+        return b"".join(request)
+
+    def merge_batch(
+        self, data_list: List[Any]
+    ) -> Tuple[Union["np.ndarray", List["np.ndarray"]], List[int]]:
+        if not all(isinstance(data, (List, Tuple)) for data in data_list):
+            if any(isinstance(data, (List, Tuple)) for data in data_list):
+                raise ValueError(
+                    "Could not merge multi-inputs and single input data into a batch."
+                )
+            return _concat_arrays(data_list)
+
+        if len(set(len(data) for data in data_list)) != 1:
+            raise ValueError("Input data in a batch should have the same input count.")
+        batch, batch_sizes = [], None
+        for inputs in zip(*data_list):
+            value, sizes = _concat_arrays(list(inputs))
+            if batch_sizes is not None and sizes != batch_sizes:
+                raise ValueError(
+                    "Inputs of a prediction call should have the same first dimension."
+                )
+            batch.append(value)
+            batch_sizes = sizes
+        return batch, batch_sizes
+
+    def split_batch(
+        self, data: Union["np.ndarray", List["np.ndarray"]], batch_sizes: List[int]
+    ) -> List[Union["np.ndarray", List["np.ndarray"]]]:
+        if isinstance(data, list):
+            return [
+                list(outputs)
+                for outputs in zip(
+                    *[_split_array(value, batch_sizes) for value in data]
+                )
+            ]
+        return _split_array(data, batch_sizes)
 
     def deserialize(self, data: bytes):
-        resp = pt_pb.PredictResponse()
-        resp.ParseFromString(data)
-        if len(resp.outputs) > 1:
-            results = []
-            for idx in range(resp.outputs):
-                results.append(self._get_value(resp, idx))
+        results = []
+        # Iterate over the repeated `outputs` field of PredictResponse.
+        for field_number, wire_type, output in iter_fields(data):
+            if (
+                field_number != _PT_PREDICT_RESPONSE_OUTPUTS_FIELD
+                or wire_type != WireType.LENGTH_DELIMITED
+            ):
+                continue
+            result = self._codec.decode(output)
+            if result is None:
+                result = self._get_value(pt_pb.ArrayProto.FromString(bytes(output)))
+            results.append(result)
+
+        if len(results) > 1:
             return results
-        elif len(resp.outputs) == 1:
-            return self._get_value(resp, index=0)
-
-    def _put_value(
-        self, request: pt_pb.PredictRequest, index: int, shape, data_type, data
-    ):
-        while len(request.inputs) < index + 1:
-            request.inputs.add()
-        request.inputs[index].dtype = data_type
-        request.inputs[index].array_shape.dim.extend(shape)
-        if data_type == pt_pb.DT_FLOAT:
-            request.inputs[index].float_val.extend(data)
-        elif data_type == pt_pb.DT_DOUBLE:
-            request.inputs[index].double_val.extend(data)
-        elif data_type in (
-            pt_pb.DT_INT8,
-            pt_pb.DT_INT16,
-            pt_pb.DT_INT32,
-            pt_pb.DT_UINT8,
-        ):
-            request.inputs[index].int_val.extend(data)
-        elif data_type == pt_pb.DT_INT64:
-            request.inputs[index].int64_val.extend(data)
-        else:
-            raise ValueError(f"Not supported PyTorch request data type: {data_type}")
+        elif len(results) == 1:
+            return results[0]
 
-    def _get_value(self, response: pt_pb.PredictResponse, index: int):
-        output = response.outputs[index]
+    def _get_value(self, output: "pt_pb.ArrayProto"):
         if output.dtype == pt_pb.DT_INVALID:
             return
 
@@ -18,26 +18,36 @@ import json
 import logging
 import os.path
 import posixpath
+import threading
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
-import oss2
 from alibabacloud_credentials.models import Config as CredentialConfig
 from alibabacloud_credentials.utils import auth_constant
 
 from .api.api_container import ResourceAPIsContainerMixin
-from .common.consts import DEFAULT_CONFIG_PATH
-from .common.oss_utils import CredentialProviderWrapper, OssUriObj
-from .common.utils import is_domain_connectable, make_list_resource_iterator
+from .common.consts import DEFAULT_CACHE_DIR, DEFAULT_CONFIG_PATH
+from .common.instance_catalog import InstanceSpec, InstanceTypeCatalog
+from .common.utils import (
+    LazyModule,
+    is_domain_connectable,
+    make_list_resource_iterator,
+)
+from .watcher import Watcher
 
 logger = logging.getLogger(__name__)
 
+oss2 = LazyModule("oss2")
+
 # Environment variable that indicates where the config path is located.
 # If it is not provided, "$HOME/.pai/config.json" is used as the default config path.
 ENV_PAI_CONFIG_PATH = "PAI_CONFIG_PATH"
 
 INNER_REGION_IDS = ["center"]
 
+# Page size used to list the instance types supported by training job.
+_LIST_ECS_SPECS_PAGE_SIZE = 100
+
 
 # Global default session used by the program.
 _default_session = None
@@ -182,6 +192,9 @@ class Session(ResourceAPIsContainerMixin):
         credential_config: Optional[CredentialConfig] = None,
         oss_bucket_name: Optional[str] = None,
         oss_endpoint: Optional[str] = None,
+        oss_connection_pool_size: Optional[int] = None,
+        api_cache_ttl: Optional[Dict[str, float]] = None,
+        persist_instance_catalog: bool = False,
         **kwargs,
     ):
         """PAI Session Initializer.
@@ -196,6 +209,19 @@ class Session(ResourceAPIsContainerMixin):
             oss_bucket_name (str, optional): The name of the OSS bucket used in the
                 session.
             oss_endpoint (str, optional): The endpoint for the OSS bucket.
+            oss_connection_pool_size (int, optional): Size of the HTTP connection pool
+                shared by the OSS buckets of the session. If it is not provided,
+                `oss2.defaults.connection_pool_size` is used.
+            api_cache_ttl (Dict[str, float], optional): Mapping from the resource
+                type to the seconds that the describe/get results of the resource
+                are cached for, such as ``{"Service": 5, "Workspace": 300}``.
+                Concurrent identical requests share one in-flight call, and the
+                cached results are invalidated by the mutating calls of the
+                resource, such as start, stop, update, and delete. The cache is
+                disabled by default.
+            persist_instance_catalog (bool): Whether to persist the catalog of the
+                supported instance types to the local cache directory, so that it's
+                reused by other processes until it expires. Defaults to False.
         """
 
         if not region_id:
@@ -206,9 +232,18 @@ class Session(ResourceAPIsContainerMixin):
         self._workspace_id = workspace_id
         self._oss_bucket_name = oss_bucket_name
         self._oss_endpoint = oss_endpoint
+        self._oss_connection_pool_size = oss_connection_pool_size
+        self._oss_auth = None
+        self._oss_http_session = None
+        self._oss_buckets: Dict[Tuple[str, str], "oss2.Bucket"] = dict()
+        self._oss_lock = threading.Lock()
+        self._persist_instance_catalog = persist_instance_catalog
+        self._instance_catalogs: Dict[str, InstanceTypeCatalog] = dict()
+        self._watcher: Optional[Watcher] = None
+        self._provider: Optional[str] = None
 
         header = kwargs.pop("header", None)
-        super(Session, self).__init__(header=header)
+        super(Session, self).__init__(header=header, api_cache_ttl=api_cache_ttl)
 
     @property
     def region_id(self) -> str:
@@ -243,8 +278,10 @@ class Session(ResourceAPIsContainerMixin):
 
     @property
     def provider(self) -> str:
-        caller_identity = self._acs_sts_client.get_caller_identity().body
-        return caller_identity.account_id
+        if self._provider is None:
+            caller_identity = self._acs_sts_client.get_caller_identity().body
+            self._provider = caller_identity.account_id
+        return self._provider
 
     @property
     def workspace_id(self) -> str:
@@ -263,6 +300,8 @@ class Session(ResourceAPIsContainerMixin):
         self,
     ):
         """Initialize a OssConfig instance."""
+        from .common.oss_utils import OssUriObj
+
         if not self._oss_bucket_name:
             # If OSS bucket name is not provided, use the default OSS storage URI
             # that is configured for the workspace.
@@ -279,25 +318,44 @@ class Session(ResourceAPIsContainerMixin):
         if not self._oss_endpoint:
             self._oss_endpoint = self._get_default_oss_endpoint()
 
-    def _get_oss_auth(self):
-        auth = oss2.ProviderAuth(
-            credentials_provider=CredentialProviderWrapper(
-                config=self._credential_config,
+    def _get_oss_bucket(self, bucket_name: str, endpoint: str) -> "oss2.Bucket":
+        """Returns a cached OSS bucket instance for the bucket and endpoint.
+
+        The bucket instances of the session share the credentials provider and the
+        HTTP connection pool.
+        """
+        from .common.oss_utils import CredentialProviderWrapper
+
+        with self._oss_lock:
+            bucket = self._oss_buckets.get((bucket_name, endpoint))
+            if bucket:
+                return bucket
+            if not self._oss_auth:
+                self._oss_auth = oss2.ProviderAuth(
+                    credentials_provider=CredentialProviderWrapper(
+                        client=self._acs_credential_client(),
+                    )
+                )
+            if not self._oss_http_session:
+                self._oss_http_session = oss2.Session(
+                    pool_size=self._oss_connection_pool_size
+                    or oss2.defaults.connection_pool_size
+                )
+            bucket = oss2.Bucket(
+                auth=self._oss_auth,
+                endpoint=endpoint,
+                bucket_name=bucket_name,
+                session=self._oss_http_session,
             )
-        )
-        return auth
+            self._oss_buckets[(bucket_name, endpoint)] = bucket
+            return bucket
 
     @property
     def oss_bucket(self):
         """A OSS2 bucket instance used by the session."""
         if not self._oss_bucket_name or not self._oss_endpoint:
             self._init_oss_config()
-        oss_bucket = oss2.Bucket(
-            auth=self._get_oss_auth(),
-            endpoint=self._oss_endpoint,
-            bucket_name=self._oss_bucket_name,
-        )
-        return oss_bucket
+        return self._get_oss_bucket(self._oss_bucket_name, self._oss_endpoint)
 
     def save_config(self, config_path=None):
         """Save the configuration of the session to a local file."""
@@ -315,6 +373,8 @@ class Session(ResourceAPIsContainerMixin):
         logger.info("Write PAI config succeed: config_path=%s" % config_path)
 
     def patch_oss_endpoint(self, oss_uri: str):
+        from .common.oss_utils import OssUriObj
+
         oss_uri_obj = OssUriObj(oss_uri)
         if oss_uri_obj.endpoint:
             return oss_uri
@@ -345,7 +405,7 @@ class Session(ResourceAPIsContainerMixin):
             else internet_endpoint
         )
 
-    def get_oss_bucket(self, bucket_name: str, endpoint: str = None) -> oss2.Bucket:
+    def get_oss_bucket(self, bucket_name: str, endpoint: str = None) -> "oss2.Bucket":
         """Get a OSS bucket using the credentials of the session.
 
         Args:
@@ -357,12 +417,7 @@ class Session(ResourceAPIsContainerMixin):
 
         """
         endpoint = endpoint or self._oss_endpoint or self._get_default_oss_endpoint()
-        oss_bucket = oss2.Bucket(
-            auth=self._get_oss_auth(),
-            endpoint=endpoint,
-            bucket_name=bucket_name,
-        )
-        return oss_bucket
+        return self._get_oss_bucket(bucket_name, endpoint)
 
     @classmethod
     def get_storage_path_by_category(
@@ -385,55 +440,184 @@ class Session(ResourceAPIsContainerMixin):
             storage_path += "/"
         return storage_path
 
+    def _get_instance_catalog(
+        self, name: str, loader: Callable[[], Iterable[InstanceSpec]]
+    ) -> InstanceTypeCatalog:
+        if name not in self._instance_catalogs:
+            cache_file = (
+                os.path.join(
+                    DEFAULT_CACHE_DIR,
+                    "instance_types",
+                    f"{name}-{self._region_id}.json",
+                )
+                if self._persist_instance_catalog
+                else None
+            )
+            self._instance_catalogs[name] = InstanceTypeCatalog(
+                loader=loader, cache_file=cache_file
+            )
+        return self._instance_catalogs[name]
+
+    def _list_training_instance_specs(self) -> Iterable[InstanceSpec]:
+        instance_generator = make_list_resource_iterator(
+            self.job_api.list_ecs_specs, page_size=_LIST_ECS_SPECS_PAGE_SIZE
+        )
+        return [InstanceSpec.from_ecs_spec(item) for item in instance_generator]
+
+    def _list_inference_instance_specs(self) -> Iterable[InstanceSpec]:
+        return [
+            InstanceSpec.from_machine_spec(item)
+            for item in self.service_api.describe_machine()["InstanceMetas"]
+        ]
+
+    @property
+    def training_instance_catalog(self) -> InstanceTypeCatalog:
+        """Catalog of the instance types supported for training."""
+        return self._get_instance_catalog(
+            "training", self._list_training_instance_specs
+        )
+
+    @property
+    def inference_instance_catalog(self) -> InstanceTypeCatalog:
+        """Catalog of the instance types supported for inference."""
+        return self._get_instance_catalog(
+            "inference", self._list_inference_instance_specs
+        )
+
+    @property
+    def watcher(self) -> Watcher:
+        """Watcher shared by the waits of the resources in the session."""
+        if not self._watcher:
+            self._watcher = Watcher(session=self)
+        return self._watcher
+
     def is_supported_training_instance(self, instance_type: str) -> bool:
         """Check if the instance type is supported for training."""
-        instance_generator = make_list_resource_iterator(self.job_api.list_ecs_specs)
-        machine_spec = next(
-            (
-                item
-                for item in instance_generator
-                if item["InstanceType"] == instance_type
-            ),
-            None,
-        )
-        return bool(machine_spec)
+        return instance_type in self.training_instance_catalog
 
     def is_gpu_training_instance(self, instance_type: str) -> bool:
         """Check if the instance type is GPU instance for training."""
-        instance_generator = make_list_resource_iterator(self.job_api.list_ecs_specs)
-        machine_spec = next(
-            (
-                item
-                for item in instance_generator
-                if item["InstanceType"] == instance_type
-            ),
-            None,
-        )
-        if not machine_spec:
+        spec = self.training_instance_catalog.get(instance_type)
+        if not spec:
             raise ValueError(
                 f"Instance type {instance_type} is not supported for training job. "
                 "Please provide a supported instance type."
             )
-        return machine_spec["AcceleratorType"] == "GPU"
+        return spec.is_gpu
 
     def is_supported_inference_instance(self, instance_type: str) -> bool:
         """Check if the instance type is supported for inference."""
-        res = self.service_api.describe_machine()["InstanceMetas"]
-        spec = next(
-            (item for item in res if item["InstanceType"] == instance_type), None
-        )
-        return bool(spec)
+        return instance_type in self.inference_instance_catalog
 
     def is_gpu_inference_instance(self, instance_type: str) -> bool:
         """Check if the instance type is GPU instance for inference."""
-        res = self.service_api.describe_machine()["InstanceMetas"]
-        spec = next(
-            (item for item in res if item["InstanceType"] == instance_type), None
-        )
-
+        spec = self.inference_instance_catalog.get(instance_type)
         if not spec:
             raise ValueError(
                 f"Instance type {instance_type} is not supported for deploying. "
                 "Please provide a supported instance type."
             )
-        return bool(spec["GPU"])
+        return spec.is_gpu
+
+
+class _AsyncResourceAPI(object):
+    """A view of a ResourceAPI that exposes its async methods under the name of the
+    sync method, for example ``service_api.get`` is mapped to
+    ``ServiceAPI.get_async``."""
+
+    def __init__(self, api):
+        self._api = api
+
+    def __getattr__(self, name):
+        method = getattr(self._api, name + "_async", None)
+        if method is None:
+            raise AttributeError(
+                f"{type(self._api).__name__} does not provide async method: {name}"
+            )
+        return method
+
+
+class AsyncSession(object):
+    """A session providing awaitable resource APIs.
+
+    The async session shares the credentials, clients, and configurations of the
+    wrapped :class:`Session`. Requests are sent by the async variant of the
+    generated clients, so that many jobs and services can be watched from one event
+    loop without a thread for each of them.
+
+    Examples::
+
+        session = AsyncSession()
+
+        async def wait_for_services(names):
+            return await asyncio.gather(
+                *[session.service_api.get(name) for name in names]
+            )
+
+    """
+
+    def __init__(self, session: Optional[Session] = None):
+        """AsyncSession initializer.
+
+        Args:
+            session (Session, optional): The session to be wrapped, the default
+                session is used if not provided.
+        """
+        session = session or get_default_session()
+        if not session:
+            raise ValueError(
+                "Default session is not initialized, please provide a session or run"
+                " `python -m pai.toolkit.config` to setup the default session."
+            )
+        self._session = session
+        self._apis = dict()
+
+    @property
+    def session(self) -> Session:
+        """The wrapped sync session."""
+        return self._session
+
+    def _get_async_api(self, name: str) -> _AsyncResourceAPI:
+        if name not in self._apis:
+            self._apis[name] = _AsyncResourceAPI(getattr(self._session, name))
+        return self._apis[name]
+
+    @property
+    def job_api(self):
+        return self._get_async_api("job_api")
+
+    @property
+    def code_source_api(self):
+        return self._get_async_api("code_source_api")
+
+    @property
+    def dataset_api(self):
+        return self._get_async_api("dataset_api")
+
+    @property
+    def model_api(self):
+        return self._get_async_api("model_api")
+
+    @property
+    def service_api(self):
+        return self._get_async_api("service_api")
+
+    @property
+    def workspace_api(self):
+        return self._get_async_api("workspace_api")
+
+    @property
+    def algorithm_api(self):
+        return self._get_async_api("algorithm_api")
+
+    @property
+    def training_job_api(self):
+        return self._get_async_api("training_job_api")
+
+    @property
+    def pipeline_api(self):
+        return self._get_async_api("pipeline_api")
+
+    @property
+    def pipeline_run_api(self):
+        return self._get_async_api("pipeline_run_api")
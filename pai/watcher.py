@@ -0,0 +1,399 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .api.base import PaginatedResult, PAIRestResourceTypes
+from .common.utils import BackoffStrategy, make_backoff_intervals, set_future
+
+logger = logging.getLogger(__name__)
+
+# Max polling interval of the watches that a caller is blocked on, such as waiting
+# for the service to be running, the completion is detected within the seconds.
+WAIT_MAX_INTERVAL = 5
+
+
+class _WatchSource(object):
+    """Describe how to fetch the API objects of a type of resource."""
+
+    # Key of the resource ID in the API object.
+    id_key: str = None
+    # Keys of the API object that identify a state change of the resource.
+    state_keys: Tuple[str, ...] = ("Status",)
+
+    def __init__(self, session):
+        self.session = session
+
+    def get(self, resource_id: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def list(
+        self, page_number: int, page_size: int, resource_ids: Set[str]
+    ) -> Optional[PaginatedResult]:
+        """List the resources, narrowed down to the given resources where the API
+        supports the filter, returns None if the batch list is not supported."""
+        return None
+
+    def state_of(self, obj: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple(obj.get(k) for k in self.state_keys)
+
+
+class _ServiceSource(_WatchSource):
+    id_key = "ServiceName"
+    state_keys = ("Status", "Reason", "Message")
+
+    def get(self, resource_id: str) -> Dict[str, Any]:
+        return self.session.service_api.get(resource_id)
+
+    def list(
+        self, page_number: int, page_size: int, resource_ids: Set[str]
+    ) -> Optional[PaginatedResult]:
+        # The filter is a fuzzy match of the service name, the common prefix of the
+        # names matches all of them.
+        return self.session.service_api.list(
+            filter=os.path.commonprefix(sorted(resource_ids)) or None,
+            page_number=page_number,
+            page_size=page_size,
+        )
+
+
+class _TrainingJobSource(_WatchSource):
+    id_key = "TrainingJobId"
+    state_keys = ("Status", "ReasonCode", "ReasonMessage")
+
+    def get(self, resource_id: str) -> Dict[str, Any]:
+        return self.session.training_job_api.get(resource_id)
+
+    def list(
+        self, page_number: int, page_size: int, resource_ids: Set[str]
+    ) -> Optional[PaginatedResult]:
+        # The training jobs can be filtered by the name only, rather than the ID.
+        return self.session.training_job_api.list(
+            page_number=page_number, page_size=page_size
+        )
+
+
+_WATCH_SOURCES = {
+    PAIRestResourceTypes.Service: _ServiceSource,
+    PAIRestResourceTypes.TrainingJob: _TrainingJobSource,
+}
+
+
+class _Watch(object):
+    """A registered watch of a resource."""
+
+    def __init__(
+        self,
+        resource_type: str,
+        resource_id: str,
+        is_done: Callable[[Dict[str, Any]], bool],
+        on_change: Optional[Callable[[Dict[str, Any]], None]],
+        schedule: Callable[[], Iterator[float]],
+        next_poll: float,
+    ):
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.is_done = is_done
+        self.on_change = on_change
+        self.schedule = schedule
+        self.intervals = schedule()
+        self.next_poll = next_poll
+        self.last_state = None
+        self.errors = 0
+        self.future = Future()
+
+
+def wait_watch(
+    future: Future,
+    timeout: Optional[float] = None,
+    on_waiting: Optional[Callable[[float], None]] = None,
+    waiting_interval: float = 30,
+) -> Any:
+    """Wait for the result of a watch, calling on_waiting with the elapsed seconds
+    every waiting_interval seconds until it's done, so a long wait is not silent.
+
+    Raises:
+        concurrent.futures.TimeoutError: If the watch is not done in the timeout.
+    """
+    start = time.monotonic()
+    while True:
+        wait = waiting_interval
+        if timeout is not None:
+            wait = min(wait, max(timeout - (time.monotonic() - start), 0))
+        try:
+            return future.result(timeout=wait)
+        except FutureTimeoutError:
+            elapsed = time.monotonic() - start
+            if timeout is not None and elapsed >= timeout:
+                raise
+            if on_waiting:
+                on_waiting(elapsed)
+
+
+class Watcher(object):
+    """A watcher that tracks the status of many resources in one polling loop.
+
+    Resources of the same type due for polling are fetched together: if more than
+    one of them are due, the watcher lists the resources page by page, filtered by
+    the names where the API supports, and falls back to get the resources that are
+    not found within the listed pages. The next page is listed only if each of the
+    listed pages has found a due resource on average, so the number of API calls of
+    a poll is at most one more than the number of the due resources, and fewer if
+    the listed pages contain them.
+
+    The polling interval of a resource grows exponentially while its state is not
+    changed, and is reset once it changes. A random jitter is applied to the
+    interval to avoid the synchronized polling of the resources.
+
+    Examples::
+
+        watcher = session.watcher
+        future = watcher.watch(
+            PAIRestResourceTypes.Service,
+            "my_service",
+            is_done=lambda obj: obj["Status"] == "Running",
+            on_change=lambda obj: print(obj["Status"]),
+        )
+        service_api_object = future.result()
+
+        # In a coroutine, the future is awaitable with asyncio.wrap_future.
+        service_api_object = await asyncio.wrap_future(future)
+
+    """
+
+    def __init__(
+        self,
+        session,
+        min_interval: float = 2,
+        max_interval: float = 30,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.2,
+        max_errors: int = 5,
+        list_page_size: int = 100,
+    ):
+        """Watcher initializer.
+
+        Args:
+            session (:class:`pai.session.Session`): The session used to fetch the
+                resources.
+            min_interval (float): Default min interval in seconds between two polls
+                of a resource.
+            max_interval (float): Max interval in seconds between two polls of a
+                resource.
+            backoff_factor (float): Factor the interval grows by when the state of
+                the resource is not changed.
+            jitter (float): The interval is randomized by the ratio of jitter.
+            max_errors (int): The watch fails after the number of consecutive
+                errors when fetching the resource.
+            list_page_size (int): Page size of the list calls.
+        """
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.max_errors = max_errors
+        self.list_page_size = list_page_size
+
+        self._sources = dict()
+        self._watches: List[_Watch] = []
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def watch(
+        self,
+        resource_type: str,
+        resource_id: str,
+        is_done: Callable[[Dict[str, Any]], bool],
+        on_change: Optional[Callable[[Dict[str, Any]], None]] = None,
+        interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        delay: float = 0,
+        schedule: Optional[Callable[[], Iterator[float]]] = None,
+    ) -> Future:
+        """Watch a resource until it's done.
+
+        Args:
+            resource_type (str): Type of the resource, supports "Service" and
+                "TrainingJob".
+            resource_id (str): ID of the resource, it's the service name for the
+                service.
+            is_done (Callable): A function that returns True if the watch is done
+                with the API object. If it raises an exception, the watch fails
+                with the exception.
+            on_change (Callable, optional): A callback invoked with the API object
+                when the state of the resource is changed.
+            interval (float, optional): Min polling interval of the resource,
+                defaults to the min_interval of the watcher.
+            max_interval (float, optional): Max polling interval of the resource,
+                defaults to the max_interval of the watcher. A caller blocked on the
+                watch may set a lower one to detect the completion sooner.
+            delay (float): Seconds before the first poll of the resource.
+            schedule (Callable, optional): A factory of the iterator of the polling
+                intervals, which is restarted once the state of the resource is
+                changed. Defaults to the exponential backoff of the watcher, starting
+                from the interval.
+
+        Returns:
+            concurrent.futures.Future: A future that resolves to the API object
+                that satisfies the is_done function.
+        """
+        if resource_type not in _WATCH_SOURCES:
+            raise ValueError(f"Resource type is not supported: {resource_type}")
+        if not schedule:
+            min_interval = interval or self.min_interval
+            max_interval = max(max_interval or self.max_interval, min_interval)
+
+            def schedule():
+                return make_backoff_intervals(
+                    min_interval=min_interval,
+                    max_interval=max_interval,
+                    strategy=BackoffStrategy.Exponential,
+                    factor=self.backoff_factor,
+                    jitter=self.jitter,
+                )
+
+        w = _Watch(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            is_done=is_done,
+            on_change=on_change,
+            schedule=schedule,
+            next_poll=time.monotonic() + delay,
+        )
+        with self._cond:
+            self._watches.append(w)
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="pai-watcher", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return w.future
+
+    def _get_source(self, resource_type: str) -> _WatchSource:
+        if resource_type not in self._sources:
+            self._sources[resource_type] = _WATCH_SOURCES[resource_type](self.session)
+        return self._sources[resource_type]
+
+    def _next_due(self) -> List[_Watch]:
+        """Wait for the watches that are due for polling, returns an empty list if
+        there is nothing to watch."""
+        with self._cond:
+            while True:
+                self._watches = [w for w in self._watches if not w.future.done()]
+                if not self._watches:
+                    self._thread = None
+                    return []
+                now = time.monotonic()
+                due = [w for w in self._watches if w.next_poll <= now]
+                if due:
+                    return due
+                self._cond.wait(min(w.next_poll for w in self._watches) - now)
+
+    def _run(self):
+        try:
+            self._poll_forever()
+        except Exception as e:
+            logger.error("The watcher stopped unexpectedly: %s", e)
+            with self._cond:
+                watches, self._watches = self._watches, []
+                self._thread = None
+            for w in watches:
+                set_future(w.future, exception=e)
+
+    def _poll_forever(self):
+        while True:
+            due = self._next_due()
+            if not due:
+                return
+            by_type: Dict[str, List[_Watch]] = dict()
+            for w in due:
+                by_type.setdefault(w.resource_type, []).append(w)
+            for resource_type, watches in by_type.items():
+                source = self._get_source(resource_type)
+                results = self._fetch(source, {w.resource_id for w in watches})
+                for w in watches:
+                    self._update(w, source, results[w.resource_id])
+
+    def _fetch(self, source: _WatchSource, resource_ids) -> Dict[str, Any]:
+        """Fetch the API objects of the resources, the value is the exception if
+        failed to fetch the resource."""
+        results = dict()
+        remaining = set(resource_ids)
+        page_number, found = 1, 0
+        # Stop listing once the listed pages found less resources than the calls
+        # they took, at most one call is wasted by the listing.
+        while len(remaining) > 1 and found >= page_number - 1:
+            try:
+                page = source.list(page_number, self.list_page_size, remaining)
+            except Exception as e:
+                logger.debug("Failed to list the resources: %s", e)
+                break
+            if page is None:
+                break
+            for obj in page.items:
+                if obj.get(source.id_key) in remaining:
+                    results[obj[source.id_key]] = obj
+                    remaining.discard(obj[source.id_key])
+                    found += 1
+            if len(page.items) < self.list_page_size:
+                break
+            page_number += 1
+
+        for resource_id in remaining:
+            try:
+                results[resource_id] = source.get(resource_id)
+            except Exception as e:
+                results[resource_id] = e
+        return results
+
+    def _next_interval(self, w: _Watch, changed: bool) -> float:
+        if changed:
+            w.intervals = w.schedule()
+        return next(w.intervals)
+
+    def _update(self, w: _Watch, source: _WatchSource, obj):
+        if w.future.done():
+            return
+        if isinstance(obj, Exception):
+            w.errors += 1
+            if w.errors >= self.max_errors:
+                set_future(w.future, exception=obj)
+                return
+            logger.debug("Failed to fetch the resource %s: %s", w.resource_id, obj)
+            w.next_poll = time.monotonic() + self._next_interval(w, changed=False)
+            return
+
+        w.errors = 0
+        state = source.state_of(obj)
+        changed = state != w.last_state
+        w.last_state = state
+        try:
+            if changed and w.on_change:
+                w.on_change(obj)
+            done = w.is_done(obj)
+        except Exception as e:
+            set_future(w.future, exception=e)
+            return
+        if done:
+            set_future(w.future, result=obj)
+        else:
+            w.next_poll = time.monotonic() + self._next_interval(w, changed)
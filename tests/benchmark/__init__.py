@@ -0,0 +1,34 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from typing import Any, List
+
+
+def format_bytes(n: float) -> str:
+    """Format the number of bytes in human-readable form."""
+    for unit in ["B", "KB", "MB"]:
+        if abs(n) < 1024:
+            return "{:.1f} {}".format(n, unit)
+        n /= 1024
+    return "{:.1f} GB".format(n)
+
+
+def print_table(headers: List[str], rows: List[List[Any]]):
+    """Print the benchmark result as a plain text table."""
+    rows = [[str(c) for c in row] for row in rows]
+    widths = [max(len(r[i]) for r in [headers] + rows) for i in range(len(headers))]
+    print()
+    for row in [headers] + rows:
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths)))
@@ -0,0 +1,91 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Import time benchmark of the SDK modules.
+
+Each module is imported in a fresh interpreter, the benchmark also checks that the
+heavy dependencies are not imported until they are used.
+
+Run the benchmark with:
+
+    python -m tests.benchmark.test_import_benchmark
+
+"""
+
+import json
+import subprocess
+import sys
+
+from tests.benchmark import print_table
+
+MODULES = ["pai", "pai.session", "pai.serializers", "pai.predictor"]
+
+# Dependencies that should be imported on first use.
+LAZY_MODULES = [
+    "numpy",
+    "aiohttp",
+    "oss2",
+    "eas_prediction",
+    "alibabacloud_tea_openapi.client",
+    "pai.api.service",
+    "pai.libs.alibabacloud_eas20210701.client",
+    "pai.libs.alibabacloud_eas20210701.models",
+    "pai.libs.alibabacloud_aiworkspace20210204.models",
+    "pai.libs.alibabacloud_pai_dlc20201203.models",
+    "pai.libs.alibabacloud_paiflow20210202.models",
+    "pai.libs.alibabacloud_paistudio20220112.models",
+]
+
+REPEAT = 3
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": list(sys.modules)}}))
+"""
+
+
+def _import_in_subprocess(module: str):
+    output = subprocess.check_output(
+        [sys.executable, "-c", _SCRIPT.format(module=module)]
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def run_benchmark(modules=None, repeat=REPEAT):
+    rows = []
+    for module in modules or MODULES:
+        results = [_import_in_subprocess(module) for _ in range(repeat)]
+        loaded = sorted(set(LAZY_MODULES).intersection(results[0]["modules"]))
+        rows.append(
+            [
+                module,
+                "{:.1f} ms".format(min(r["elapsed"] for r in results) * 1000),
+                ",".join(loaded) or "-",
+            ]
+        )
+    return rows
+
+
+def test_import_benchmark():
+    rows = run_benchmark()
+    print_table(["module", "import time", "heavy modules loaded"], rows)
+    for row in rows:
+        assert row[2] == "-", f"Heavy modules are imported by {row[0]}: {row[2]}"
+
+
+if __name__ == "__main__":
+    test_import_benchmark()
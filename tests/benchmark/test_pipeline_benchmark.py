@@ -0,0 +1,83 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Construction time benchmark of the Pipeline with many steps.
+
+The steps are unnamed, each of them depends on the previous one and a few random
+earlier steps, which is the shape of the generated loop unrolls.
+
+Run the benchmark with:
+
+    python -m tests.benchmark.test_pipeline_benchmark
+
+"""
+
+import random
+import time
+
+from pai.pipeline import Pipeline
+from pai.pipeline.component import ContainerComponent
+from pai.pipeline.types import PipelineParameter
+from tests.benchmark import print_table
+
+STEP_COUNTS = [10, 1000, 10000]
+
+# Number of the random earlier steps a step depends on.
+EXTRA_DEPENDS = 2
+
+
+def _make_steps(count: int):
+    op = ContainerComponent(
+        image_uri="python:3",
+        inputs=[PipelineParameter(name="foo", default="hello")],
+        outputs=[PipelineParameter(name="outputParam")],
+        command="echo hello",
+    )
+    rand = random.Random(0)
+    steps = []
+    for i in range(count):
+        depends = steps[-1:] + rand.sample(steps, min(EXTRA_DEPENDS, len(steps)))
+        steps.append(op.as_step(depends=set(depends)))
+    return steps
+
+
+def run_benchmark(step_counts=None):
+    rows = []
+    for count in step_counts or STEP_COUNTS:
+        steps = _make_steps(count)
+        start = time.perf_counter()
+        sorted_steps = Pipeline._topo_sort(set(steps))
+        sort_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pipeline = Pipeline(steps=steps)
+        build_time = time.perf_counter() - start
+        assert sorted_steps == steps and pipeline.steps == steps
+        rows.append(
+            [
+                count,
+                "{:.1f} ms".format(sort_time * 1000),
+                "{:.1f} ms".format(build_time * 1000),
+            ]
+        )
+    return rows
+
+
+def test_pipeline_benchmark():
+    rows = run_benchmark()
+    print_table(["steps", "topo sort", "pipeline construction"], rows)
+
+
+if __name__ == "__main__":
+    test_pipeline_benchmark()
@@ -0,0 +1,117 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Throughput benchmark of the tensor serialization of TensorFlowSerializer.
+
+Run the benchmark with:
+
+    python -m tests.benchmark.test_serializer_benchmark
+
+"""
+
+import time
+
+import numpy as np
+from eas_prediction import tf_request_pb2 as tf_pb
+
+from pai.common.proto_utils import encode_length_delimited
+from pai.serializers import TensorFlowSerializer
+from tests.benchmark import format_bytes, print_table
+
+TENSOR_SIZES = [1 << 10, 1 << 20, 10 << 20, 100 << 20]
+# Sizes benchmarked with the protobuf repeated field path, it's too slow for the
+# larger tensors.
+LEGACY_TENSOR_SIZES = [1 << 10, 1 << 20]
+
+DTYPES = [np.float32, np.int64, np.bool_]
+
+
+def _make_tensor(dtype, nbytes: int) -> np.ndarray:
+    count = max(nbytes // np.dtype(dtype).itemsize, 1)
+    if dtype == np.bool_:
+        return np.random.rand(count) > 0.5
+    elif np.issubdtype(dtype, np.integer):
+        return np.random.randint(-(2**40), 2**40, size=count, dtype=dtype)
+    return np.random.rand(count).astype(dtype)
+
+
+def _make_response(serializer: TensorFlowSerializer, value: np.ndarray) -> bytes:
+    data_type = serializer._np_dtype_to_tf_dtype(value.dtype.type)
+    entry = encode_length_delimited(1, b"output") + encode_length_delimited(
+        2, serializer._codec.encode(data_type, value.shape, value)
+    )
+    return encode_length_delimited(1, entry)
+
+
+def _legacy_serialize(serializer: TensorFlowSerializer, value: np.ndarray) -> bytes:
+    request = tf_pb.PredictRequest()
+    serializer._put_value(
+        request,
+        name="input",
+        data_type=serializer._np_dtype_to_tf_dtype(value.dtype.type),
+        shape=value.shape,
+        data=np.ravel(value).tolist(),
+    )
+    return request.SerializeToString()
+
+
+def _timeit(fn, min_time: float = 0.2) -> float:
+    """Returns the average seconds of a call to the function."""
+    count, start = 0, time.perf_counter()
+    while True:
+        fn()
+        count += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / count
+
+
+def run_benchmark(sizes=None, legacy_sizes=None):
+    sizes = sizes or TENSOR_SIZES
+    legacy_sizes = LEGACY_TENSOR_SIZES if legacy_sizes is None else legacy_sizes
+    serializer = TensorFlowSerializer()
+    rows = []
+    for dtype in DTYPES:
+        for size in sizes:
+            value = _make_tensor(dtype, size)
+            data = {"input": value}
+            response = _make_response(serializer, value)
+            serialize_time = _timeit(lambda: serializer.serialize(data))
+            deserialize_time = _timeit(lambda: serializer.deserialize(response))
+            if size in legacy_sizes:
+                legacy_time = _timeit(lambda: _legacy_serialize(serializer, value))
+                legacy = format_bytes(value.nbytes / legacy_time) + "/s"
+            else:
+                legacy = "-"
+            rows.append(
+                [
+                    np.dtype(dtype).name,
+                    format_bytes(value.nbytes),
+                    format_bytes(value.nbytes / serialize_time) + "/s",
+                    format_bytes(value.nbytes / deserialize_time) + "/s",
+                    legacy,
+                ]
+            )
+    return rows
+
+
+def test_serializer_benchmark():
+    rows = run_benchmark()
+    print_table(
+        ["dtype", "size", "serialize", "deserialize", "serialize (legacy)"], rows
+    )
+
+
+if __name__ == "__main__":
+    test_serializer_benchmark()
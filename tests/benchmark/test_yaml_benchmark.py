@@ -0,0 +1,90 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Round-trip benchmark of the pipeline manifest with yaml_utils.
+
+The manifest is dumped and loaded with the dumper/loader used by yaml_utils, and
+with the pure Python implementation of PyYAML for comparison.
+
+Run the benchmark with:
+
+    python -m tests.benchmark.test_yaml_benchmark
+
+"""
+
+import time
+
+import yaml
+
+from pai.common import yaml_utils
+from pai.pipeline import Pipeline
+from tests.benchmark import format_bytes, print_table
+from tests.benchmark.test_pipeline_benchmark import _make_steps
+
+STEP_COUNTS = [10, 1000, 5000]
+
+
+class _PyNoAliasDumper(yaml.SafeDumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+def _make_manifest(count: int):
+    pipeline = Pipeline(steps=_make_steps(count))
+    return {
+        "apiVersion": "core/v1",
+        "metadata": {"identifier": "benchmark", "version": "v1"},
+        "spec": {"pipelines": [step.to_dict() for step in pipeline.steps]},
+    }
+
+
+def _timeit(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(step_counts=None):
+    rows = []
+    for count in step_counts or STEP_COUNTS:
+        manifest = _make_manifest(count)
+        text, dump_time = _timeit(lambda: yaml_utils.dump(manifest))
+        loaded, load_time = _timeit(lambda: yaml_utils.safe_load(text))
+        py_text, py_dump_time = _timeit(
+            lambda: yaml.dump(manifest, Dumper=_PyNoAliasDumper)
+        )
+        _, py_load_time = _timeit(lambda: yaml.load(py_text, Loader=yaml.SafeLoader))
+        assert loaded == manifest and "&id" not in text
+        rows.append(
+            [
+                count,
+                format_bytes(len(text)),
+                "{:.1f} ms".format(dump_time * 1000),
+                "{:.1f} ms".format(load_time * 1000),
+                "{:.1f} ms".format(py_dump_time * 1000),
+                "{:.1f} ms".format(py_load_time * 1000),
+            ]
+        )
+    return rows
+
+
+def test_yaml_benchmark():
+    rows = run_benchmark()
+    print_table(
+        ["steps", "size", "dump", "load", "dump (python)", "load (python)"], rows
+    )
+
+
+if __name__ == "__main__":
+    test_yaml_benchmark()
@@ -12,6 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from pai.common.oss_utils import OssUriObj
 from pai.exception import DuplicatedMountException, MountPathIsOccupiedException
 from pai.model import InferenceSpec
 from tests.unit import BaseUnitTestCase
@@ -94,3 +100,37 @@ class TestInferenceSpec(BaseUnitTestCase):
             infer_spec.mount(
                 "oss://pai-sdk-example/path/to/abc/", mount_path="/ml/code/"
             )
+
+    def test_mount_local_file(self):
+        local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, local_dir)
+        source = os.path.join(local_dir, "model.json")
+        with open(source, "w") as f:
+            f.write("{}")
+        session = MagicMock()
+        session.get_storage_path_by_category.side_effect = (
+            lambda category, name="20230101": f"{category}/{name}/"
+        )
+
+        with patch(
+            "pai.model.upload",
+            return_value="oss://bucket/model_data/20230101/model.json",
+        ):
+            config = InferenceSpec().mount(source, "/ml/model/", session=session)
+        self.assertEqual(config["oss"]["path"], "oss://bucket/model_data/20230101/")
+
+        with patch(
+            "pai.model.sync", return_value="oss://bucket/model_data/digest/"
+        ) as sync, patch(
+            "pai.model.get_local_path_digest", return_value="digest"
+        ), patch(
+            "pai.model.OssUriObj", wraps=OssUriObj
+        ) as uri_obj:
+            spec = InferenceSpec()
+            config = spec.mount(
+                source, "/ml/model/", session=session, content_addressed_upload=True
+            )
+        self.assertEqual(sync.call_args.kwargs["oss_path"], "model_data/digest/")
+        # The uploaded file is referenced by the object URI, as the plain upload.
+        uri_obj.assert_called_once_with("oss://bucket/model_data/digest/model.json")
+        self.assertEqual(config["oss"]["path"], "oss://bucket/model_data/digest/")
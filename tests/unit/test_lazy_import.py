@@ -0,0 +1,60 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import subprocess
+import sys
+
+from pai.common.utils import LazyModule
+from tests.unit import BaseUnitTestCase
+
+_SCRIPT = """
+import json, sys
+import pai.predictor
+from pai.session import Session
+
+session = Session(region_id="cn-hangzhou")
+loaded = set(sys.modules)
+session.service_api
+print(json.dumps({"before": sorted(loaded), "after": sorted(sys.modules)}))
+"""
+
+
+class TestLazyImport(BaseUnitTestCase):
+    def test_lazy_module(self):
+        mod = LazyModule("json")
+        self.assertIsNone(mod.__dict__["_module"])
+        self.assertEqual(mod.dumps([1]), "[1]")
+        self.assertIs(mod.__dict__["_module"], json)
+        with self.assertRaises(AttributeError):
+            _ = mod.not_exists_attr
+
+    def test_import_predictor(self):
+        output = subprocess.check_output([sys.executable, "-c", _SCRIPT])
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        before, after = set(result["before"]), set(result["after"])
+
+        for module in [
+            "numpy",
+            "aiohttp",
+            "oss2",
+            "eas_prediction",
+            "pai.api.service",
+            "pai.libs.alibabacloud_eas20210701.client",
+        ]:
+            self.assertNotIn(module, before)
+        # The generated client and models are imported on first use of the API.
+        self.assertIn("pai.api.service", after)
+        self.assertIn("pai.libs.alibabacloud_eas20210701.client", after)
+        self.assertNotIn("pai.libs.alibabacloud_paistudio20220112.client", after)
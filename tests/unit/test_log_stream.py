@@ -0,0 +1,106 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock
+
+from pai.api.base import PaginatedResult
+from pai.estimator import TrainingJobLogStream
+from tests.unit import BaseUnitTestCase
+
+
+class _FakeTrainingJobAPI(object):
+    """Serves the logs page by page, the logs are appended by the tests."""
+
+    def __init__(self, logs=None):
+        self.logs = list(logs or [])
+        self.calls = []
+
+    def list_logs(self, training_job_id, worker_id=None, page_number=1, page_size=10):
+        self.calls.append((page_number, page_size))
+        start = (page_number - 1) * page_size
+        items = self.logs[start : start + page_size]
+        return PaginatedResult(items=items, total_count=len(self.logs))
+
+    async def list_logs_async(self, *args, **kwargs):
+        return self.list_logs(*args, **kwargs)
+
+
+def _make_stream(api, **kwargs):
+    session = MagicMock()
+    session.training_job_api = api
+    kwargs.setdefault("min_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.02)
+    kwargs.setdefault("flush_timeout", 0.05)
+    return TrainingJobLogStream("train-job", session=session, **kwargs)
+
+
+class TestTrainingJobLogStream(BaseUnitTestCase):
+    def test_poll(self):
+        api = _FakeTrainingJobAPI(["log-{}".format(i) for i in range(7)])
+        stream = _make_stream(api, page_size=3)
+
+        self.assertEqual(stream.poll(), ["log-{}".format(i) for i in range(7)])
+        self.assertEqual(stream.cursor, 7)
+        self.assertEqual(api.calls, [(1, 3), (2, 3), (3, 3)])
+
+        api.calls.clear()
+        self.assertEqual(stream.poll(), [])
+        api.logs.extend(["log-7", "log-8"])
+        self.assertEqual(stream.poll(), ["log-7", "log-8"])
+        self.assertEqual(stream.cursor, 9)
+        self.assertEqual(api.calls, [(3, 3), (3, 3), (4, 3)])
+
+        # Resume the stream from the cursor of the previous one.
+        api.logs.append("log-9")
+        stream = _make_stream(api, page_size=4, cursor=stream.cursor)
+        self.assertEqual(stream.poll(), ["log-9"])
+
+    def test_iter(self):
+        api = _FakeTrainingJobAPI(["a", "b"])
+        polls = []
+
+        def until():
+            polls.append(1)
+            if len(polls) == 3:
+                api.logs.append("c")
+            return len(polls) > 5
+
+        stream = _make_stream(api, until=until)
+        self.assertEqual(list(stream), ["a", "b", "c"])
+
+    def test_stop(self):
+        api = _FakeTrainingJobAPI(["a"])
+        stream = _make_stream(api, max_interval=10)
+        logs = []
+        for log in stream:
+            logs.append(log)
+            if log == "a":
+                # Logs produced after stop are flushed.
+                stream.stop()
+                api.logs.append("b")
+        self.assertEqual(logs, ["a", "b"])
+
+    def test_aiter(self):
+        api = _FakeTrainingJobAPI(["a", "b", "c"])
+        stream = _make_stream(api, page_size=2)
+
+        async def collect():
+            logs = []
+            async for log in stream:
+                logs.append(log)
+                stream.stop()
+            return logs
+
+        self.assertEqual(asyncio.run(collect()), ["a", "b", "c"])
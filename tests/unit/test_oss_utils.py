@@ -0,0 +1,507 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import importlib.util
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import oss2
+from oss2.models import SimplifiedObjectInfo
+
+from pai.common.oss_utils import (
+    OssUriObj,
+    download,
+    get_local_path_digest,
+    sync,
+    sync_download,
+    upload,
+)
+from tests.unit import BaseUnitTestCase
+
+
+class InMemoryOssBucket(object):
+    """An in-memory stand-in for oss2.Bucket."""
+
+    bucket_name = "mock_bucket"
+
+    def __init__(self):
+        self.objects = dict()
+        self.multipart_uploads = dict()
+        self.requests = []
+        self.inflight = 0
+        self.max_inflight = 0
+        self._lock = threading.Lock()
+
+    def _record(self, name, key):
+        with self._lock:
+            self.requests.append((name, key))
+
+    def put_object_from_file(self, key, filename, headers=None, progress_callback=None):
+        self._record("PutObject", key)
+        with open(filename, "rb") as f:
+            data = f.read()
+        if progress_callback:
+            progress_callback(len(data), len(data))
+        with self._lock:
+            self.objects[key] = data
+        return SimpleNamespace(etag=self.etag(key))
+
+    def put_object(self, key, data, headers=None, progress_callback=None):
+        self._record("PutObject", key)
+        with self._lock:
+            self.objects[key] = bytes(data)
+        return SimpleNamespace(etag=self.etag(key))
+
+    def init_multipart_upload(self, key, headers=None, params=None):
+        self._record("InitMultipartUpload", key)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = dict()
+        return SimpleNamespace(upload_id=upload_id)
+
+    def upload_part(self, key, upload_id, part_number, data, **kwargs):
+        self._record("UploadPart", key)
+        with self._lock:
+            self.multipart_uploads[upload_id][part_number] = bytes(data)
+        return SimpleNamespace(etag=hashlib.md5(data).hexdigest().upper())
+
+    def complete_multipart_upload(self, key, upload_id, parts, headers=None):
+        self._record("CompleteMultipartUpload", key)
+        uploaded = self.multipart_uploads.pop(upload_id)
+        with self._lock:
+            self.objects[key] = b"".join(uploaded[p.part_number] for p in parts)
+        return SimpleNamespace(etag=self.etag(key) + "-" + str(len(parts)))
+
+    def abort_multipart_upload(self, key, upload_id, headers=None):
+        self._record("AbortMultipartUpload", key)
+        self.multipart_uploads.pop(upload_id)
+
+    def get_object(self, key, progress_callback=None, **kwargs):
+        self._record("GetObject", key)
+        return io.BytesIO(self.objects[key])
+
+    def etag(self, key):
+        return hashlib.md5(self.objects[key]).hexdigest().upper()
+
+    def batch_delete_objects(self, key_list, headers=None):
+        self._record("DeleteObjects", key_list)
+        with self._lock:
+            for key in key_list:
+                del self.objects[key]
+
+    def get_object_meta(self, key, headers=None, params=None):
+        self._record("HeadObject", key)
+        if key not in self.objects:
+            raise oss2.exceptions.NotFound(404, {}, b"", {})
+        return SimpleNamespace(content_length=len(self.objects[key]))
+
+    def object_exists(self, key, headers=None):
+        self._record("HeadObject", key)
+        return key in self.objects
+
+    def get_object_to_file(
+        self, key, filename, headers=None, progress_callback=None, **kwargs
+    ):
+        self._record("GetObject", key)
+        with self._lock:
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            time.sleep(0.01)
+            data = self.objects[key]
+            with open(filename, "wb") as f:
+                f.write(data)
+            if progress_callback:
+                progress_callback(len(data), len(data))
+        finally:
+            with self._lock:
+                self.inflight -= 1
+
+    def list_objects_v2(self, prefix="", continuation_token="", max_keys=100, **kwargs):
+        self._record("ListObjects", prefix)
+        keys = sorted(k for k in self.objects if k.startswith(prefix))
+        start = int(continuation_token or 0)
+        end = start + max_keys
+        return SimpleNamespace(
+            object_list=[
+                SimplifiedObjectInfo(
+                    k, None, self.etag(k), None, len(self.objects[k]), None
+                )
+                for k in keys[start:end]
+            ],
+            prefix_list=[],
+            is_truncated=end < len(keys),
+            next_continuation_token=str(end),
+        )
+
+
+class TestUpload(BaseUnitTestCase):
+    def setUp(self):
+        super(TestUpload, self).setUp()
+        self.bucket = InMemoryOssBucket()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super(TestUpload, self).tearDown()
+
+    def _write_file(self, rel_path, data):
+        path = os.path.join(self.source_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def test_upload_directory(self):
+        files = {"a.txt": b"a" * 10, "sub/b.txt": b"b" * 20, "sub/c/d.bin": b""}
+        for name, data in files.items():
+            self._write_file(name, data)
+        with patch("oss2.resumable_upload") as mock_resumable_upload:
+            uri = upload(self.source_dir, "path/to/dir", bucket=self.bucket)
+        self.assertEqual(uri, "oss://mock_bucket/path/to/dir/")
+        self.assertDictEqual(
+            self.bucket.objects,
+            {"path/to/dir/" + name: data for name, data in files.items()},
+        )
+        # Small files are uploaded with a single PutObject request.
+        self.assertEqual(len(self.bucket.requests), len(files))
+        mock_resumable_upload.assert_not_called()
+
+    def test_upload_large_file_in_directory(self):
+        self._write_file("small.txt", b"small")
+        self._write_file("large.bin", b"")
+        with patch("oss2.resumable_upload") as mock_resumable_upload, patch.object(
+            oss2.defaults, "multipart_threshold", 1
+        ):
+            upload(self.source_dir, "dir/", bucket=self.bucket, max_workers=2)
+        self.assertListEqual(self.bucket.requests, [("PutObject", "dir/large.bin")])
+        mock_resumable_upload.assert_called_once()
+        self.assertEqual(mock_resumable_upload.call_args[1]["key"], "dir/small.txt")
+
+    def test_upload_directory_failure(self):
+        for i in range(8):
+            self._write_file(f"{i}.txt", b"data")
+
+        def put_object_from_file(key, filename, **kwargs):
+            raise oss2.exceptions.ServerError(500, {}, b"", {})
+
+        self.bucket.put_object_from_file = put_object_from_file
+        with self.assertRaises(oss2.exceptions.ServerError):
+            upload(self.source_dir, "dir/", bucket=self.bucket)
+
+
+class TestDownload(BaseUnitTestCase):
+    def setUp(self):
+        super(TestDownload, self).setUp()
+        self.bucket = InMemoryOssBucket()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.local_path = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super(TestDownload, self).tearDown()
+
+    def _read_local_files(self):
+        files = {}
+        for root, _, names in os.walk(self.local_path):
+            for name in names:
+                path = os.path.join(root, name)
+                with open(path, "rb") as f:
+                    files[os.path.relpath(path, self.local_path)] = f.read()
+        return files
+
+    def test_download_prefix(self):
+        files = {"a.txt": b"a" * 10, "sub/b.txt": b"b" * 20, "sub/c/d.bin": b""}
+        self.bucket.objects = {"dir/" + k: v for k, v in files.items()}
+        self.bucket.objects["dir/sub/"] = b""
+
+        with patch("pai.common.oss_utils._LIST_OBJECTS_PAGE_SIZE", 2):
+            download("dir", self.local_path, bucket=self.bucket, max_workers=1)
+        self.assertDictEqual(self._read_local_files(), files)
+
+        requests = [name for name, _ in self.bucket.requests]
+        # Object sizes from the listing are used, no HEAD request for each object.
+        self.assertEqual(requests.count("HeadObject"), 1)
+        self.assertEqual(requests.count("GetObject"), len(files))
+        # Download starts before the listing finished.
+        self.assertLess(
+            requests.index("GetObject"),
+            len(requests) - 1 - requests[::-1].index("ListObjects"),
+        )
+
+    def test_download_prefix_bounded_concurrency(self):
+        self.bucket.objects = {f"dir/{i}.txt": b"x" * 10 for i in range(16)}
+        download("dir/", self.local_path, bucket=self.bucket, max_workers=4)
+        self.assertEqual(len(self._read_local_files()), 16)
+        self.assertLessEqual(self.bucket.max_inflight, 4)
+
+        self.bucket.max_inflight = 0
+        download(
+            "dir/",
+            self.local_path,
+            bucket=self.bucket,
+            max_workers=4,
+            max_inflight_bytes=15,
+        )
+        self.assertEqual(self.bucket.max_inflight, 1)
+
+    def test_download_file(self):
+        self.bucket.objects = {"path/to/file.txt": b"data"}
+        dest = download("path/to/file.txt", self.local_path, bucket=self.bucket)
+        self.assertEqual(dest, os.path.join(self.local_path, "file.txt"))
+        self.assertDictEqual(self._read_local_files(), {"file.txt": b"data"})
+        self.assertListEqual(
+            self.bucket.requests,
+            [("HeadObject", "path/to/file.txt"), ("GetObject", "path/to/file.txt")],
+        )
+
+
+class TestSync(BaseUnitTestCase):
+    def setUp(self):
+        super(TestSync, self).setUp()
+        self.bucket = InMemoryOssBucket()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.local_path = os.path.join(self.temp_dir.name, "local")
+        os.makedirs(self.local_path)
+        self.cache_patch = patch(
+            "pai.common.oss_utils.DEFAULT_CACHE_DIR",
+            os.path.join(self.temp_dir.name, "cache"),
+        )
+        self.cache_patch.start()
+
+    def tearDown(self):
+        self.cache_patch.stop()
+        self.temp_dir.cleanup()
+        super(TestSync, self).tearDown()
+
+    def _write_file(self, rel_path, data):
+        path = os.path.join(self.local_path, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _requests(self, name):
+        requests = [key for n, key in self.bucket.requests if n == name]
+        self.bucket.requests.clear()
+        return requests
+
+    def test_sync(self):
+        self._write_file("a.txt", b"a")
+        self._write_file("sub/b.txt", b"b")
+        uri = sync(self.local_path, "dir", bucket=self.bucket)
+        self.assertEqual(uri, "oss://mock_bucket/dir/")
+        self.assertDictEqual(
+            self.bucket.objects, {"dir/a.txt": b"a", "dir/sub/b.txt": b"b"}
+        )
+        self.assertCountEqual(
+            self._requests("PutObject"), ["dir/a.txt", "dir/sub/b.txt"]
+        )
+
+        # Unchanged files are skipped.
+        sync(self.local_path, "dir", bucket=self.bucket)
+        self.assertListEqual(self._requests("PutObject"), [])
+
+        # Only the changed files are uploaded.
+        self._write_file("a.txt", b"changed")
+        self._write_file("c.txt", b"c")
+        sync(self.local_path, "dir", bucket=self.bucket)
+        self.assertCountEqual(self._requests("PutObject"), ["dir/a.txt", "dir/c.txt"])
+        self.assertEqual(self.bucket.objects["dir/a.txt"], b"changed")
+
+        # Modification time is changed but the content is not.
+        os.utime(os.path.join(self.local_path, "c.txt"), (0, 0))
+        sync(self.local_path, "dir", bucket=self.bucket)
+        self.assertListEqual(self._requests("PutObject"), [])
+
+        # Objects not exist in the local path are deleted.
+        os.remove(os.path.join(self.local_path, "sub/b.txt"))
+        sync(self.local_path, "dir", bucket=self.bucket, delete=True)
+        self.assertListEqual(self._requests("DeleteObjects"), [["dir/sub/b.txt"]])
+        self.assertCountEqual(self.bucket.objects, ["dir/a.txt", "dir/c.txt"])
+
+    def test_sync_without_manifest(self):
+        self._write_file("a.txt", b"a")
+        self._write_file("b.txt", b"b")
+        self.bucket.objects = {"dir/a.txt": b"a", "dir/b.txt": b"stale"}
+        sync(self.local_path, "dir/", bucket=self.bucket)
+        # Content is compared with the ETag of the objects.
+        self.assertListEqual(self._requests("PutObject"), ["dir/b.txt"])
+
+    def test_sync_download(self):
+        self.bucket.objects = {
+            "dir/a.txt": b"a",
+            "dir/sub/b.txt": b"b",
+            "dir/sub/": b"",
+        }
+        sync_download("dir", self.local_path, bucket=self.bucket)
+        self.assertCountEqual(
+            self._requests("GetObject"), ["dir/a.txt", "dir/sub/b.txt"]
+        )
+        with open(os.path.join(self.local_path, "sub/b.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"b")
+
+        sync_download("dir", self.local_path, bucket=self.bucket)
+        self.assertListEqual(self._requests("GetObject"), [])
+
+        self.bucket.objects["dir/a.txt"] = b"changed"
+        self._write_file("extra.txt", b"extra")
+        sync_download("dir", self.local_path, bucket=self.bucket, delete=True)
+        self.assertListEqual(self._requests("GetObject"), ["dir/a.txt"])
+        self.assertCountEqual(os.listdir(self.local_path), ["a.txt", "sub"])
+
+    def test_local_path_digest(self):
+        self._write_file("a.txt", b"a")
+        self._write_file("sub/b.txt", b"b")
+        digest = get_local_path_digest(self.local_path)
+        self.assertEqual(get_local_path_digest(self.local_path), digest)
+
+        self._write_file("sub/b.txt", b"changed")
+        self.assertNotEqual(get_local_path_digest(self.local_path), digest)
+        self.assertNotEqual(
+            get_local_path_digest(os.path.join(self.local_path, "a.txt")),
+            get_local_path_digest(os.path.join(self.local_path, "sub/b.txt")),
+        )
+
+    def test_upload_with_cache(self):
+        self._write_file("a.txt", b"a")
+        self._write_file("sub/b.txt", b"b")
+        uri = upload(self.local_path, "dir1/", bucket=self.bucket, use_cache=True)
+        self.assertEqual(len(self._requests("PutObject")), 2)
+
+        # Data uploaded before is reused.
+        self.assertEqual(
+            upload(self.local_path, "dir2/", bucket=self.bucket, use_cache=True), uri
+        )
+        self.assertListEqual(self._requests("PutObject"), [])
+
+        # Data is uploaded again if the content is changed or the uploaded data is
+        # deleted.
+        self._write_file("a.txt", b"changed")
+        uri = upload(self.local_path, "dir3/", bucket=self.bucket, use_cache=True)
+        self.assertEqual(uri, "oss://mock_bucket/dir3/")
+        del self.bucket.objects["dir3/sub/b.txt"]
+        uri = upload(self.local_path, "dir4/", bucket=self.bucket, use_cache=True)
+        self.assertEqual(uri, "oss://mock_bucket/dir4/")
+
+    def test_upload_tar_with_cache(self):
+        self._write_file("a.txt", b"a")
+        uri = upload(
+            self.local_path, "dir1/", bucket=self.bucket, is_tar=True, use_cache=True
+        )
+        self.assertEqual(uri, "oss://mock_bucket/dir1/source.tar.gz")
+        self._requests("PutObject")
+        self.assertEqual(
+            upload(
+                self.local_path,
+                "dir2/",
+                bucket=self.bucket,
+                is_tar=True,
+                use_cache=True,
+            ),
+            uri,
+        )
+        self.assertListEqual(self._requests("PutObject"), [])
+
+
+class TestTarStream(BaseUnitTestCase):
+    def setUp(self):
+        super(TestTarStream, self).setUp()
+        self.bucket = InMemoryOssBucket()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.source_dir = os.path.join(self.temp_dir.name, "source")
+        self.files = {
+            "a.txt": b"a" * 10,
+            "sub/random.bin": os.urandom(300 * 1024),
+        }
+        for name, data in self.files.items():
+            path = os.path.join(self.source_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        super(TestTarStream, self).tearDown()
+
+    def _read_files(self, path):
+        files = {}
+        for root, _, names in os.walk(path):
+            for name in names:
+                with open(os.path.join(root, name), "rb") as f:
+                    files[os.path.relpath(os.path.join(root, name), path)] = f.read()
+        return files
+
+    def _check_upload_tar(self, compression="gzip"):
+        with patch.object(oss2.defaults, "part_size", 100 * 1024), patch(
+            "pai.common.oss_utils._COMPRESS_CHUNK_SIZE", 64 * 1024
+        ):
+            uri = upload(
+                self.source_dir,
+                "dir/",
+                bucket=self.bucket,
+                is_tar=True,
+                compression=compression,
+            )
+        requests = [name for name, _ in self.bucket.requests]
+        self.assertEqual(requests.count("InitMultipartUpload"), 1)
+        self.assertGreater(requests.count("UploadPart"), 1)
+        self.assertEqual(requests.count("CompleteMultipartUpload"), 1)
+
+        output_dir = os.path.join(self.temp_dir.name, "output")
+        download(OssUriObj(uri).object_key, output_dir, bucket=self.bucket, un_tar=True)
+        self.assertDictEqual(self._read_files(output_dir), self.files)
+        return uri
+
+    def test_upload_tar_gz(self):
+        uri = self._check_upload_tar()
+        self.assertEqual(uri, "oss://mock_bucket/dir/source.tar.gz")
+        # The multi-member gzip archive is readable by tarfile.
+        data = self.bucket.objects["dir/source.tar.gz"]
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as tar:
+            self.assertCountEqual(
+                [m.name for m in tar.getmembers() if m.isfile()], self.files
+            )
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("zstandard"), "zstandard is not installed"
+    )
+    def test_upload_tar_zstd(self):
+        uri = self._check_upload_tar(compression="zstd")
+        self.assertEqual(uri, "oss://mock_bucket/dir/source.tar.zst")
+
+    def test_upload_small_tar(self):
+        os.remove(os.path.join(self.source_dir, "sub/random.bin"))
+        uri = upload(self.source_dir, "dir/source.tgz", bucket=self.bucket, is_tar=True)
+        self.assertEqual(uri, "oss://mock_bucket/dir/source.tgz")
+        self.assertListEqual(self.bucket.requests, [("PutObject", "dir/source.tgz")])
+
+    def test_upload_tar_failure(self):
+        def upload_part(*args, **kwargs):
+            raise oss2.exceptions.ServerError(500, {}, b"", {})
+
+        self.bucket.upload_part = upload_part
+        with patch.object(oss2.defaults, "part_size", 100 * 1024):
+            with self.assertRaises(oss2.exceptions.ServerError):
+                upload(self.source_dir, "dir/", bucket=self.bucket, is_tar=True)
+        self.assertIn(
+            ("AbortMultipartUpload", "dir/source.tar.gz"), self.bucket.requests
+        )
+        self.assertFalse(self.bucket.multipart_uploads)
@@ -189,3 +189,47 @@ class TestPipelineBuild(BaseUnitTestCase):
             output_param_case["spec"]["withParam"],
             "{{pipelines.stepOutput.outputs.parameters.outputParam}}",
         )
+
+    def test_topo_sort(self):
+        op = ContainerComponent(
+            image_uri="python:3",
+            inputs=[PipelineParameter(name="foo", default="hello")],
+            outputs=[PipelineParameter(name="outputParam")],
+            command="echo hello",
+        )
+        step1 = op.as_step(name="step1")
+        step2 = op.as_step(name="step2", inputs={"foo": step1.outputs[0]})
+        step3 = op.as_step(name="step3", depends=[step1])
+        step4 = op.as_step(name="step4")
+        step4.after(step2, step3)
+
+        sorted_steps = Pipeline._topo_sort({step4, step3, step2, step1})
+        self.assertEqual(sorted_steps[0], step1)
+        self.assertEqual(set(sorted_steps[1:3]), {step2, step3})
+        self.assertEqual(sorted_steps[3], step4)
+
+        step1.after(step4)
+        with self.assertRaisesRegex(ValueError, "Cycle dependency detected") as ctx:
+            Pipeline._topo_sort([step1, step2, step3, step4])
+        cycle = str(ctx.exception).split(": ")[-1].split(" -> ")
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertIn("step1", cycle)
+        self.assertIn("step4", cycle)
+
+        with self.assertRaisesRegex(ValueError, "not in the pipeline"):
+            Pipeline._topo_sort([step2])
+
+    def test_gen_step_name(self):
+        op = ContainerComponent(
+            image_uri="python:3",
+            inputs=[],
+            outputs=[PipelineParameter(name="outputParam")],
+            command="echo hello",
+        )
+        prefix = op.as_step().gen_name_prefix()
+        steps = [op.as_step() for _ in range(3)] + [op.as_step(name="%s-1" % prefix)]
+        pipeline = Pipeline(steps=steps)
+        self.assertEqual(
+            sorted(step.name for step in pipeline.steps),
+            sorted("%s-%s" % (prefix, i) for i in range(4)),
+        )
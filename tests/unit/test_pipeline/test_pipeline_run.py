@@ -0,0 +1,121 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from pai.pipeline.run import PipelineRun
+from tests.unit import BaseUnitTestCase
+
+
+def _node(name, node_id, status, node_type="Dag", pipelines=None):
+    return {
+        "Metadata": {"Name": name, "NodeId": node_id, "NodeType": node_type},
+        "StatusInfo": {"Status": status, "StartedAt": "2023-01-01T00:00:00Z"},
+        "Spec": {"Pipelines": pipelines or []},
+    }
+
+
+class _FakePipelineRunAPI(object):
+    """A pipeline run: root -> (dag-a -> (step-a1), dag-b -> (dag-c -> step-c1))."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = []
+        self.concurrency = self.max_concurrency = 0
+        self._lock = threading.Lock()
+        self.statuses = {
+            "root": "Running",
+            "dag-a": "Succeeded",
+            "dag-b": "Running",
+            "dag-c": "Running",
+        }
+
+    def _details(self):
+        s = self.statuses
+        step_a1 = _node("step-a1", "step-a1", "Succeeded", "Container")
+        step_c1 = _node("step-c1", "step-c1", s["dag-c"], "Container")
+        dag_c = _node("dag-c", "dag-c", s["dag-c"], pipelines=[step_c1])
+        dag_a = _node("dag-a", "dag-a", s["dag-a"], pipelines=[step_a1])
+        dag_b = _node("dag-b", "dag-b", s["dag-b"], pipelines=[dag_c])
+        root = _node("root", "root", s["root"], pipelines=[dag_a, dag_b])
+        return {"root": root, "dag-a": dag_a, "dag-b": dag_b, "dag-c": dag_c}
+
+    def get_node(self, run_id, node_id, depth=2):
+        with self._lock:
+            self.calls.append(node_id)
+            self.concurrency += 1
+            self.max_concurrency = max(self.max_concurrency, self.concurrency)
+        time.sleep(self.latency)
+        with self._lock:
+            self.concurrency -= 1
+        return self._details()[node_id]
+
+
+def _make_run(api):
+    session = MagicMock()
+    session.pipeline_run_api = api
+    return PipelineRun(run_id="run-1", name="root", session=session)
+
+
+class TestPipelineRunTraversal(BaseUnitTestCase):
+    def test_travel_node_status_info(self):
+        api = _FakePipelineRunAPI(latency=0.05)
+        run = _make_run(api)
+
+        status_info = run.travel_node_status_info("root")
+        self.assertEqual(
+            list(status_info),
+            [
+                "root",
+                "root.dag-a",
+                "dag-a.root",
+                "dag-a.root.step-a1",
+                "root.dag-b",
+                "dag-b.root",
+                "dag-b.root.dag-c",
+                "dag-c.dag-b.root",
+                "dag-c.dag-b.root.step-c1",
+            ],
+        )
+        self.assertEqual(status_info["dag-c.dag-b.root"]["status"], "Running")
+        self.assertEqual(sorted(api.calls), ["dag-a", "dag-b", "dag-c", "root"])
+        # The sibling sub-DAGs are fetched concurrently.
+        self.assertEqual(api.max_concurrency, 2)
+
+        api.calls.clear()
+        run.travel_node_status_info("root", max_depth=2, max_workers=1)
+        self.assertEqual(api.calls, ["root", "dag-a", "dag-b"])
+        self.assertEqual(api.max_concurrency, 2)
+
+    def test_incremental_travel(self):
+        api = _FakePipelineRunAPI()
+        run = _make_run(api)
+
+        run.travel_node_status_info("root", incremental=True)
+        api.calls.clear()
+        api.statuses["dag-c"] = "Succeeded"
+        status_info = run.travel_node_status_info("root", incremental=True)
+        # The dag-a is in terminal status, it's not fetched again.
+        self.assertEqual(sorted(api.calls), ["dag-b", "dag-c", "root"])
+        self.assertEqual(status_info["dag-c.dag-b.root.step-c1"]["status"], "Succeeded")
+
+        api.calls.clear()
+        run.travel_node_status_info("root", incremental=True)
+        self.assertEqual(sorted(api.calls), ["dag-b", "root"])
+
+        api.calls.clear()
+        run.travel_node_status_info("root")
+        self.assertEqual(sorted(api.calls), ["dag-a", "dag-b", "dag-c", "root"])
@@ -0,0 +1,126 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from pai.pipeline.component import RegisteredComponent
+from pai.pipeline.component._registered import _ManifestCache
+from tests.test_data import OPERATOR_MANIFEST_DIR
+from tests.unit import BaseUnitTestCase
+
+
+def _make_session():
+    with open(os.path.join(OPERATOR_MANIFEST_DIR, "split.yaml")) as f:
+        manifest = f.read()
+    session = MagicMock()
+    session.region_id = "cn-hangzhou"
+    session.pipeline_api.get_by_identifier.return_value = {"PipelineId": "p-split"}
+    session.pipeline_api.get_schema.return_value = {
+        "Manifest": manifest,
+        "PipelineId": "p-split",
+        "WorkspaceId": "ws-1",
+    }
+    return session
+
+
+class TestManifestCache(BaseUnitTestCase):
+    def setUp(self):
+        super(TestManifestCache, self).setUp()
+        self.session = _make_session()
+        p = patch(
+            "pai.pipeline.component._registered.get_default_session",
+            return_value=self.session,
+        )
+        p.start()
+        self.addCleanup(p.stop)
+        self.addCleanup(RegisteredComponent.configure_manifest_cache)
+        RegisteredComponent.configure_manifest_cache()
+
+    def test_get_by_identifier(self):
+        components = [
+            RegisteredComponent.get_by_identifier("split", provider="pai")
+            for _ in range(3)
+        ]
+        self.assertEqual(self.session.pipeline_api.get_by_identifier.call_count, 1)
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 1)
+        self.assertTrue(all(c.pipeline_id == "p-split" for c in components))
+        self.assertEqual(components[2].identifier, "split")
+        self.assertIsNot(components[1].manifest, components[2].manifest)
+
+        RegisteredComponent.get_by_identifier("split", provider="pai", version="v2")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 2)
+
+        RegisteredComponent.get("p-split")
+        c = RegisteredComponent.get("p-split")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 3)
+        self.assertEqual(c._workspace_id, "ws-1")
+
+        components[0].delete()
+        RegisteredComponent.get("p-split")
+        RegisteredComponent.get_by_identifier("split", provider="pai")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 5)
+
+    def test_persist(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        RegisteredComponent.configure_manifest_cache(persist=True, cache_dir=cache_dir)
+        RegisteredComponent.get_by_identifier("split", provider="pai")
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        # A new process reuses the manifest persisted on the disk.
+        RegisteredComponent.configure_manifest_cache(persist=True, cache_dir=cache_dir)
+        c = RegisteredComponent.get_by_identifier("split", provider="pai")
+        self.assertEqual(c.pipeline_id, "p-split")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 1)
+
+        RegisteredComponent.configure_manifest_cache(
+            persist=True, cache_dir=cache_dir, disk_ttl=0
+        )
+        RegisteredComponent.get_by_identifier("split", provider="pai")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 2)
+
+    def test_persist_invalidate(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        RegisteredComponent.configure_manifest_cache(persist=True, cache_dir=cache_dir)
+        RegisteredComponent.get("p-split")
+        c = RegisteredComponent.get_by_identifier("split", provider="pai")
+
+        # The entries persisted by another process are dropped on update.
+        RegisteredComponent.configure_manifest_cache(persist=True, cache_dir=cache_dir)
+        c.update(c.manifest)
+        self.assertListEqual(os.listdir(cache_dir), [])
+        RegisteredComponent.get("p-split")
+        self.assertEqual(self.session.pipeline_api.get_schema.call_count, 3)
+
+    def test_persist_failed(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = _ManifestCache(cache_dir=cache_dir)
+        # The manifest is not JSON serializable.
+        cache.put(("a",), "p-a", {"a": object()})
+        self.assertListEqual(os.listdir(cache_dir), [])
+
+    def test_lru(self):
+        cache = _ManifestCache(max_size=2)
+        cache.put(("a",), "p-a", {"a": 1})
+        cache.put(("b",), "p-b", {"b": 1})
+        cache.get(("a",))
+        cache.put(("c",), "p-c", {"c": 1})
+        self.assertIsNone(cache.get(("b",)))
+        self.assertEqual(cache.get(("a",)), ("p-a", {"a": 1}, None))
+        self.assertEqual(cache.get(("c",)), ("p-c", {"c": 1}, None))
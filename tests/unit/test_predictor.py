@@ -0,0 +1,802 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import base64
+import json
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from pai.api.base import PaginatedResult
+from pai.exception import PredictionException
+from pai.predictor import (
+    AsyncConnectionConfig,
+    AsyncPredictor,
+    BackoffStrategy,
+    BatchingConfig,
+    ConnectionConfig,
+    LoadBalancingConfig,
+    LoadBalancingStrategy,
+    Predictor,
+    ResultSubscriptionConfig,
+    WaitConfig,
+)
+from pai.serializers import BytesSerializer, JsonSerializer
+from tests.unit import BaseUnitTestCase
+
+
+class _LocalServiceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _reply(self, status_code, body=b"", headers=None):
+        self.send_response(status_code)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _QueueServiceHandler(_LocalServiceHandler):
+    """A local stand-in for the EAS queue service of an async inference service."""
+
+    def do_POST(self):
+        self.server.client_ports.add(self.client_address[1])
+        request_id = uuid.uuid4().hex
+        self.server.results[request_id] = self._read_body()
+        self.server.enqueued.append(request_id)
+        self._reply(200, headers={"X-Eas-Queueservice-Request-Id": request_id})
+
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        request_id = self.path.split("requestId=")[1].split("&")[0]
+        result = self.server.results.pop(request_id, None)
+        if result is None:
+            self._reply(204)
+            return
+        body = json.dumps(
+            [{"data": base64.b64encode(result).decode(), "tags": {}}]
+        ).encode()
+        self._reply(200, body=body, headers={"Content-Type": "application/json"})
+
+
+class _SinkQueueServiceHandler(_LocalServiceHandler):
+    """A local stand-in for the EAS queue service that supports reading the results
+    from the sink in bulk."""
+
+    def do_POST(self):
+        with self.server.lock:
+            request_id = uuid.uuid4().hex
+            self.server.sink.append(
+                {
+                    "index": len(self.server.sink) + 1,
+                    "data": base64.b64encode(self._read_body()).decode(),
+                    "tags": {"requestId": request_id},
+                }
+            )
+        self._reply(200, headers={"X-Eas-Queueservice-Request-Id": request_id})
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        if "_attrs_" in query:
+            with self.server.lock:
+                attrs = {"stream.length": str(sum(map(bool, self.server.sink)))}
+                if self.server.sink:
+                    attrs["stream.lastEntry"] = str(len(self.server.sink))
+            body = json.dumps(attrs).encode()
+            self._reply(200, body=body, headers={"Content-Type": "application/json"})
+            return
+        with self.server.lock:
+            self.server.sink_reads.append(query)
+            items = [item for item in self.server.sink if item]
+            if self.server.results_held:
+                items = []
+            if "requestId" in query:
+                items = [
+                    item
+                    for item in items
+                    if item["tags"]["requestId"] == query["requestId"][0]
+                ][:1]
+            else:
+                index, length = int(query["_index_"][0]), int(query["_length_"][0])
+                items = [item for item in items if item["index"] >= index][:length]
+        if not items:
+            self._reply(204)
+            return
+        body = json.dumps(items).encode()
+        self._reply(200, body=body, headers={"Content-Type": "application/json"})
+
+    def do_DELETE(self):
+        query = parse_qs(urlparse(self.path).query)
+        with self.server.lock:
+            for index in query["_indexes_"][0].split(","):
+                self.server.sink[int(index) - 1] = None
+        self._reply(200)
+
+
+class _EchoServiceHandler(_LocalServiceHandler):
+    """A local stand-in for a standard inference service that echoes the JSON
+    request."""
+
+    def do_POST(self):
+        self.server.client_ports.add(self.client_address[1])
+        body = self._read_body()
+        self.server.batch_sizes.append(len(json.loads(body)))
+        self._reply(200, body=body, headers={"Content-Type": "application/json"})
+
+
+class _FlakyServiceHandler(_LocalServiceHandler):
+    """A local stand-in for an inference service that fails the first requests
+    with 503."""
+
+    def _handle(self):
+        body = self._read_body()
+        with self.server.lock:
+            self.server.sink_reads.append(self.command)
+            failed = len(self.server.sink_reads) <= self.server.failures
+        if failed:
+            self._reply(503, body=b"Service Unavailable")
+        else:
+            self._reply(200, body=body or b"ok")
+
+    do_GET = do_POST = _handle
+
+
+class LocalService(object):
+    def __init__(self, handler_cls):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler_cls)
+        self.server.results = dict()
+        self.server.client_ports = set()
+        self.server.batch_sizes = []
+        self.server.sink = []
+        self.server.sink_reads = []
+        self.server.enqueued = []
+        self.server.failures = 0
+        self.server.results_held = False
+        self.server.lock = threading.Lock()
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self):
+        return "http://127.0.0.1:{}".format(self.server.server_address[1])
+
+    @property
+    def client_ports(self):
+        return self.server.client_ports
+
+    @property
+    def batch_sizes(self):
+        return self.server.batch_sizes
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_predictor(predictor_cls, endpoint, service_type="Standard", **kwargs):
+    service_api_object = {
+        "ServiceName": "test_service",
+        "InternetEndpoint": endpoint,
+        "IntranetEndpoint": endpoint,
+        "AccessToken": "token",
+        "Status": "Running",
+        "ServiceConfig": json.dumps({"metadata": {"type": service_type}}),
+    }
+    with patch(
+        "pai.predictor._ServicePredictorMixin.describe_service",
+        return_value=service_api_object,
+    ):
+        kwargs.setdefault("session", object())
+        kwargs.setdefault("serializer", JsonSerializer())
+        return predictor_cls(service_name="test_service", **kwargs)
+
+
+def make_async_predictor(endpoint, **kwargs):
+    return make_predictor(AsyncPredictor, endpoint, service_type="Async", **kwargs)
+
+
+class TestPredictor(BaseUnitTestCase):
+    def test_predict_with_batching(self):
+        with LocalService(_EchoServiceHandler) as service:
+            predictor = make_predictor(
+                Predictor,
+                service.endpoint,
+                batching_config=BatchingConfig(max_batch_size=8, max_latency_ms=50),
+            )
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(
+                    executor.map(lambda i: predictor.predict([[i, i]]), range(32))
+                )
+
+            self.assertListEqual(results, [[[i, i]] for i in range(32)])
+            self.assertEqual(sum(service.batch_sizes), 32)
+            self.assertLess(len(service.batch_sizes), 32)
+            self.assertLessEqual(max(service.batch_sizes), 8)
+
+    def test_batching_failure(self):
+        with LocalService(_EchoServiceHandler) as service:
+            predictor = make_predictor(
+                Predictor,
+                service.endpoint,
+                batching_config=BatchingConfig(max_batch_size=4),
+            )
+            with self.assertRaises(ValueError):
+                predictor.predict({"foo": "bar"})
+            self.assertListEqual(predictor.predict([1, 2]), [1, 2])
+
+            with self.assertRaisesRegex(ValueError, "BytesSerializer"):
+                make_predictor(
+                    Predictor,
+                    service.endpoint,
+                    serializer=BytesSerializer(),
+                    batching_config=BatchingConfig(),
+                )
+
+    def test_batching_results_mismatch(self):
+        class _DroppingSerializer(JsonSerializer):
+            def split_batch(self, data, batch_sizes):
+                return super(_DroppingSerializer, self).split_batch(data, batch_sizes)[
+                    :-1
+                ]
+
+        with LocalService(_EchoServiceHandler) as service:
+            predictor = make_predictor(
+                Predictor,
+                service.endpoint,
+                serializer=_DroppingSerializer(),
+                batching_config=BatchingConfig(max_batch_size=4, max_latency_ms=50),
+            )
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(predictor.predict, [i]) for i in range(4)]
+                for future in futures:
+                    # Every call of the batch fails rather than blocks.
+                    with self.assertRaisesRegex(RuntimeError, "does not match"):
+                        future.result(timeout=10)
+
+    def test_concurrent_predict(self):
+        with LocalService(_EchoServiceHandler) as service:
+            predictor = make_predictor(
+                Predictor,
+                service.endpoint,
+                connection_config=ConnectionConfig(pool_maxsize=8, pool_block=True),
+            )
+            with ThreadPoolExecutor(max_workers=64) as executor:
+                results = list(
+                    executor.map(lambda i: predictor.predict([i]), range(256))
+                )
+            self.assertListEqual(results, [[i] for i in range(256)])
+            # The threads share the connections of the pool.
+            self.assertLessEqual(len(service.client_ports), 8)
+
+    def test_retry(self):
+        with LocalService(_FlakyServiceHandler) as service:
+            service.server.failures = 2
+            predictor = make_predictor(
+                Predictor,
+                service.endpoint,
+                connection_config=ConnectionConfig(
+                    max_retries=3, retry_backoff_factor=0
+                ),
+            )
+            resp = predictor.raw_predict(method="GET")
+            self.assertEqual(resp.status_code, 200)
+            self.assertListEqual(service.server.sink_reads, ["GET"] * 3)
+
+            # The non-idempotent requests are not retried on 5xx responses.
+            service.server.sink_reads.clear()
+            with self.assertRaises(PredictionException):
+                predictor.raw_predict(data=b"hello")
+            self.assertListEqual(service.server.sink_reads, ["POST"])
+
+    def test_connection_config(self):
+        adapter = ConnectionConfig(pool_maxsize=4, pool_block=True).make_adapter()
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        self.assertEqual(pool_kw["maxsize"], 4)
+        self.assertTrue(pool_kw["block"])
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kw["socket_options"]
+        )
+        self.assertEqual(adapter.max_retries.total, 0)
+
+        adapter = ConnectionConfig(tcp_keepalive=False).make_adapter()
+        self.assertNotIn("socket_options", adapter.poolmanager.connection_pool_kw)
+        with self.assertRaises(ValueError):
+            ConnectionConfig(pool_maxsize=0)
+
+
+class _FakeServiceInstanceAPI(object):
+    """A local stand-in for the API listing the instances of the service."""
+
+    def __init__(self, ports):
+        self.ports = list(ports)
+        self.calls = 0
+
+    def list_instances(self, name, page_number=1, page_size=100):
+        self.calls += 1
+        instances = [
+            {"InnerIP": "127.0.0.1", "InstancePort": port, "Status": "Running"}
+            for port in self.ports
+        ] + [{"InnerIP": "127.0.0.1", "InstancePort": 1, "Status": "Pending"}]
+        return PaginatedResult(
+            items=instances[(page_number - 1) * page_size : page_number * page_size],
+            total_count=len(instances),
+        )
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _make_balanced_predictor(endpoint, ports, **kwargs):
+    session = MagicMock()
+    session.service_api = _FakeServiceInstanceAPI(ports)
+    return make_predictor(
+        Predictor,
+        endpoint,
+        session=session,
+        load_balancing_config=LoadBalancingConfig(**kwargs),
+    )
+
+
+class TestLoadBalancing(BaseUnitTestCase):
+    def setUp(self):
+        super(TestLoadBalancing, self).setUp()
+        self.gateway = LocalService(_EchoServiceHandler).__enter__()
+        self.instances = [LocalService(_EchoServiceHandler).__enter__() for _ in "ab"]
+        for service in [self.gateway] + self.instances:
+            self.addCleanup(service.__exit__, None, None, None)
+
+    def _ports(self):
+        return [service.server.server_address[1] for service in self.instances]
+
+    def test_balance(self):
+        for strategy in LoadBalancingStrategy.supported():
+            predictor = _make_balanced_predictor(
+                self.gateway.endpoint, self._ports(), strategy=strategy
+            )
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(
+                    executor.map(lambda i: predictor.predict([i]), range(64))
+                )
+            self.assertListEqual(results, [[i] for i in range(64)])
+            # The requests are sent to the instances rather than the gateway.
+            self.assertFalse(self.gateway.batch_sizes)
+            for service in self.instances:
+                self.assertGreater(len(service.batch_sizes), 0)
+            self.assertTrue(
+                all(inst.outstanding == 0 for inst in predictor._balancer.instances)
+            )
+
+    def test_eject(self):
+        predictor = _make_balanced_predictor(
+            self.gateway.endpoint,
+            [self._ports()[0], _unused_port()],
+            max_failures=1,
+            eject_duration=60,
+        )
+        # The request failed to connect to the dead instance is retried on the
+        # other one.
+        for i in range(10):
+            self.assertEqual(predictor.predict([i]), [i])
+        self.assertEqual(len(self.instances[0].batch_sizes), 10)
+        self.assertFalse(self.gateway.batch_sizes)
+
+        # Requests are sent through the gateway if all the instances are ejected.
+        predictor = _make_balanced_predictor(
+            self.gateway.endpoint, [_unused_port()], max_failures=1
+        )
+        self.assertEqual(predictor.predict([0]), [0])
+        self.assertEqual(predictor.predict([1]), [1])
+        self.assertEqual(self.gateway.batch_sizes, [1, 1])
+
+    def test_retry_connect_error(self):
+        # The dead instance is not ejected, the retry goes to the other instance
+        # or the gateway.
+        predictor = _make_balanced_predictor(
+            self.gateway.endpoint,
+            [_unused_port(), self._ports()[0]],
+            max_failures=100,
+        )
+        for i in range(10):
+            self.assertEqual(predictor.predict([i]), [i])
+        self.assertEqual(len(self.instances[0].batch_sizes), 10)
+
+        predictor = _make_balanced_predictor(
+            self.gateway.endpoint, [_unused_port()], max_failures=100
+        )
+        self.assertEqual(predictor.predict([0]), [0])
+        self.assertEqual(self.gateway.batch_sizes, [1])
+        # Other failures are not retried.
+        with patch.object(
+            requests.Session, "request", side_effect=requests.exceptions.ReadTimeout
+        ) as request:
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                predictor.predict([1])
+        self.assertEqual(request.call_count, 1)
+
+    def test_refresh(self):
+        ports = self._ports()
+        predictor = _make_balanced_predictor(
+            self.gateway.endpoint, ports[:1], refresh_interval=0.05
+        )
+        predictor.predict([0])
+        self.assertEqual(len(predictor._balancer.instances), 1)
+
+        predictor.session.service_api.ports = ports
+        deadline = time.monotonic() + 5
+        while len(predictor._balancer.instances) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(predictor._balancer.instances), 2)
+        self.assertGreater(predictor.session.service_api.calls, 1)
+
+
+class TestAsyncPredictor(BaseUnitTestCase):
+    def test_predict_async_reuse_connection(self):
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(service.endpoint)
+
+            async def run():
+                async with predictor:
+                    return [
+                        await predictor.predict_async({"index": i}) for i in range(5)
+                    ]
+
+            results = asyncio.run(run())
+            self.assertListEqual(results, [{"index": i} for i in range(5)])
+            self.assertEqual(len(service.client_ports), 1)
+            self.assertFalse(predictor._async_sessions)
+
+    def test_connection_pool_per_event_loop(self):
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                async_connection_config=AsyncConnectionConfig(limit=2),
+            )
+
+            async def run():
+                session = await predictor._get_async_session()
+                resp = await predictor.raw_predict_async(data=b"hello")
+                return session, resp
+
+            for _ in range(3):
+                session, resp = asyncio.run(run())
+                self.assertEqual(resp.content, b"hello")
+                # Session bound to the event loop is closed on loop shutdown.
+                self.assertTrue(session.closed)
+            self.assertEqual(len(predictor._async_sessions), 1)
+
+            async def get_limit():
+                async with predictor:
+                    session = await predictor._get_async_session()
+                    return session.connector.limit
+
+            self.assertEqual(asyncio.run(get_limit()), 2)
+
+    def test_wait_config(self):
+        wait_config = WaitConfig(
+            backoff=BackoffStrategy.Exponential, min_interval=0.01, max_interval=0.04
+        )
+        self.assertListEqual(
+            [next(wait_config.intervals()) for _ in range(2)], [0.01, 0.01]
+        )
+        intervals = wait_config.intervals()
+        self.assertListEqual(
+            [next(intervals) for _ in range(4)], [0.01, 0.02, 0.04, 0.04]
+        )
+        self.assertIsNone(wait_config.total_timeout)
+        self.assertEqual(WaitConfig(max_attempts=3, interval=2).total_timeout, 6)
+        self.assertEqual(WaitConfig(max_attempts=3, timeout=1).total_timeout, 1)
+
+        wait_config = WaitConfig(min_interval=0.01, use_latency_hint=True)
+        self.assertEqual(next(wait_config.intervals(latency_hint=3)), 3)
+        with self.assertRaises(ValueError):
+            WaitConfig(backoff="linear")
+        with self.assertRaisesRegex(ValueError, "positive number"):
+            WaitConfig(interval=0)
+        with self.assertRaisesRegex(ValueError, "max_interval"):
+            WaitConfig(backoff="exponential", min_interval=2, max_interval=1)
+
+    def test_poll_result_with_backoff(self):
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(service.endpoint)
+            wait_config = WaitConfig(
+                backoff=BackoffStrategy.Exponential,
+                min_interval=0.01,
+                max_interval=0.05,
+                timeout=0.3,
+            )
+            start = time.monotonic()
+            with self.assertRaisesRegex(RuntimeError, "timeout"):
+                predictor._poll_result("not-exists", wait_config)
+            self.assertLess(time.monotonic() - start, 1)
+
+            with self.assertRaisesRegex(RuntimeError, "timeout"):
+                asyncio.run(predictor._poll_result_async("not-exists", wait_config))
+
+            async def run():
+                async with predictor:
+                    return await predictor.predict_async(
+                        {"foo": 1}, wait_config=wait_config
+                    )
+
+            self.assertEqual(asyncio.run(run()), {"foo": 1})
+            # The completion time is recorded as the hint of the next polls.
+            self.assertIsNotNone(predictor._latency_tracker.hint())
+
+    def test_predict_many(self):
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(service.endpoint)
+            wait_config = WaitConfig(interval=0.01)
+            # The object() is not JSON serializable, it fails without aborting the
+            # other items.
+            data = [{"index": i} for i in range(10)] + [object(), {"index": 11}]
+            results = predictor.predict_many(
+                data, max_in_flight=4, wait_config=wait_config
+            )
+            first = next(results)
+            self.assertEqual(first.result, {"index": 0})
+            # Backpressure: no more than max_in_flight requests are enqueued.
+            self.assertLessEqual(len(service.server.enqueued), 4)
+
+            results = [first] + list(results)
+            self.assertListEqual([r.index for r in results], list(range(12)))
+            self.assertFalse(results[10].succeeded)
+            self.assertIsInstance(results[10].exception, TypeError)
+            self.assertListEqual(
+                [r.result for r in results if r.succeeded],
+                [d for d in data if isinstance(d, dict)],
+            )
+            self.assertEqual(len(service.server.enqueued), 11)
+
+            results = list(
+                predictor.predict_many(
+                    data, max_in_flight=3, ordered=False, wait_config=wait_config
+                )
+            )
+            self.assertListEqual(sorted(r.index for r in results), list(range(12)))
+
+            with self.assertRaises(ValueError):
+                next(predictor.predict_many(data, max_in_flight=0))
+
+    def test_predict_many_async(self):
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(service.endpoint)
+            wait_config = WaitConfig(interval=0.01)
+            data = [{"index": i} for i in range(10)] + [object(), {"index": 11}]
+
+            async def run(**kwargs):
+                async with predictor:
+                    return [
+                        r
+                        async for r in predictor.predict_many_async(
+                            data, max_in_flight=4, wait_config=wait_config, **kwargs
+                        )
+                    ]
+
+            results = asyncio.run(run())
+            self.assertListEqual([r.index for r in results], list(range(12)))
+            self.assertIsInstance(results[10].exception, TypeError)
+            self.assertEqual(results[11].result, {"index": 11})
+
+            results = asyncio.run(run(ordered=False))
+            self.assertListEqual(sorted(r.index for r in results), list(range(12)))
+            self.assertEqual(sum(not r.succeeded for r in results), 1)
+
+    def test_result_subscription(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(
+                    batch_size=16, poll_interval=0.01
+                ),
+            )
+            tasks = [predictor.predict({"index": i}) for i in range(40)]
+            results = [task.result(timeout=10) for task in tasks]
+            self.assertListEqual(results, [{"index": i} for i in range(40)])
+
+            results = predictor.predict_many(
+                [{"index": i} for i in range(30)], max_in_flight=8, ordered=False
+            )
+            self.assertListEqual(
+                sorted(r.result["index"] for r in results), list(range(30))
+            )
+
+            async def run():
+                async with predictor:
+                    return await asyncio.gather(
+                        *[predictor.predict_async({"index": i}) for i in range(20)]
+                    )
+
+            self.assertListEqual(asyncio.run(run()), [{"index": i} for i in range(20)])
+
+            # The results are read in bulk rather than polled per request.
+            self.assertLess(len(service.server.sink_reads), 60)
+            # The claimed results are deleted from the sink once dispatched.
+            deadline = time.monotonic() + 5
+            while any(service.server.sink) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertFalse(any(service.server.sink))
+
+    def test_result_subscription_cancelled_wait(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(poll_interval=0.01),
+            )
+            subscriber = predictor._result_subscriber
+
+            async def cancelled_wait():
+                await asyncio.wait_for(
+                    predictor._wait_subscribed_result_async("cancelled", WaitConfig()),
+                    0.05,
+                )
+
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(cancelled_wait())
+            self.assertNotIn("cancelled", subscriber._waiting)
+
+            # The result of the cancelled wait is delivered after the cancellation.
+            with service.server.lock:
+                service.server.sink.append(
+                    {
+                        "index": len(service.server.sink) + 1,
+                        "data": base64.b64encode(b"{}").decode(),
+                        "tags": {"requestId": "cancelled"},
+                    }
+                )
+            self.assertEqual(
+                predictor.predict({"foo": 1}).result(timeout=10), {"foo": 1}
+            )
+
+            # Dispatching to a cancelled future does not stop the subscriber.
+            future = subscriber.subscribe("cancelled_future")
+            future.cancel()
+            subscriber._dispatch(None, "cancelled_future", b"{}")
+            self.assertEqual(
+                predictor.predict({"foo": 2}).result(timeout=10), {"foo": 2}
+            )
+
+    def test_predict_many_abandoned(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(poll_interval=0.01),
+            )
+            subscriber = predictor._result_subscriber
+            data = [{"index": i} for i in range(10)]
+
+            async def run_abandoned():
+                async with predictor:
+                    results = predictor.predict_many_async(
+                        [object()] + data, max_in_flight=4
+                    )
+                    try:
+                        async for result in results:
+                            if not result.succeeded:
+                                # Abandon the items waiting for the results.
+                                while len(subscriber._waiting) < 3:
+                                    await asyncio.sleep(0.01)
+                                break
+                    finally:
+                        await results.aclose()
+                    # The in-flight items are unsubscribed before they are
+                    # cancelled.
+                    self.assertFalse(subscriber._waiting)
+
+            async def run():
+                async with predictor:
+                    return [r async for r in predictor.predict_many_async(data)]
+
+            service.server.results_held = True
+            asyncio.run(asyncio.wait_for(run_abandoned(), 10))
+            service.server.results_held = False
+            results = asyncio.run(asyncio.wait_for(run(), 10))
+            self.assertListEqual([r.result for r in results], data)
+
+            service.server.results_held = True
+            results = predictor.predict_many([object()] + data, max_in_flight=4)
+            self.assertFalse(next(results).succeeded)
+            self.assertTrue(subscriber._waiting)
+            results.close()
+            self.assertFalse(subscriber._waiting)
+            service.server.results_held = False
+            results = predictor.predict_many(data)
+            self.assertListEqual([r.result for r in results], data)
+
+    def test_prediction_failed_async(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(poll_interval=0.01),
+            )
+            # The failed result is read from the sink before subscribed.
+            predictor._result_subscriber._dispatch(
+                None, "failed", (500, {}, b"Internal Error")
+            )
+            with self.assertRaises(PredictionException) as ctx:
+                asyncio.run(predictor._poll_result_async("failed", WaitConfig()))
+            self.assertEqual(ctx.exception.code, 500)
+
+        with LocalService(_QueueServiceHandler) as service:
+            predictor = make_async_predictor(service.endpoint)
+
+            async def get_result(request_id):
+                return 503, {}, b"Service Unavailable"
+
+            with patch.object(predictor, "_get_result_async", get_result):
+                with self.assertRaises(PredictionException) as ctx:
+                    asyncio.run(predictor._poll_result_async("failed", WaitConfig()))
+            self.assertEqual(ctx.exception.code, 503)
+
+    def test_result_subscription_backlog(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            # The results of the other clients in the sink.
+            service.server.sink.extend(
+                {
+                    "index": i + 1,
+                    "data": base64.b64encode(b"{}").decode(),
+                    "tags": {"requestId": uuid.uuid4().hex},
+                }
+                for i in range(1000)
+            )
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(
+                    batch_size=16, poll_interval=0.01
+                ),
+            )
+            self.assertEqual(
+                predictor.predict({"foo": 1}).result(timeout=10), {"foo": 1}
+            )
+            # The backlog of the sink is not replayed.
+            self.assertLessEqual(len(service.server.sink_reads), 3)
+            self.assertLessEqual(len(predictor._result_subscriber._unclaimed), 16)
+
+    def test_result_subscription_fallback(self):
+        with LocalService(_SinkQueueServiceHandler) as service:
+            predictor = make_async_predictor(
+                service.endpoint,
+                result_subscription_config=ResultSubscriptionConfig(
+                    poll_interval=0.01, fallback_interval=0.05
+                ),
+            )
+            # The results before the index of the subscriber are missed by the bulk
+            # reads, and are fetched by the request ID.
+            predictor._result_subscriber._index = 1000
+            self.assertEqual(
+                predictor.predict({"foo": 1}).result(timeout=10), {"foo": 1}
+            )
+            self.assertTrue(
+                any("requestId" in query for query in service.server.sink_reads)
+            )
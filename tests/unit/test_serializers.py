@@ -0,0 +1,190 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import numpy as np
+from eas_prediction import pytorch_predict_pb2 as pt_pb
+from eas_prediction import tf_request_pb2 as tf_pb
+
+from pai.common.proto_utils import (
+    WireType,
+    decode_varints,
+    encode_length_delimited,
+    encode_tag,
+    encode_varint,
+    encode_varints,
+)
+from pai.serializers import (
+    BytesSerializer,
+    JsonSerializer,
+    PyTorchSerializer,
+    TensorFlowSerializer,
+)
+from tests.unit import BaseUnitTestCase
+
+
+class TestSerializerBatching(BaseUnitTestCase):
+    def test_json_serializer(self):
+        serializer = JsonSerializer()
+        batch, batch_sizes = serializer.merge_batch(
+            [[[1, 2]], np.asarray([[3, 4], [5, 6]]), ([7, 8],)]
+        )
+        self.assertListEqual(batch, [[1, 2], [3, 4], [5, 6], [7, 8]])
+        self.assertListEqual(batch_sizes, [1, 2, 1])
+        self.assertListEqual(
+            serializer.split_batch(batch, batch_sizes),
+            [[[1, 2]], [[3, 4], [5, 6]], [[7, 8]]],
+        )
+
+        with self.assertRaises(ValueError):
+            serializer.merge_batch([{"foo": "bar"}])
+        with self.assertRaises(ValueError):
+            serializer.split_batch([1, 2], [1, 2])
+
+    def test_tensorflow_serializer(self):
+        serializer = TensorFlowSerializer()
+        batch, batch_sizes = serializer.merge_batch(
+            [
+                {"x": np.ones((1, 3)), "y": [[1]]},
+                {"x": np.zeros((2, 3)), "y": [[2], [3]]},
+            ]
+        )
+        self.assertEqual(batch["x"].shape, (3, 3))
+        self.assertListEqual(batch["y"].ravel().tolist(), [1, 2, 3])
+        self.assertListEqual(batch_sizes, [1, 2])
+
+        results = serializer.split_batch(
+            {"out": np.arange(3).reshape(3, 1)}, batch_sizes
+        )
+        self.assertListEqual(results[0]["out"].ravel().tolist(), [0])
+        self.assertListEqual(results[1]["out"].ravel().tolist(), [1, 2])
+
+        batch, batch_sizes = serializer.merge_batch([np.ones((2, 4)), [[0] * 4]])
+        self.assertEqual(batch.shape, (3, 4))
+        self.assertListEqual(batch_sizes, [2, 1])
+
+        with self.assertRaises(ValueError):
+            serializer.merge_batch([{"x": [[1]]}, {"z": [[1]]}])
+        with self.assertRaises(ValueError):
+            serializer.merge_batch([{"x": [[1]], "y": [[1], [2]]}])
+        with self.assertRaises(ValueError):
+            serializer.split_batch({"out": np.ones((2, 1))}, batch_sizes)
+
+    def test_pytorch_serializer(self):
+        serializer = PyTorchSerializer()
+        batch, batch_sizes = serializer.merge_batch([np.ones((1, 2)), np.ones((3, 2))])
+        self.assertEqual(batch.shape, (4, 2))
+        results = serializer.split_batch(np.arange(8).reshape(4, 2), batch_sizes)
+        self.assertListEqual([r.shape for r in results], [(1, 2), (3, 2)])
+
+        batch, batch_sizes = serializer.merge_batch(
+            [[np.ones((1, 2)), np.ones((1, 5))], [np.ones((2, 2)), np.ones((2, 5))]]
+        )
+        self.assertListEqual([v.shape for v in batch], [(3, 2), (3, 5)])
+        results = serializer.split_batch([np.ones((3, 1)), np.ones((3, 7))], [1, 2])
+        self.assertListEqual(
+            [[v.shape for v in r] for r in results],
+            [[(1, 1), (1, 7)], [(2, 1), (2, 7)]],
+        )
+
+        with self.assertRaises(ValueError):
+            serializer.merge_batch([np.ones(1), [np.ones(1)]])
+
+    def test_batching_not_supported(self):
+        with self.assertRaises(NotImplementedError):
+            BytesSerializer().merge_batch([b"foo"])
+
+
+class TestTensorSerialization(BaseUnitTestCase):
+    def test_varint_codec(self):
+        values = np.asarray(
+            [0, 1, -1, 127, 128, 300, -300, 2**31, 2**63 - 1, -(2**63)],
+            dtype=np.int64,
+        )
+        array_proto = tf_pb.ArrayProto()
+        array_proto.int64_val.extend(values.tolist())
+        encoded = encode_varints(values)
+        # packed field payload is at the tail of the serialized message.
+        self.assertTrue(array_proto.SerializeToString().endswith(encoded))
+        self.assertListEqual(
+            decode_varints(encoded).view(np.int64).tolist(), values.tolist()
+        )
+        self.assertEqual(encode_varints(np.asarray([], dtype=np.int64)), b"")
+        with self.assertRaises(ValueError):
+            decode_varints(b"\x80")
+
+    def test_tensorflow_serializer(self):
+        serializer = TensorFlowSerializer()
+        data = {
+            "float": np.random.rand(3, 4).astype(np.float32),
+            "double": np.random.rand(2),
+            "int8": np.asarray([-3, 4], dtype=np.int8),
+            "int64": np.asarray([[-(2**40), 0, 2**40]], dtype=np.int64),
+            "bool": np.asarray([True, False, True]),
+        }
+        request = tf_pb.PredictRequest.FromString(serializer.serialize(data))
+        self.assertListEqual(
+            list(request.inputs["float"].float_val), data["float"].ravel().tolist()
+        )
+        self.assertListEqual(list(request.inputs["float"].array_shape.dim), [3, 4])
+        self.assertListEqual(
+            list(request.inputs["double"].double_val), data["double"].tolist()
+        )
+        self.assertListEqual(list(request.inputs["int8"].int_val), [-3, 4])
+        self.assertListEqual(
+            list(request.inputs["int64"].int64_val), data["int64"].ravel().tolist()
+        )
+        self.assertListEqual(list(request.inputs["bool"].bool_val), [True, False, True])
+
+        # Build the response with protobuf and decode it with the serializer.
+        response = tf_pb.PredictResponse()
+        for name, value in request.inputs.items():
+            response.outputs[name].CopyFrom(value)
+        response.outputs["string"].dtype = tf_pb.DT_STRING
+        response.outputs["string"].array_shape.dim.extend([2])
+        response.outputs["string"].string_val.extend([b"foo", b"bar"])
+        results = serializer.deserialize(response.SerializeToString())
+
+        for name, value in data.items():
+            self.assertEqual(results[name].dtype, value.dtype)
+            np.testing.assert_array_equal(results[name], value)
+        self.assertListEqual(results["string"].tolist(), ["foo", "bar"])
+
+    def test_pytorch_serializer(self):
+        serializer = PyTorchSerializer()
+        x = np.random.rand(2, 3).astype(np.float32)
+        y = np.asarray([[-1, 2**40]], dtype=np.int64)
+        request = pt_pb.PredictRequest.FromString(serializer.serialize([x, y]))
+        self.assertEqual(len(request.inputs), 2)
+        self.assertListEqual(list(request.inputs[0].float_val), x.ravel().tolist())
+        self.assertListEqual(list(request.inputs[1].int64_val), y.ravel().tolist())
+        self.assertListEqual(list(request.inputs[1].array_shape.dim), [1, 2])
+
+        response = pt_pb.PredictResponse()
+        response.outputs.extend(request.inputs)
+        results = serializer.deserialize(response.SerializeToString())
+        np.testing.assert_array_equal(results[0], x)
+        np.testing.assert_array_equal(results[1], y)
+
+        # Repeated values encoded as unpacked elements.
+        output = pt_pb.ArrayProto(dtype=pt_pb.DT_INT32)
+        output.array_shape.dim.append(3)
+        raw = output.SerializeToString() + b"".join(
+            encode_tag(5, WireType.VARINT) + encode_varint(v) for v in [1, -2, 3]
+        )
+        np.testing.assert_array_equal(
+            serializer.deserialize(encode_length_delimited(1, raw)), [1, -2, 3]
+        )
+
+        with self.assertRaises(ValueError):
+            serializer.serialize(np.asarray([True]))
@@ -12,11 +12,31 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
 import json
+import os
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.case import TestCase
+from unittest.mock import PropertyMock, patch
 
-from pai.session import Session
+from alibabacloud_credentials.client import Client as CredentialClient
+from alibabacloud_credentials.models import Config as CredentialConfig
+from alibabacloud_credentials.provider.refreshable import (
+    Credentials as ProviderCredentials,
+)
+from alibabacloud_credentials_api import ICredentialsProvider
+
+from pai.api.base import ServiceName
+from pai.common.instance_catalog import InstanceSpec, InstanceTypeCatalog
+from pai.common.oss_utils import CredentialProviderWrapper
+from pai.libs.alibabacloud_eas20210701.models import Service
+from pai.libs.alibabacloud_paistudio20220112.models import ListTrainingJobsResponseBody
+from pai.model import ModelBase
+from pai.session import AsyncSession, Session
 
 
 class TestSession(TestCase):
@@ -35,3 +55,311 @@ class TestSession(TestCase):
             res = json.load(f)
 
         self.assertEqual(res, d)
+
+    def test_provider(self):
+        session = Session(region_id="cn-hangzhou")
+        with patch.object(
+            Session, "_acs_sts_client", new_callable=PropertyMock
+        ) as sts_client:
+            identity = sts_client.return_value.get_caller_identity.return_value
+            identity.body.account_id = "1234"
+            self.assertEqual(session.provider, "1234")
+            self.assertEqual(session.provider, "1234")
+        sts_client.return_value.get_caller_identity.assert_called_once()
+
+    def test_oss_bucket_cache(self):
+        s = Session(
+            region_id="cn-hangzhou",
+            oss_bucket_name="bucket-name",
+            oss_endpoint="oss-cn-hangzhou.aliyuncs.com",
+            oss_connection_pool_size=32,
+            credential_config=CredentialConfig(
+                access_key_id="access_key_id",
+                access_key_secret="access_key_secret",
+                type="access_key",
+            ),
+        )
+        bucket = s.oss_bucket
+        self.assertIs(s.oss_bucket, bucket)
+        self.assertIs(s.get_oss_bucket("bucket-name"), bucket)
+
+        other_bucket = s.get_oss_bucket(
+            "bucket-name", endpoint="oss-cn-hangzhou-internal.aliyuncs.com"
+        )
+        self.assertIsNot(other_bucket, bucket)
+        # Buckets share the credentials and the HTTP connection pool.
+        self.assertIs(other_bucket.session, bucket.session)
+        self.assertIs(other_bucket.auth, bucket.auth)
+        adapter = bucket.session.session.get_adapter(
+            "https://bucket-name.oss-cn-hangzhou.aliyuncs.com"
+        )
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+        credentials = bucket.auth.credentials_provider.get_credentials()
+        self.assertEqual(credentials.access_key_id, "access_key_id")
+        self.assertEqual(credentials.access_key_secret, "access_key_secret")
+
+
+class _RotatingCredentialsProvider(ICredentialsProvider):
+    """A credentials provider that returns new credentials on each call."""
+
+    def __init__(self, expires_in=None):
+        self.count = 0
+        self.expires_in = expires_in
+
+    def get_credentials(self) -> ProviderCredentials:
+        self.count += 1
+        return ProviderCredentials(
+            access_key_id=f"id-{self.count}",
+            access_key_secret=f"secret-{self.count}",
+            security_token=f"token-{self.count}",
+            expiration=int(time.time()) + self.expires_in
+            if self.expires_in is not None
+            else None,
+            provider_name=self.get_provider_name(),
+        )
+
+    async def get_credentials_async(self) -> ProviderCredentials:
+        return self.get_credentials()
+
+    def get_provider_name(self) -> str:
+        return "rotating"
+
+
+class TestCredentialProviderWrapper(TestCase):
+    def test_access_key_credentials(self):
+        client = CredentialClient(
+            CredentialConfig(
+                type="access_key", access_key_id="id", access_key_secret="secret"
+            )
+        )
+        provider = CredentialProviderWrapper(client=client)
+        credentials = provider.get_credentials()
+        self.assertEqual(credentials.access_key_id, "id")
+        self.assertEqual(credentials.access_key_secret, "secret")
+
+    def test_credentials_without_expiration(self):
+        # Credentials without a known expiration are not cached, the credential
+        # client is responsible for refreshing them.
+        client = CredentialClient(provider=_RotatingCredentialsProvider())
+        provider = CredentialProviderWrapper(client=client)
+        self.assertEqual(provider.get_credentials().security_token, "token-1")
+        self.assertEqual(provider.get_credentials().security_token, "token-2")
+
+    def test_refresh_before_expiration(self):
+        credentials_provider = _RotatingCredentialsProvider(expires_in=3600)
+        client = CredentialClient(provider=credentials_provider)
+        provider = CredentialProviderWrapper(client=client)
+        self.assertEqual(provider.get_credentials().security_token, "token-1")
+        self.assertEqual(provider.get_credentials().security_token, "token-1")
+        self.assertEqual(credentials_provider.count, 1)
+
+        # Credentials are refreshed if they are about to expire.
+        credentials_provider.expires_in = 60
+        provider._expire_at = time.time() - 1
+        self.assertEqual(provider.get_credentials().security_token, "token-2")
+        self.assertEqual(provider.get_credentials().security_token, "token-3")
+
+
+class _FakeAsyncClient(object):
+    """A stand-in of the generated client that records the async calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def describe_service_with_options_async(
+        self, cluster_id, service_name, headers, runtime
+    ):
+        self.calls.append(("describe_service", cluster_id, service_name))
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(body=Service(service_name=service_name))
+
+    async def list_training_jobs_with_options_async(self, tmp_req, headers, runtime):
+        self.calls.append(("list_training_jobs", tmp_req.workspace_id))
+        return SimpleNamespace(
+            body=ListTrainingJobsResponseBody(training_jobs=[], total_count=0)
+        )
+
+
+class TestAsyncSession(TestCase):
+    def test_async_resource_api(self):
+        client = _FakeAsyncClient()
+        session = Session(region_id="cn-hangzhou", workspace_id="1234")
+        session.acs_client_container[ServiceName.PAI_EAS] = client
+        session.acs_client_container[ServiceName.PAI_STUDIO] = client
+        async_session = AsyncSession(session)
+
+        async def run():
+            services = await asyncio.gather(
+                *[async_session.service_api.get(f"service_{i}") for i in range(5)]
+            )
+            jobs = await async_session.training_job_api.list()
+            return services, jobs
+
+        services, jobs = asyncio.run(run())
+        self.assertListEqual(
+            [s["ServiceName"] for s in services], [f"service_{i}" for i in range(5)]
+        )
+        self.assertEqual(jobs.total_count, 0)
+        # Workspace ID of the session is injected into the request.
+        self.assertIn(("list_training_jobs", "1234"), client.calls)
+        self.assertIn(("describe_service", "cn-hangzhou", "service_3"), client.calls)
+
+        with self.assertRaises(AttributeError):
+            _ = async_session.service_api.not_exists_method
+
+
+class _FakeServiceClient(object):
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _record(self, *call):
+        with self._lock:
+            self.calls.append(call)
+
+    def describe_service_with_options(self, cluster_id, service_name, headers, runtime):
+        self._record("describe_service", service_name)
+        time.sleep(0.05)
+        return SimpleNamespace(body=Service(service_name=service_name))
+
+    def stop_service_with_options(self, cluster_id, service_name, headers, runtime):
+        self._record("stop_service", service_name)
+        return SimpleNamespace(body=None)
+
+
+class TestResourceAPICache(TestCase):
+    def make_session(self, ttl):
+        client = _FakeServiceClient()
+        session = Session(region_id="cn-hangzhou", api_cache_ttl={"Service": ttl})
+        session.acs_client_container[ServiceName.PAI_EAS] = client
+        return session, client
+
+    def describe_count(self, client, name):
+        return client.calls.count(("describe_service", name))
+
+    def test_coalesce_concurrent_requests(self):
+        session, client = self.make_session(ttl=60)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: session.service_api.get("foo"), range(16))
+            )
+        self.assertTrue(all(r["ServiceName"] == "foo" for r in results))
+        self.assertEqual(self.describe_count(client, "foo"), 1)
+
+        # Returned result is a copy of the cached one.
+        results[0]["ServiceName"] = "modified"
+        self.assertEqual(session.service_api.get(name="foo")["ServiceName"], "foo")
+        self.assertEqual(self.describe_count(client, "foo"), 1)
+
+    def test_invalidation(self):
+        session, client = self.make_session(ttl=0.2)
+        session.service_api.get("foo")
+        session.service_api.get("bar")
+        session.service_api.stop("foo")
+        session.service_api.get("foo")
+        session.service_api.get("bar")
+        self.assertEqual(self.describe_count(client, "foo"), 2)
+        self.assertEqual(self.describe_count(client, "bar"), 1)
+
+        time.sleep(0.2)
+        session.service_api.get("bar")
+        self.assertEqual(self.describe_count(client, "bar"), 2)
+
+    def test_expired_entries_removed(self):
+        session, client = self.make_session(ttl=0.1)
+        for i in range(10):
+            session.service_api.get(f"svc-{i}")
+        time.sleep(0.1)
+        session.service_api.get("foo")
+        # The entries of the resources not read again are swept on the store.
+        self.assertEqual(len(session.service_api._cache._entries), 1)
+
+    def test_cache_disabled_by_default(self):
+        client = _FakeServiceClient()
+        session = Session(region_id="cn-hangzhou")
+        session.acs_client_container[ServiceName.PAI_EAS] = client
+        session.service_api.get("foo")
+        session.service_api.get("foo")
+        self.assertEqual(self.describe_count(client, "foo"), 2)
+
+
+class TestInstanceTypeCatalog(TestCase):
+    def setUp(self):
+        self.load_count = 0
+
+    def _load(self):
+        self.load_count += 1
+        return [
+            InstanceSpec.from_ecs_spec(
+                {"InstanceType": "ecs.c6.large", "AcceleratorType": "CPU", "Cpu": 2}
+            ),
+            InstanceSpec.from_machine_spec(
+                {"InstanceType": "ecs.gn6i-c4g1.xlarge", "GPU": 1, "CPU": 4}
+            ),
+        ]
+
+    def test_lazy_load(self):
+        catalog = InstanceTypeCatalog(loader=self._load)
+        self.assertEqual(self.load_count, 0)
+        self.assertIn("ecs.c6.large", catalog)
+        self.assertNotIn("ecs.unknown", catalog)
+        self.assertTrue(catalog.get("ecs.gn6i-c4g1.xlarge").is_gpu)
+        self.assertFalse(catalog.get("ecs.c6.large").is_gpu)
+        self.assertEqual(self.load_count, 1)
+
+        catalog = InstanceTypeCatalog(loader=self._load, ttl=0)
+        self.assertEqual(len(catalog), 2)
+        self.assertEqual(len(catalog), 2)
+        self.assertEqual(self.load_count, 3)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, "catalog", "training.json")
+            catalog = InstanceTypeCatalog(loader=self._load, cache_file=cache_file)
+            self.assertIn("ecs.c6.large", catalog)
+
+            # Another catalog reuses the persisted one within TTL.
+            catalog = InstanceTypeCatalog(loader=self._load, cache_file=cache_file)
+            self.assertEqual(catalog.get("ecs.c6.large").cpu, 2)
+            self.assertEqual(self.load_count, 1)
+
+            catalog = InstanceTypeCatalog(
+                loader=self._load, cache_file=cache_file, ttl=0
+            )
+            self.assertIn("ecs.c6.large", catalog)
+            self.assertEqual(self.load_count, 2)
+
+    def test_session_instance_helpers(self):
+        session = Session(region_id="cn-hangzhou")
+        with patch.object(
+            Session, "_list_training_instance_specs", side_effect=self._load
+        ), patch.object(
+            Session, "_list_inference_instance_specs", side_effect=self._load
+        ):
+            self.assertTrue(session.is_supported_training_instance("ecs.c6.large"))
+            self.assertFalse(session.is_gpu_training_instance("ecs.c6.large"))
+            self.assertTrue(session.is_gpu_inference_instance("ecs.gn6i-c4g1.xlarge"))
+            self.assertFalse(session.is_supported_inference_instance("ecs.unknown"))
+            with self.assertRaises(ValueError):
+                session.is_gpu_training_instance("ecs.unknown")
+        self.assertEqual(self.load_count, 2)
+
+    def test_deploy_instance_type_check(self):
+        session = Session(region_id="cn-hangzhou")
+        model = ModelBase(model_data="oss://bucket/model/", session=session)
+        with patch.object(
+            Session, "_list_inference_instance_specs", side_effect=self._load
+        ), self.assertLogs("pai.model", level="WARNING"):
+            # Unknown instance type is warned rather than rejected.
+            model._check_instance_type("ecs.unknown")
+
+        # The check is skipped if the catalog is not available.
+        session = Session(region_id="cn-hangzhou")
+        model = ModelBase(model_data="oss://bucket/model/", session=session)
+        with patch.object(
+            Session,
+            "_list_inference_instance_specs",
+            side_effect=RuntimeError("Forbidden"),
+        ):
+            model._check_instance_type("ecs.c6.large")
@@ -17,9 +17,20 @@
 from __future__ import absolute_import, print_function
 
 import os
+import threading
+import time
 
+from pai.api.base import PaginatedResult
+from pai.common import yaml_utils
 from pai.common.oss_utils import is_oss_uri
-from pai.common.utils import generate_repr, is_filesystem_uri, is_odps_table_uri
+from pai.common.utils import (
+    BackoffStrategy,
+    generate_repr,
+    is_filesystem_uri,
+    is_odps_table_uri,
+    make_backoff_intervals,
+    make_list_resource_iterator,
+)
 from tests.test_data import SCRIPT_DIR_PATH
 from tests.unit import BaseUnitTestCase
 from tests.unit.utils import extract_odps_table_info, file_checksum
@@ -197,3 +208,108 @@ class TestUtils(BaseUnitTestCase):
             with self.subTest(tc=tc):
                 result = is_filesystem_uri(tc["arguments"]["uri"])
                 self.assertEqual(result, tc["expected"])
+
+    def test_make_backoff_intervals(self):
+        def take(intervals, n=7):
+            return [next(intervals) for _ in range(n)]
+
+        self.assertListEqual(
+            take(make_backoff_intervals(1, 10, strategy=BackoffStrategy.Exponential)),
+            [1, 2, 4, 8, 10, 10, 10],
+        )
+        self.assertListEqual(
+            take(make_backoff_intervals(0.5, strategy=BackoffStrategy.Fibonacci)),
+            [0.5, 0.5, 1, 1.5, 2.5, 4, 6.5],
+        )
+        self.assertListEqual(
+            take(make_backoff_intervals(2, 5, BackoffStrategy.Fixed, seed=7), 3),
+            [5, 2, 2],
+        )
+        for interval in take(make_backoff_intervals(1, 1, jitter=0.2), 100):
+            self.assertTrue(0.8 <= interval <= 1.2)
+        with self.assertRaises(ValueError):
+            make_backoff_intervals(1, strategy="linear")
+
+    def test_yaml_utils(self):
+        shared = {"name": "input", "value": [1, 2]}
+        data = {"inputs": [shared, shared], "command": "echo 'hello'"}
+
+        text = yaml_utils.dump(data)
+        self.assertNotIn("&", text)
+        self.assertEqual(yaml_utils.safe_load(text), data)
+
+        docs = yaml_utils.dump_all([data, {"apiVersion": "core/v1"}])
+        self.assertNotIn("*", docs)
+        self.assertEqual(yaml_utils.safe_load(docs.split("---")[0]), data)
+        with self.assertRaises(Exception):
+            yaml_utils.safe_load("!!python/object:os.system {}")
+
+
+class _FakeListMethod(object):
+    """A list method of the resource API that records the requested pages."""
+
+    def __init__(self, total_count, max_page_size=None, paginated=True, delay=0.02):
+        self.total_count = total_count
+        self.max_page_size = max_page_size
+        self.paginated = paginated
+        self.delay = delay
+        self.pages = []
+        self.inflight = 0
+        self.max_inflight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page_number, page_size, **kwargs):
+        with self._lock:
+            self.pages.append(page_number)
+            self.inflight += 1
+            self.max_inflight = max(self.max_inflight, self.inflight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.inflight -= 1
+        page_size = min(page_size, self.max_page_size or page_size)
+        start = (page_number - 1) * page_size
+        items = list(range(start, min(start + page_size, self.total_count)))
+        if self.paginated:
+            return PaginatedResult(items=items, total_count=self.total_count)
+        return items
+
+
+class TestListResourceIterator(BaseUnitTestCase):
+    def test_fan_out_with_total_count(self):
+        method = _FakeListMethod(total_count=1005)
+        items = list(make_list_resource_iterator(method, page_size=10, max_workers=4))
+        self.assertListEqual(items, list(range(1005)))
+        self.assertListEqual(sorted(method.pages), list(range(1, 102)))
+        self.assertGreater(method.max_inflight, 1)
+        self.assertLessEqual(method.max_inflight, 4)
+
+    def test_read_ahead_without_total_count(self):
+        method = _FakeListMethod(total_count=95, paginated=False)
+        items = list(
+            make_list_resource_iterator(method, page_size=10, prefetch_pages=2)
+        )
+        self.assertListEqual(items, list(range(95)))
+        self.assertGreater(method.max_inflight, 1)
+        # Pages read ahead past the end of the listing are bounded.
+        self.assertLessEqual(max(method.pages), 12)
+
+        method = _FakeListMethod(total_count=30, paginated=False)
+        items = list(
+            make_list_resource_iterator(method, page_size=10, prefetch_pages=0)
+        )
+        self.assertListEqual(items, list(range(30)))
+        self.assertListEqual(method.pages, [1, 2, 3, 4])
+
+    def test_page_size_capped_by_service(self):
+        method = _FakeListMethod(total_count=120, max_page_size=20)
+        items = list(make_list_resource_iterator(method, page_size=100))
+        self.assertListEqual(items, list(range(120)))
+        self.assertEqual(len(method.pages), 6)
+
+    def test_stop_early(self):
+        method = _FakeListMethod(total_count=10000)
+        it = make_list_resource_iterator(method, page_size=10, max_workers=4)
+        self.assertEqual(next(it), 0)
+        self.assertEqual(next(x for x in it if x >= 15), 15)
+        it.close()
+        self.assertLess(len(method.pages), 10)
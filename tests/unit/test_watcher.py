@@ -0,0 +1,260 @@
+#  Copyright 2023 Alibaba, Inc. or its affiliates.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest.mock import MagicMock
+
+from pai.api.base import PaginatedResult, PAIRestResourceTypes
+from pai.predictor import Predictor, WaitConfig
+from pai.watcher import Watcher, wait_watch
+from tests.unit import BaseUnitTestCase
+
+
+class _FakeServiceAPI(object):
+    """Services that enter the next status of the sequence on each fetch."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.fetches = {name: 0 for name in statuses}
+        self.get_calls = []
+        self.list_calls = []
+        self._lock = threading.Lock()
+
+    def _fetch(self, name):
+        idx = min(self.fetches[name], len(self.statuses[name]) - 1)
+        self.fetches[name] += 1
+        return {
+            "ServiceName": name,
+            "ServiceId": name,
+            "Status": self.statuses[name][idx],
+            "Reason": "",
+            "Message": "",
+        }
+
+    def get(self, name):
+        with self._lock:
+            self.get_calls.append(name)
+            if name not in self.statuses:
+                raise ValueError(f"Service not found: {name}")
+            return self._fetch(name)
+
+    def list(self, filter=None, page_number=None, page_size=None):
+        with self._lock:
+            self.list_calls.append(page_number)
+            matched = sorted(n for n in self.statuses if not filter or filter in n)
+            names = matched[(page_number - 1) * page_size : page_number * page_size]
+            return PaginatedResult(
+                items=[self._fetch(name) for name in names],
+                total_count=len(matched),
+            )
+
+
+def _make_watcher(service_api, **kwargs):
+    session = MagicMock()
+    session.service_api = service_api
+    kwargs.setdefault("min_interval", 0.01)
+    kwargs.setdefault("max_interval", 0.05)
+    return Watcher(session, **kwargs)
+
+
+def _is_running(obj):
+    return obj["Status"] == "Running"
+
+
+class TestWatcher(BaseUnitTestCase):
+    def test_watch(self):
+        service_api = _FakeServiceAPI({"a": ["Creating", "Creating", "Running"]})
+        watcher = _make_watcher(service_api)
+        changes = []
+
+        future = watcher.watch(
+            PAIRestResourceTypes.Service,
+            "a",
+            is_done=_is_running,
+            on_change=lambda obj: changes.append(obj["Status"]),
+        )
+        self.assertEqual(future.result(timeout=5)["Status"], "Running")
+        self.assertEqual(changes, ["Creating", "Running"])
+        self.assertEqual(service_api.get_calls, ["a", "a", "a"])
+        self.assertEqual(service_api.list_calls, [])
+
+    def test_batch_watch(self):
+        statuses = {
+            "svc-{}".format(i): ["Creating"] * 2 + ["Running"] for i in range(10)
+        }
+        service_api = _FakeServiceAPI(statuses)
+        watcher = _make_watcher(service_api, list_page_size=4)
+        # Register all the watches before the first poll.
+        futures = [
+            watcher.watch(
+                PAIRestResourceTypes.Service, name, is_done=_is_running, delay=0.1
+            )
+            for name in statuses
+        ]
+        for future in futures:
+            self.assertEqual(future.result(timeout=5)["Status"], "Running")
+        # The services are fetched by the list calls rather than one by one.
+        self.assertLess(len(service_api.list_calls) + len(service_api.get_calls), 30)
+        self.assertGreater(len(service_api.list_calls), 0)
+
+    def test_batch_watch_filtered(self):
+        # Many other services in the workspace.
+        statuses = {"other-{:03d}".format(i): ["Running"] for i in range(300)}
+        statuses.update({"svc-a": ["Creating", "Running"], "svc-b": ["Running"]})
+        service_api = _FakeServiceAPI(statuses)
+        watcher = _make_watcher(service_api, list_page_size=100)
+        # Both the services are due in the first poll.
+        with watcher._cond:
+            futures = [
+                watcher.watch(PAIRestResourceTypes.Service, name, is_done=_is_running)
+                for name in ["svc-a", "svc-b"]
+            ]
+        for future in futures:
+            self.assertEqual(future.result(timeout=5)["Status"], "Running")
+        # The list call is filtered by the names of the services.
+        self.assertEqual(service_api.list_calls, [1])
+        self.assertEqual(service_api.get_calls, ["svc-a"])
+
+    def test_batch_watch_calls(self):
+        statuses = {"other-{:03d}".format(i): ["Running"] for i in range(300)}
+        statuses.update({name: ["Running"] for name in ["x", "y", "z"]})
+        service_api = _FakeServiceAPI(statuses)
+        watcher = _make_watcher(service_api, list_page_size=100)
+        watcher._fetch(watcher._get_source(PAIRestResourceTypes.Service), {"x", "y"})
+        # The listed page without the services is not followed by more pages.
+        self.assertEqual(len(service_api.list_calls) + len(service_api.get_calls), 3)
+
+    def test_watch_failed(self):
+        service_api = _FakeServiceAPI({"a": ["Creating", "Failed"]})
+        watcher = _make_watcher(service_api, max_errors=2)
+
+        def is_done(obj):
+            if obj["Status"] == "Failed":
+                raise RuntimeError("Service failed")
+            return _is_running(obj)
+
+        future = watcher.watch(PAIRestResourceTypes.Service, "a", is_done=is_done)
+        with self.assertRaisesRegex(RuntimeError, "Service failed"):
+            future.result(timeout=5)
+
+        future = watcher.watch(PAIRestResourceTypes.Service, "b", is_done=is_done)
+        with self.assertRaisesRegex(ValueError, "Service not found"):
+            future.result(timeout=5)
+        self.assertEqual(service_api.get_calls.count("b"), 2)
+
+    def test_cancelled_watch(self):
+        service_api = _FakeServiceAPI({"a": ["Running"]})
+        watcher = _make_watcher(service_api)
+        checking = threading.Event()
+
+        def is_done(obj):
+            checking.set()
+            # The waiter cancels the watch while the status is being checked.
+            time.sleep(0.05)
+            return _is_running(obj)
+
+        future = watcher.watch(PAIRestResourceTypes.Service, "a", is_done=is_done)
+        checking.wait(5)
+        future.cancel()
+
+        # The watcher thread survives the cancelled watch.
+        service_api.statuses["b"] = ["Running"]
+        service_api.fetches["b"] = 0
+        future = watcher.watch(PAIRestResourceTypes.Service, "b", is_done=_is_running)
+        self.assertEqual(future.result(timeout=5)["Status"], "Running")
+
+    def test_watcher_failed(self):
+        service_api = _FakeServiceAPI({"a": ["Creating", "Running"]})
+        watcher = _make_watcher(service_api)
+        fetch = watcher._fetch
+        watcher._fetch = MagicMock(side_effect=RuntimeError("Unexpected"))
+
+        future = watcher.watch(PAIRestResourceTypes.Service, "a", is_done=_is_running)
+        with self.assertRaisesRegex(RuntimeError, "Unexpected"):
+            future.result(timeout=5)
+
+        # A new polling thread is started for the following watches.
+        watcher._fetch = fetch
+        future = watcher.watch(PAIRestResourceTypes.Service, "a", is_done=_is_running)
+        self.assertEqual(future.result(timeout=5)["Status"], "Running")
+
+    def test_max_interval(self):
+        service_api = _FakeServiceAPI({"a": ["Creating"] * 5 + ["Running"]})
+        watcher = _make_watcher(service_api, max_interval=60, backoff_factor=10)
+        future = watcher.watch(
+            PAIRestResourceTypes.Service,
+            "a",
+            is_done=_is_running,
+            max_interval=0.02,
+        )
+        self.assertEqual(future.result(timeout=5)["Status"], "Running")
+
+    def test_wait_watch(self):
+        future = Future()
+        threading.Timer(0.1, future.set_result, args=("done",)).start()
+        waited = []
+        self.assertEqual(
+            wait_watch(future, on_waiting=waited.append, waiting_interval=0.02),
+            "done",
+        )
+        self.assertGreater(len(waited), 1)
+        self.assertEqual(waited, sorted(waited))
+
+        with self.assertRaises(FutureTimeoutError):
+            wait_watch(Future(), timeout=0.05, waiting_interval=0.02)
+
+    def test_unsupported_resource_type(self):
+        watcher = _make_watcher(_FakeServiceAPI({}))
+        with self.assertRaises(ValueError):
+            watcher.watch(PAIRestResourceTypes.Dataset, "d", is_done=_is_running)
+
+    def test_wait_for_status(self):
+        service_api = _FakeServiceAPI({"a": ["Creating", "Running"]})
+        session = MagicMock()
+        session.watcher = _make_watcher(service_api)
+
+        status = Predictor._wait_for_status(
+            "a", "Running", ["Failed"], interval=0.01, session=session
+        )
+        self.assertEqual(status, "Running")
+
+        service_api = _FakeServiceAPI({"a": ["Creating", "Failed"]})
+        session.watcher = _make_watcher(service_api)
+        with self.assertRaisesRegex(RuntimeError, "terminated unexpectedly"):
+            Predictor._wait_for_status(
+                "a", "Running", ["Failed"], interval=0.01, session=session
+            )
+
+    def test_wait_for_status_timeout(self):
+        service_api = _FakeServiceAPI({"a": ["Creating"]})
+        session = MagicMock()
+        session.watcher = _make_watcher(service_api)
+
+        with self.assertRaisesRegex(RuntimeError, "Waiting for the service timeout"):
+            Predictor._wait_for_status(
+                "a",
+                "Running",
+                ["Failed"],
+                interval=0.01,
+                session=session,
+                wait_config=WaitConfig(interval=0.01, timeout=0.1),
+            )
+        fetches = service_api.fetches["a"]
+        self.assertGreater(fetches, 2)
+        # The cancelled watch is not polled anymore.
+        time.sleep(0.05)
+        self.assertLessEqual(service_api.fetches["a"], fetches + 1)